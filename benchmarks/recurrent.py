@@ -0,0 +1,101 @@
+"""
+Microbenchmark of the per-iteration overhead of a recurrent subgraph.
+
+Runs a loop body of trivial nodes: the start node counts the iterations, the intermediate nodes
+pass the counter through and the last node asks for the next iteration until the counter reaches
+the number of iterations. The time is reported per iteration of the loop.
+
+Usage:
+    python -m benchmarks.recurrent [--nodes 10] [--iterations 50] [--repeat 7] [--number 20]
+"""
+
+import argparse
+import asyncio
+import time
+import typing as t
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import Recurrent
+
+
+class Start(RecurrentProcessor):
+    async def process(self, num: float, additional_data: t.Optional[AdditionalDataT] = None) -> float:  # noqa: ARG002
+        return (additional_data or 0) + 1
+
+
+def _get_pass_process(prev_node: NodeBase) -> t.Callable:
+    async def process(self: ProcessorBase, num: Input(prev_node)) -> float:  # noqa: ARG001
+        return num
+
+    return process
+
+
+def _get_dest_process(prev_node: NodeBase, iterations: int) -> t.Callable:
+    async def process(self: RecurrentProcessor, num: Input(prev_node)) -> t.Union[Recurrent, float]:
+        if num < iterations:
+            return self.next_iteration(num)
+
+        return num
+
+    return process
+
+
+def _build_chart(nodes: int, iterations: int) -> PipelineChart:
+    prev_node: NodeBase = Start
+
+    for idx in range(nodes - 2):
+        prev_node = type(f'PassNode{idx}', (RecurrentProcessor,), {'process': _get_pass_process(prev_node)})
+
+    dest_node = type('Dest', (RecurrentProcessor,), {'process': _get_dest_process(prev_node, iterations)})
+    loop = RecurrentSubGraph(start_node=Start, dest_node=dest_node, max_iterations=iterations)
+
+    async def process(self: ProcessorBase, num: loop) -> float:  # noqa: ARG001
+        return num
+
+    output_node = type('Out', (ProcessorBase,), {'process': process})
+
+    return PipelineChart(model_name='recurrent', entrypoint=build_dag(input_node=Start, output_node=output_node))
+
+
+async def _main(args: argparse.Namespace) -> None:
+    chart = _build_chart(args.nodes, args.iterations)
+
+    result = await chart.run(input_kwargs=dict(num=0.0))
+    assert result.value == args.iterations, result.error
+
+    timings = []
+
+    for _ in range(args.repeat):
+        started_at = time.perf_counter()
+
+        for _ in range(args.number):
+            await chart.run(input_kwargs=dict(num=0.0))
+
+        timings.append(time.perf_counter() - started_at)
+
+    per_iteration = min(timings) / args.number / args.iterations * 1e6
+    print(f'{per_iteration:8.1f} us per iteration of {args.nodes} nodes')  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=10)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    threads_pool_registry.auto_init()
+    asyncio.run(_main(args))
+
+
+if __name__ == '__main__':
+    main()
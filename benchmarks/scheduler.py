@@ -0,0 +1,96 @@
+"""
+Microbenchmark of the scheduler overhead per node.
+
+Runs a chain of trivial nodes that only add one to their input. The nodes are executed by
+the default run manager either as asyncio tasks or inline in the scheduler loop, when they are
+tagged with NodeTag.inline (coroutine nodes) or NodeTag.non_async (sync nodes).
+
+Usage:
+    python -m benchmarks.scheduler [--nodes 100] [--repeat 7] [--number 100]
+"""
+
+import argparse
+import asyncio
+import time
+import typing as t
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import NodeBase
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+def _build_chain(name: str, nodes: int, tags: t.Tuple[NodeTag, ...], is_async: bool) -> PipelineChart:
+    prev_node: NodeBase = Ident
+
+    for idx in range(nodes):
+        process = _get_async_process(prev_node) if is_async else _get_sync_process(prev_node)
+        prev_node = type(f'{name.title()}Node{idx}', (ProcessorBase,), {'process': process, 'tags': tags})
+
+    return PipelineChart(model_name=name, entrypoint=build_dag(input_node=Ident, output_node=prev_node))
+
+
+def _get_async_process(prev_node: NodeBase) -> t.Callable:
+    async def process(self: ProcessorBase, num: Input(prev_node)) -> float:  # noqa: ARG001
+        return num + 1
+
+    return process
+
+
+def _get_sync_process(prev_node: NodeBase) -> t.Callable:
+    def process(self: ProcessorBase, num: Input(prev_node)) -> float:  # noqa: ARG001
+        return num + 1
+
+    return process
+
+
+async def _measure(chart: PipelineChart, nodes: int, repeat: int, number: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+
+        for _ in range(number):
+            await chart.run(input_kwargs=dict(num=0.0))
+
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings) / number / nodes * 1e6
+
+
+async def _main(args: argparse.Namespace) -> None:
+    charts = {
+        'task': _build_chain('task', args.nodes, (), is_async=True),
+        'inline': _build_chain('inline', args.nodes, (NodeTag.inline,), is_async=True),
+        'non_async': _build_chain('non_async', args.nodes, (NodeTag.non_async,), is_async=False),
+    }
+
+    for name, chart in charts.items():
+        result = await chart.run(input_kwargs=dict(num=0.0))
+        assert result.value == args.nodes, result.error
+
+        per_node = await _measure(chart, args.nodes, args.repeat, args.number)
+        print(f'{name:>10}: {per_node:8.1f} us per node')  # noqa: T201
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--number', type=int, default=100)
+    args = parser.parse_args()
+
+    threads_pool_registry.auto_init()
+    asyncio.run(_main(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Microbenchmark of the per-node overhead of the run storage.
+
+Compares the integer-indexed DAGNodeStorage with the former storage built on top of
+UserDict subclasses with hidden keys. The workload repeats what the run manager does with
+a single node: mark it processed, save its result, check the readiness several times, read
+the result and hide the execution for the next recurrent iteration.
+
+Usage:
+    python -m benchmarks.storage [--nodes 100] [--checks 4] [--repeat 7]
+"""
+
+import argparse
+import timeit
+import typing as t
+from collections import UserDict
+
+from ml_pipeline_engine.dag.storage import DAGNodeStorage
+
+
+class LegacyHiddenDict(UserDict):
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._hidden_keys: set = set()
+
+    def get(self, key: t.Any, with_hidden: bool = True) -> t.Any:
+        if with_hidden is False and key in self._hidden_keys:
+            return None
+
+        return super().get(key)
+
+    def exists(self, key: t.Any, with_hidden: bool = True) -> bool:
+        if with_hidden is False and key in self._hidden_keys:
+            return False
+
+        return key in self
+
+    def set(self, key: t.Any, value: t.Any) -> None:
+        if key in self._hidden_keys:
+            self._hidden_keys.remove(key)
+
+        self[key] = value
+
+    def hide(self, key: t.Any) -> None:
+        self._hidden_keys.add(key)
+
+
+class LegacyNodeStorage:
+    def __init__(self) -> None:
+        self.node_results = LegacyHiddenDict()
+        self.processed_nodes = LegacyHiddenDict()
+
+    def set_node_as_processed(self, node_id: str) -> None:
+        self.processed_nodes.set(node_id, 1)
+
+    def set_node_result(self, node_id: str, data: t.Any) -> None:
+        self.node_results.set(node_id, data)
+
+    def exists_node_result(self, node_id: str, with_hidden: bool = False) -> bool:
+        return self.node_results.exists(node_id, with_hidden)
+
+    def get_node_result(self, node_id: str, with_hidden: bool = False) -> t.Any:
+        return self.node_results.get(node_id, with_hidden)
+
+    def hide_last_execution(self, *node_ids: str) -> None:
+        for node_id in node_ids:
+            self.processed_nodes.hide(node_id)
+            self.node_results.hide(node_id)
+
+
+def _run_workload(storage: t.Any, node_ids: t.Sequence[str], checks: int) -> None:
+    for node_id in node_ids:
+        storage.set_node_as_processed(node_id)
+        storage.set_node_result(node_id, node_id)
+
+        for _ in range(checks):
+            storage.exists_node_result(node_id)
+
+        storage.get_node_result(node_id)
+
+    storage.hide_last_execution(*node_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--nodes', type=int, default=100)
+    parser.add_argument('--checks', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    node_ids = tuple(f'processor__benchmarks_storage_Node{idx}' for idx in range(args.nodes))
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+
+    storages = {
+        'legacy': LegacyNodeStorage,
+        'indexed': lambda: DAGNodeStorage(node_ids, node_index),
+    }
+
+    for name, storage_factory in storages.items():
+        timings = timeit.repeat(
+            lambda: _run_workload(storage_factory(), node_ids, args.checks),  # noqa: B023
+            repeat=args.repeat,
+            number=args.number,
+        )
+        per_node = min(timings) / args.number / args.nodes * 1e9
+
+        print(f'{name:>8}: {per_node:8.1f} ns per node')  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
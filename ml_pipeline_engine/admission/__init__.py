@@ -0,0 +1,2 @@
+from ml_pipeline_engine.admission.controller import *  # noqa
+from ml_pipeline_engine.admission.errors import *  # noqa
@@ -0,0 +1,89 @@
+import asyncio
+import contextlib
+import typing as t
+from collections import deque
+
+from ml_pipeline_engine.admission.errors import AdmissionRejectedError
+from ml_pipeline_engine.types import AdmissionControllerLike
+
+__all__ = [
+    'AdmissionController',
+]
+
+
+class AdmissionController(AdmissionControllerLike):
+    """
+    Контроль допуска запусков пайплайна.
+
+    Одновременно исполняется не более max_in_flight запусков. Остальные запуски ожидают в очереди размером
+    не более max_queue_size не дольше queue_timeout секунд. Запуск, не попавший в очередь или не дождавшийся
+    своей очереди, отклоняется с ошибкой AdmissionRejectedError. При max_queue_size=0 лишние запуски
+    отклоняются сразу.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue_size: int = 0, queue_timeout: t.Optional[float] = None) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+
+        self.in_flight = 0
+        self.rejected = 0
+
+        self._waiters: t.Deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @contextlib.asynccontextmanager
+    async def admit(self) -> t.AsyncIterator[None]:
+        """
+        Дождаться допуска запуска и удерживать его слот внутри контекста
+        """
+
+        await self._acquire()
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+
+        if len(self._waiters) >= self.max_queue_size:
+            self.rejected += 1
+            raise AdmissionRejectedError(f'The limit of {self.max_in_flight} runs in flight has been reached')
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+
+        except BaseException as ex:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has been handed over right before the cancellation, so it is passed to the next run
+                self._release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+
+            if isinstance(ex, asyncio.TimeoutError):
+                self.rejected += 1
+                raise AdmissionRejectedError(f'The run has not been admitted in {self.queue_timeout} seconds') from None
+
+            raise
+
+    def _release(self) -> None:
+        # The slot is handed over to the first waiting run, so the number of runs in flight stays the same
+        while self._waiters:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.in_flight -= 1
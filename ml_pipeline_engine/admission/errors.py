@@ -0,0 +1,6 @@
+class AdmissionError(Exception):
+    pass
+
+
+class AdmissionRejectedError(AdmissionError):
+    pass
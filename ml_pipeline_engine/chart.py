@@ -1,15 +1,26 @@
+import asyncio
 import typing as t
 from dataclasses import dataclass
 from dataclasses import field
 
+from ml_pipeline_engine.admission import AdmissionRejectedError
 from ml_pipeline_engine.context import dag as dag_ctx
+from ml_pipeline_engine.context.cancellation import reset_cancellation_token
+from ml_pipeline_engine.context.cancellation import set_cancellation_token
+from ml_pipeline_engine.context.deadline import reset_deadline
+from ml_pipeline_engine.context.deadline import set_deadline
+from ml_pipeline_engine.context.previous_results import PreviousRunResults
 from ml_pipeline_engine.node import generate_pipeline_id
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import AdmissionControllerLike
 from ml_pipeline_engine.types import ArtifactStoreLike
 from ml_pipeline_engine.types import DAGLike
 from ml_pipeline_engine.types import EventManagerLike
 from ml_pipeline_engine.types import ModelName
 from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import PipelineChartLike
+from ml_pipeline_engine.types import PipelineContextLike
 from ml_pipeline_engine.types import PipelineId
 from ml_pipeline_engine.types import PipelineResult
 
@@ -28,6 +39,10 @@ class PipelineChartBase:
     entrypoint: Entrypoint
     artifact_store: t.Optional[t.Type[ArtifactStoreLike]] = None
     event_managers: t.List[t.Type[EventManagerLike]] = field(default_factory=list)
+    # Бюджет времени на запуск в секундах, используется, если при запуске не передан deadline
+    latency_budget: t.Optional[float] = None
+    # Контроль допуска запусков, общий для всех запусков чарта
+    admission_controller: t.Optional[AdmissionControllerLike] = None
 
 
 @dataclass(frozen=True, repr=False)
@@ -41,22 +56,119 @@ class PipelineChart(PipelineChartBase, PipelineChartLike):
         pipeline_id: t.Optional[PipelineId] = None,
         input_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
         meta: t.Optional[t.Dict[str, t.Any]] = None,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+        deadline: t.Optional[float] = None,
     ) -> PipelineResult[NodeResultT]:
+        """
+        Запустить пайплайн.
+        Если переданы узлы outputs, то исполняются только их зависимости, а результатом является
+        словарь "узел -> результат узла".
+
+        Если передан deadline, то пайплайн должен завершиться за deadline секунд. Узел, не успевший завершиться
+        до дедлайна, отменяется и возвращает дефолтное значение при use_default, иначе запуск завершается ошибкой.
+        Оставшееся время доступно узлам через ml_pipeline_engine.context.deadline.get_remaining_time.
+        Узлы с тегом NodeTag.degradable, которые по прошлым запускам не успевают исполниться до дедлайна,
+        не запускаются, а сразу возвращают дефолтное значение.
+        """
+
+        input_kwargs = input_kwargs if input_kwargs is not None else {}
+        pipeline_id = pipeline_id if pipeline_id is not None else generate_pipeline_id()
+
+        ctx = dag_ctx.create_context_from_chart(
+            chart=self,
+            pipeline_id=pipeline_id,
+            input_kwargs=input_kwargs,
+            meta=meta if meta is not None else {},
+            deadline=self._get_deadline(deadline),
+        )
+
+        return await self._run_in_context(ctx, outputs=outputs)
+
+    async def rerun(
+        self,
+        previous_results: t.Union[t.Mapping[NodeId, t.Any], PipelineId],
+        input_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+        pipeline_id: t.Optional[PipelineId] = None,
+        meta: t.Optional[t.Dict[str, t.Any]] = None,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+    ) -> PipelineResult[NodeResultT]:
+        """
+        Повторно запустить пайплайн с новыми входными данными, переиспользуя результаты предыдущего запуска.
+
+        Узел исполняется заново, только если изменился результат хотя бы одной из его зависимостей.
+        Результаты предыдущего запуска передаются словарем "узел -> результат" или идентификатором
+        предыдущего запуска, тогда они загружаются из хранилища артефактов чарта.
+        """
+
         input_kwargs = input_kwargs if input_kwargs is not None else {}
         pipeline_id = pipeline_id if pipeline_id is not None else generate_pipeline_id()
 
+        if not isinstance(previous_results, t.Mapping):
+            previous_results = dag_ctx.create_context_from_chart(
+                chart=self,
+                pipeline_id=previous_results,
+                input_kwargs={},
+            ).artifact_store
+
         ctx = dag_ctx.create_context_from_chart(
             chart=self,
             pipeline_id=pipeline_id,
             input_kwargs=input_kwargs,
             meta=meta if meta is not None else {},
+            previous_results=PreviousRunResults(previous_results),
+            deadline=self._get_deadline(),
         )
 
+        return await self._run_in_context(ctx, outputs=outputs)
+
+    def _get_deadline(self, deadline: t.Optional[float] = None) -> t.Optional[float]:
+        """
+        Получить дедлайн запуска по часам event loop
+        """
+
+        budget = deadline if deadline is not None else self.latency_budget
+
+        if budget is None:
+            return None
+
+        return asyncio.get_running_loop().time() + budget
+
+    async def _run_in_context(
+        self,
+        ctx: PipelineContextLike,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+    ) -> PipelineResult[NodeResultT]:
+        if self.admission_controller is None:
+            return await self._run_admitted(ctx, outputs=outputs)
+
+        try:
+            async with self.admission_controller.admit():
+                return await self._run_admitted(ctx, outputs=outputs)
+
+        except AdmissionRejectedError as ex:
+            return PipelineResult(pipeline_id=ctx.pipeline_id, value=None, error=ex)
+
+    async def _run_admitted(
+        self,
+        ctx: PipelineContextLike,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+    ) -> PipelineResult[NodeResultT]:
+        pipeline_id = ctx.pipeline_id
+        deadline_token = set_deadline(ctx.deadline)
+        cancellation_token = set_cancellation_token(ctx.cancellation_token)
+
         await ctx.emit_on_pipeline_start()
 
         try:
+            if outputs is None:
+                value = await self.entrypoint.run(ctx)
+            else:
+                output_node_ids = [get_node_id(node) for node in outputs]
+                results = await self.entrypoint.with_outputs(output_node_ids).run(ctx)
+                value = {node: results[node_id] for node, node_id in zip(outputs, output_node_ids)}
+
             result = PipelineResult(
-                value=await self.entrypoint.run(ctx),
+                value=value,
                 pipeline_id=pipeline_id,
                 error=None,
             )
@@ -69,3 +181,43 @@ class PipelineChart(PipelineChartBase, PipelineChartLike):
             await ctx.emit_on_pipeline_complete(result=result)
 
             return result
+
+        finally:
+            reset_cancellation_token(cancellation_token)
+            reset_deadline(deadline_token)
+
+    async def run_batch(
+        self,
+        input_kwargs: t.Sequence[t.Dict[str, t.Any]],
+        pipeline_ids: t.Optional[t.Sequence[PipelineId]] = None,
+        meta: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> t.List[PipelineResult[NodeResultT]]:
+        """
+        Запустить пайплайн для пакета входных данных.
+        Граф исполняется один раз на пакет, результат возвращается для каждого элемента пакета отдельно.
+        """
+
+        pipeline_ids = pipeline_ids if pipeline_ids is not None else [generate_pipeline_id() for _ in input_kwargs]
+
+        ctxs = [
+            dag_ctx.create_context_from_chart(
+                chart=self,
+                pipeline_id=pipeline_id,
+                input_kwargs=item_input_kwargs,
+                meta=dict(meta) if meta is not None else {},
+            )
+            for pipeline_id, item_input_kwargs in zip(pipeline_ids, input_kwargs)
+        ]
+
+        for ctx in ctxs:
+            await ctx.emit_on_pipeline_start()
+
+        try:
+            results = await self.entrypoint.run_batch(ctxs)
+        except Exception as ex:
+            results = [PipelineResult(pipeline_id=ctx.pipeline_id, value=None, error=ex) for ctx in ctxs]
+
+        for ctx, result in zip(ctxs, results):
+            await ctx.emit_on_pipeline_complete(result=result)
+
+        return results
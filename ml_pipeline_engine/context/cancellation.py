@@ -0,0 +1,56 @@
+import contextvars
+import threading
+import typing as t
+
+from ml_pipeline_engine.context.errors import RunCancelledError
+from ml_pipeline_engine.types import CancellationTokenLike
+
+# The name of the node's argument to receive the cancellation token
+CANCELLATION_TOKEN_KWARG = 'cancellation_token'
+
+_cancellation_token: contextvars.ContextVar[t.Optional[CancellationTokenLike]] = contextvars.ContextVar(
+    'cancellation_token',
+    default=None,
+)
+
+
+class CancellationToken(CancellationTokenLike):
+    """
+    Токен отмены исполнения.
+
+    Отменяется, когда запуск пайплайна завершился или исполнение узла было отменено. Синхронные узлы, исполняемые
+    в пуле потоков, не могут быть прерваны, поэтому длительные узлы должны сами периодически проверять токен
+    и завершаться, чтобы освободить поток пула. Токен узла считается отмененным и при отмене токена запуска.
+    """
+
+    def __init__(self, parent: t.Optional[CancellationTokenLike] = None) -> None:
+        self.parent = parent
+        self._event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set() or (self.parent is not None and self.parent.is_cancelled)
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self.is_cancelled:
+            raise RunCancelledError('The execution has been cancelled')
+
+
+def set_cancellation_token(token: t.Optional[CancellationTokenLike]) -> contextvars.Token:
+    return _cancellation_token.set(token)
+
+
+def reset_cancellation_token(token: contextvars.Token) -> None:
+    _cancellation_token.reset(token)
+
+
+def get_cancellation_token() -> t.Optional[CancellationTokenLike]:
+    """
+    Получить токен отмены текущего исполнения.
+    Возвращает None, если код исполняется вне запуска пайплайна.
+    """
+
+    return _cancellation_token.get()
@@ -1,6 +1,7 @@
 import typing as t
 
 from ml_pipeline_engine.artifact_store.store.no_op import NoOpArtifactStore
+from ml_pipeline_engine.context.cancellation import CancellationToken
 from ml_pipeline_engine.events import EventSourceMixin
 from ml_pipeline_engine.module_loading import get_instance
 from ml_pipeline_engine.node import generate_pipeline_id
@@ -11,6 +12,8 @@ from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import PipelineChartLike
 from ml_pipeline_engine.types import PipelineContextLike
 from ml_pipeline_engine.types import PipelineId
+from ml_pipeline_engine.types import PipelineRunStats
+from ml_pipeline_engine.types import PreviousResultsLike
 
 
 class DAGPipelineContext(EventSourceMixin, PipelineContextLike):
@@ -24,11 +27,17 @@ class DAGPipelineContext(EventSourceMixin, PipelineContextLike):
         pipeline_id: PipelineId = None,
         input_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
         meta: t.Optional[t.Dict[str, t.Any]] = None,
+        previous_results: t.Optional[PreviousResultsLike] = None,
+        deadline: t.Optional[float] = None,
     ) -> None:
         self.chart = chart
         self.pipeline_id = pipeline_id if pipeline_id is not None else generate_pipeline_id()
         self.input_kwargs = input_kwargs if input_kwargs is not None else {}
         self.meta = meta if meta is not None else {}
+        self.stats = PipelineRunStats()
+        self.previous_results = previous_results
+        self.deadline = deadline
+        self.cancellation_token = CancellationToken()
         self.artifact_store: ArtifactStoreLike = get_instance(
             cls=self.chart.artifact_store or NoOpArtifactStore, ctx=self,
         )
@@ -54,11 +63,18 @@ def create_context_from_chart(
     input_kwargs: t.Dict[str, t.Any],
     pipeline_id: PipelineId = None,
     meta: t.Optional[t.Dict[str, t.Any]] = None,
+    previous_results: t.Optional[PreviousResultsLike] = None,
+    deadline: t.Optional[float] = None,
 ) -> DAGPipelineContext:
     """
     Создать контекст выполнения пайплайна ML-модели
     """
 
     return DAGPipelineContext(
-        pipeline_id=pipeline_id, chart=chart, input_kwargs=input_kwargs, meta=meta,
+        pipeline_id=pipeline_id,
+        chart=chart,
+        input_kwargs=input_kwargs,
+        meta=meta,
+        previous_results=previous_results,
+        deadline=deadline,
     )
@@ -0,0 +1,33 @@
+import asyncio
+import contextvars
+import typing as t
+
+_deadline: contextvars.ContextVar[t.Optional[float]] = contextvars.ContextVar('deadline', default=None)
+
+
+def set_deadline(deadline: t.Optional[float]) -> contextvars.Token:
+    """
+    Установить дедлайн текущего запуска пайплайна по часам event loop
+    """
+
+    return _deadline.set(deadline)
+
+
+def reset_deadline(token: contextvars.Token) -> None:
+    _deadline.reset(token)
+
+
+def get_remaining_time() -> t.Optional[float]:
+    """
+    Получить оставшееся до дедлайна запуска пайплайна время в секундах.
+    Возвращает None, если запуск выполняется без дедлайна.
+
+    Асинхронные узлы могут использовать значение, чтобы ограничить время своих запросов во внешние системы.
+    """
+
+    deadline = _deadline.get()
+
+    if deadline is None:
+        return None
+
+    return max(deadline - asyncio.get_running_loop().time(), 0.0)
@@ -0,0 +1,2 @@
+class RunCancelledError(Exception):
+    pass
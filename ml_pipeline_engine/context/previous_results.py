@@ -0,0 +1,25 @@
+import typing as t
+
+from ml_pipeline_engine.artifact_store.errors import ArtifactDoesNotExist
+from ml_pipeline_engine.types import ArtifactStoreLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PreviousResultsLike
+
+
+class PreviousRunResults(PreviousResultsLike):
+    """
+    Результаты узлов предыдущего запуска пайплайна.
+    Результаты берутся из словаря "узел -> результат" или загружаются из хранилища артефактов.
+    """
+
+    def __init__(self, source: t.Union[t.Mapping[NodeId, t.Any], ArtifactStoreLike]) -> None:
+        self.source = source
+
+    async def get(self, node_id: NodeId, default: t.Any = None) -> t.Any:
+        if isinstance(self.source, t.Mapping):
+            return self.source.get(node_id, default)
+
+        try:
+            return await self.source.load(node_id)
+        except ArtifactDoesNotExist:
+            return default
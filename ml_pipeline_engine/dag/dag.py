@@ -1,21 +1,55 @@
+import functools
 import pathlib
 import typing as t
+import uuid
+from collections import Counter
+from collections import defaultdict
 from dataclasses import dataclass
+from dataclasses import field
 
+import networkx as nx
+from cachetools import LRUCache
+
+from ml_pipeline_engine.dag.enums import EdgeField
+from ml_pipeline_engine.dag.enums import SchedulingPolicy
 from ml_pipeline_engine.dag.graph import DiGraph
+from ml_pipeline_engine.dag.latency import LatencyProfile
+from ml_pipeline_engine.dag.manager import DAGBatchRunManager
 from ml_pipeline_engine.dag.manager import DAGRunConcurrentManager
+from ml_pipeline_engine.dag.plan import DAGPlan
+from ml_pipeline_engine.dag.plan import compile_dag_plan
+from ml_pipeline_engine.dag.scheduling import get_critical_path_lengths
+from ml_pipeline_engine.dag.scheduling import get_priority_order
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import NodeType
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
 from ml_pipeline_engine.node.retrying import NodeRetryPolicy
 from ml_pipeline_engine.parallelism import process_pool_registry
 from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import CaseLabel
 from ml_pipeline_engine.types import DAGLike
 from ml_pipeline_engine.types import DAGRunManagerLike
 from ml_pipeline_engine.types import NodeBase
 from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import NodeResultT
 from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
 from ml_pipeline_engine.types import RetryPolicyLike
 
 
+class OutputsNode(ProcessorBase):
+    """
+    Synthetic output node of a pruned DAG that collects the results of the requested nodes
+    """
+
+    node_type = NodeType.outputs.value
+    tags = (NodeTag.non_async, NodeTag.skip_store)
+
+    def process(self, **kwargs: t.Any) -> t.Dict[NodeId, t.Any]:
+        return kwargs
+
+
 @dataclass()
 class DAG(DAGLike):
     graph: DiGraph
@@ -26,6 +60,115 @@ class DAG(DAGLike):
     node_map: t.Dict[NodeId, NodeBase]
     retry_policy: t.Type[RetryPolicyLike] = NodeRetryPolicy
     run_manager: t.Type[DAGRunManagerLike] = DAGRunConcurrentManager
+    fuse_chains: bool = False
+    scheduling: SchedulingPolicy = SchedulingPolicy.topological
+    # The critical paths are recalculated when the latency profile has got that many new samples
+    priorities_refresh_samples: int = 1000
+    outputs_cache_size: int = 128
+    plan: DAGPlan = field(init=False)
+    # Shared by all runs, the frequencies of selected switch branches are used to pick the branches to speculate
+    branch_counts: t.Dict[NodeId, t.Counter[CaseLabel]] = field(
+        init=False,
+        default_factory=functools.partial(defaultdict, Counter),
+    )
+    latency_profile: LatencyProfile = field(init=False, default_factory=LatencyProfile)
+    _outputs_dags: LRUCache = field(init=False, repr=False)
+    _node_priorities: t.Dict[NodeId, float] = field(init=False, repr=False, default_factory=dict)
+    _priorities_n_samples: t.Optional[int] = field(init=False, repr=False, default=None)
+    _priority_orders: t.Dict[DiGraph, t.Tuple[NodeId, ...]] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # The graph is shared by all runs of the DAG, so the run state is kept by run managers only
+        nx.freeze(self.graph)
+        self.plan = compile_dag_plan(
+            self.graph,
+            self.input_node,
+            self.output_node,
+            self.node_map,
+            fuse_chains=self.fuse_chains,
+        )
+        self._outputs_dags = LRUCache(maxsize=self.outputs_cache_size)
+
+    def get_node_order(self, subgraph: DiGraph) -> t.Tuple[NodeId, ...]:
+        """
+        Get the order to launch the nodes of the subgraph according to the scheduling policy.
+
+        With the critical path policy, the ready nodes with the longest remaining path to the end of the graph
+        are launched first. The path length is the sum of the median latencies of the nodes measured in
+        the previous runs, the cost hints of the nodes are used until there are enough measurements.
+        """
+
+        if self.scheduling == SchedulingPolicy.topological:
+            return subgraph.topological_order
+
+        if (
+            self._priorities_n_samples is None
+            or self.latency_profile.n_samples - self._priorities_n_samples >= self.priorities_refresh_samples
+        ):
+            self._refresh_node_priorities()
+
+        order = self._priority_orders.get(subgraph)
+
+        if order is None:
+            order = self._priority_orders[subgraph] = get_priority_order(subgraph, self._node_priorities)
+
+        return order
+
+    def _refresh_node_priorities(self) -> None:
+        costs = {}
+
+        for node_id, node in self.node_map.items():
+            latency = self.latency_profile.get_quantile(node_id, 0.5)
+            costs[node_id] = latency if latency is not None else node.cost or 0.0
+
+        self._node_priorities = get_critical_path_lengths(self.plan, costs)
+        self._priorities_n_samples = self.latency_profile.n_samples
+        self._priority_orders.clear()
+
+    def with_outputs(self, output_nodes: t.Sequence[NodeId]) -> 'DAG':
+        """
+        Get the DAG that computes only the ancestors of the requested nodes.
+        The DAG returns the mapping "node id -> result", its plan is compiled once per set of nodes.
+        """
+
+        key = frozenset(output_nodes)
+        outputs_dag = self._outputs_dags.get(key)
+
+        if outputs_dag is None:
+            outputs_dag = self._outputs_dags[key] = self._build_outputs_dag(key)
+
+        return outputs_dag
+
+    def _build_outputs_dag(self, output_nodes: t.FrozenSet[NodeId]) -> 'DAG':
+        node_ids = {self.input_node}
+        for node_id in output_nodes:
+            node_ids |= nx.ancestors(self.graph, node_id) | {node_id}
+
+        outputs_node = type(OutputsNode.__name__, (OutputsNode,), {'name': uuid.uuid4().hex[-8:]})
+        outputs_node_id = get_node_id(outputs_node)
+
+        graph = DiGraph(name=f'{self.graph.name}, outputs={sorted(output_nodes)}')
+        graph.add_nodes_from(self.graph.subgraph(node_ids).nodes(data=True))
+        graph.add_edges_from(self.graph.subgraph(node_ids).edges(data=True))
+        graph.add_edges_from(
+            (node_id, outputs_node_id, {EdgeField.kwarg_name: node_id}) for node_id in sorted(output_nodes)
+        )
+
+        node_map = {node_id: node for node_id, node in self.node_map.items() if node_id in graph}
+        node_map[outputs_node_id] = outputs_node
+
+        return DAG(
+            graph=graph,
+            input_node=self.input_node,
+            output_node=outputs_node_id,
+            is_process_pool_needed=self.is_process_pool_needed,
+            is_thread_pool_needed=self.is_thread_pool_needed,
+            node_map=node_map,
+            retry_policy=self.retry_policy,
+            run_manager=self.run_manager,
+            fuse_chains=self.fuse_chains,
+            scheduling=self.scheduling,
+        )
 
     def _start_runtime_validation(self) -> None:
         self._validate_pool_executors()
@@ -43,6 +186,11 @@ class DAG(DAGLike):
         run_manager = self.run_manager(dag=self, ctx=ctx)
         return await run_manager.run()
 
+    async def run_batch(self, ctxs: t.Sequence[PipelineContextLike]) -> t.List[PipelineResult[NodeResultT]]:
+        self._start_runtime_validation()
+
+        return await DAGBatchRunManager(ctxs=ctxs, dag=self).run()
+
     def visualize(  # type: ignore
         self,
         name: str,
@@ -9,9 +9,28 @@ class NodeField(str, Enum):
     start_node = 'start_node'
     max_iterations = 'max_iterations'
     additional_data = 'additional_data'
+    speculation_min_probability = 'speculation_min_probability'
+    oneof_strategy = 'oneof_strategy'
+    hedge_after = 'hedge_after'
 
 
 class EdgeField(str, Enum):
     kwarg_name = 'kwarg_name'
     is_switch = 'is_switch'
     case_branch = 'case_branch'
+
+
+class OneOfStrategy(str, Enum):
+    # Alternatives are executed one by one, the next one starts when the previous one has failed
+    sequential = 'sequential'
+    # The next alternative also starts when the running one is slower than the hedging delay
+    hedged = 'hedged'
+    # All alternatives start at once, the result waits only for the higher-priority alternatives still running
+    race = 'race'
+
+
+class SchedulingPolicy(str, Enum):
+    # Nodes are launched in the topological order
+    topological = 'topological'
+    # Among the ready nodes, the ones with the longest remaining critical path are launched first
+    critical_path = 'critical_path'
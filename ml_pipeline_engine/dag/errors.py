@@ -8,3 +8,15 @@ class OneOfDoesNotHaveResultError(BaseDagError):
 
 class RecurrentSubgraphDoesNotHaveResultError(BaseDagError):
     pass
+
+
+class SubgraphIsNotCompiledError(BaseDagError):
+    pass
+
+
+class BatchResultSizeError(BaseDagError):
+    pass
+
+
+class OneOfAlternativeCancelledError(BaseDagError):
+    pass
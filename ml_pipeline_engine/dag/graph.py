@@ -23,6 +23,8 @@ class DiGraph(nx.DiGraph):
 
         self.source = None
         self.dest = None
+        self.topological_order: t.Optional[t.Tuple[NodeId, ...]] = None
+        self.node_indexes: t.Optional[t.FrozenSet[int]] = None
 
         self.__hash_value = None
 
@@ -48,7 +50,14 @@ def get_connected_subgraph(
     if len(dag) == 1:
         return t.cast(DiGraph, dag)
 
-    subgraph: DiGraph = dag.subgraph({node_id for path in nx.all_simple_paths(dag, source, dest) for node_id in path})
+    # In a DAG the nodes of all simple paths between two nodes are exactly the common part
+    # of the source's descendants and the destination's ancestors
+    if source == dest or nx.has_path(dag, source, dest):
+        nodes = (nx.descendants(dag, source) | {source}) & (nx.ancestors(dag, dest) | {dest})
+    else:
+        nodes = set()
+
+    subgraph: DiGraph = dag.subgraph(nodes)
 
     subgraph.is_recurrent = is_recurrent
     subgraph.is_oneof = is_oneof
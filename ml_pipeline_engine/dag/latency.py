@@ -0,0 +1,39 @@
+import typing as t
+from collections import defaultdict
+from collections import deque
+
+from ml_pipeline_engine.types import LatencyProfileLike
+from ml_pipeline_engine.types import NodeId
+
+
+class LatencyProfile(LatencyProfileLike):
+    """
+    Sliding windows of the latencies measured in the previous runs of a DAG
+    """
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20) -> None:
+        self.window_size = window_size
+        self.min_samples = min_samples
+
+        # The total number of the added samples, it lets the consumers know when the profile has changed enough
+        self.n_samples = 0
+        self._samples: t.DefaultDict[NodeId, t.Deque[float]] = defaultdict(
+            lambda: deque(maxlen=self.window_size),
+        )
+
+    def add(self, node_id: NodeId, latency: float) -> None:
+        self._samples[node_id].append(latency)
+        self.n_samples += 1
+
+    def get_quantile(self, node_id: NodeId, quantile: float) -> t.Optional[float]:
+        """
+        Get the latency quantile or None if there are not enough samples yet
+        """
+
+        samples = self._samples.get(node_id)
+
+        if samples is None or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        return ordered[min(int(quantile * len(ordered)), len(ordered) - 1)]
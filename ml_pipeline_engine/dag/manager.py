@@ -1,40 +1,74 @@
 import asyncio
+import contextvars
 import functools
 import typing as t
 from collections import defaultdict
+from contextlib import asynccontextmanager
 from contextlib import suppress
 from dataclasses import dataclass
 from dataclasses import field
 
-import networkx as nx
 from cachetools import cachedmethod
 from cachetools.keys import hashkey
 
-from ml_pipeline_engine.dag.enums import EdgeField
+from ml_pipeline_engine.context.cancellation import CANCELLATION_TOKEN_KWARG
 from ml_pipeline_engine.dag.enums import NodeField
+from ml_pipeline_engine.dag.enums import OneOfStrategy
+from ml_pipeline_engine.dag.enums import SchedulingPolicy
+from ml_pipeline_engine.dag.errors import BatchResultSizeError
+from ml_pipeline_engine.dag.errors import OneOfAlternativeCancelledError
 from ml_pipeline_engine.dag.errors import OneOfDoesNotHaveResultError
 from ml_pipeline_engine.dag.errors import RecurrentSubgraphDoesNotHaveResultError
 from ml_pipeline_engine.dag.graph import DiGraph
-from ml_pipeline_engine.dag.graph import get_connected_subgraph
+from ml_pipeline_engine.dag.plan import RecurrentLoop
+from ml_pipeline_engine.dag.plan import SpeculativeBranch
 from ml_pipeline_engine.dag.storage import DAGNodeStorage
 from ml_pipeline_engine.logs import logger_manager as logger
 from ml_pipeline_engine.logs import logger_manager_lock as lock_logger
 from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import accepts_cancellation_token
+from ml_pipeline_engine.node import get_callable_batch_method
+from ml_pipeline_engine.node import get_callable_run_method
+from ml_pipeline_engine.node import get_concurrency_limiter
+from ml_pipeline_engine.node import is_pure_node
 from ml_pipeline_engine.node import run_node
+from ml_pipeline_engine.node import run_node_batch
 from ml_pipeline_engine.node import run_node_default
-from ml_pipeline_engine.node.retrying import NodeRetryPolicy
+from ml_pipeline_engine.node.enums import CircuitState
+from ml_pipeline_engine.node.errors import CircuitOpenError
+from ml_pipeline_engine.node.errors import NodeTimeoutError
+from ml_pipeline_engine.node.retrying import get_circuit_breaker
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import CaseLabel
 from ml_pipeline_engine.types import CaseResult
 from ml_pipeline_engine.types import DAGLike
 from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeBase
 from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import NodeResultT
 from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
 from ml_pipeline_engine.types import Recurrent
+from ml_pipeline_engine.types import RetryPolicyLike
 
 _EventDictT = t.Dict[t.Any, asyncio.Event]
 _ConditionT = t.Dict[t.Any, asyncio.Condition]
 
 
+@dataclass
+class _SyncNodeRecord:
+    """
+    Outcome of a sync node executed outside the event loop
+    """
+
+    node_id: NodeId
+    result: t.Any = None
+    error: t.Optional[Exception] = None
+    retry_errors: t.List[Exception] = field(default_factory=list)
+    # The node's events have been emitted while the node was executed, so they are not emitted on the commit
+    is_emitted: bool = False
+
+
 @dataclass
 class DAGConcurrentManagerLock:
     node_ids: t.Iterable[NodeId]
@@ -80,6 +114,80 @@ class DAGConcurrentManagerLock:
             condition.notify_all()
 
 
+_MISSING = object()
+
+
+def _is_equal(result: t.Any, previous_result: t.Any) -> bool:
+    """
+    Compare the results of a node, the results that cannot be compared are treated as changed
+    """
+
+    try:
+        return bool(result == previous_result)
+    except Exception:
+        return False
+
+
+async def _wait_for_node(coro: t.Awaitable, node_id: NodeId, timeout: t.Optional[float]) -> t.Any:
+    """
+    Wait for the node's coroutine and cancel it when the timeout expires.
+    A thread pool node cannot be interrupted, so only waiting for its result is cancelled.
+    """
+
+    if timeout is None:
+        return await coro
+
+    try:
+        return await asyncio.wait_for(coro, timeout=max(timeout, 0))
+    except asyncio.TimeoutError:
+        raise NodeTimeoutError(node_id, timeout) from None
+
+
+@asynccontextmanager
+async def _guard_circuit(
+    node: NodeBase,
+    node_id: NodeId,
+    ctxs: t.Sequence[PipelineContextLike],
+) -> t.AsyncIterator[None]:
+    """
+    Pass the node's attempt through its circuit breaker, if it has one, and record the outcome.
+    The state changes are emitted to the runs whose attempt has caused them.
+    """
+
+    breaker = get_circuit_breaker(node)
+
+    if breaker is None:
+        yield
+        return
+
+    await _emit_circuit_state_change(ctxs, node_id, breaker.acquire())
+
+    try:
+        yield
+    except Exception:
+        await _emit_circuit_state_change(ctxs, node_id, breaker.record(success=False))
+        raise
+    except BaseException:
+        breaker.release()
+        raise
+
+    await _emit_circuit_state_change(ctxs, node_id, breaker.record(success=True))
+
+
+async def _emit_circuit_state_change(
+    ctxs: t.Sequence[PipelineContextLike],
+    node_id: NodeId,
+    state: t.Optional[CircuitState],
+) -> None:
+    if state is None:
+        return
+
+    logger.warning('The circuit breaker of the node %s has changed its state to %s', node_id, state.value)
+
+    for ctx in ctxs:
+        await ctx.emit_on_circuit_state_change(node_id=node_id, state=state)
+
+
 def cache_key(prefix: str, _: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Type[tuple]:
     """Custom func key generation excluding 'self'."""
     return hashkey(*args, prefix, **kwargs)
@@ -95,14 +203,23 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
     ctx: PipelineContextLike
     dag: DAGLike
 
-    _node_storage: DAGNodeStorage = field(default_factory=DAGNodeStorage)
+    _node_storage: DAGNodeStorage = field(init=False)
     _lock_manager: DAGConcurrentManagerLock = field(init=False)
     _memorization_store: t.Dict[t.Any, t.Any] = field(default_factory=dict)
     _coro_tasks: t.Set[asyncio.Task] = field(default_factory=set)
+    _unchanged_nodes: t.Set[NodeId] = field(default_factory=set)
+    _comparable_nodes: t.Set[NodeId] = field(default_factory=set)
+    _result_comparisons: t.Dict[NodeId, asyncio.Task] = field(default_factory=dict)
+    _pure_node_runs: t.Dict[NodeId, t.Tuple[t.Dict[str, t.Any], t.Any]] = field(default_factory=dict)
+    _speculations: t.Dict[t.Tuple[NodeId, CaseLabel], asyncio.Task] = field(default_factory=dict)
+    _cancelled_nodes: t.Set[NodeId] = field(default_factory=set)
+    _pending_speculations: t.List[t.Tuple[NodeId, SpeculativeBranch]] = field(init=False)
     _alias_run_method: str = 'run'
 
     def __post_init__(self) -> None:
         self._lock_manager = DAGConcurrentManagerLock(self.dag.node_map.keys())
+        self._node_storage = DAGNodeStorage(self.dag.plan.node_ids, self.dag.plan.node_index)
+        self._pending_speculations = self._get_speculative_branches()
 
     @staticmethod
     def _stop_coro_tasks(*coro_tasks: asyncio.Task) -> None:
@@ -124,7 +241,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         """
 
         for coro_task in coro_tasks:
-            if coro_task.done() and isinstance(coro_task.exception(), BaseException):
+            if coro_task.done() and not coro_task.cancelled() and isinstance(coro_task.exception(), BaseException):
                 return coro_task.exception()
 
         return None
@@ -135,10 +252,19 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         """
 
         task = asyncio.create_task(coro, name=name)
+        task.add_done_callback(self._discard_finished_task)
         self._coro_tasks.add(task)
 
         return task
 
+    def _discard_finished_task(self, task: asyncio.Task) -> None:
+        """
+        Forget the finished task. The failed one is kept to report its error.
+        """
+
+        if task.cancelled() or task.exception() is None:
+            self._coro_tasks.discard(task)
+
     async def run(self) -> NodeResultT:
         """
         Run the main DAG
@@ -152,20 +278,38 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                 self._alias_run_method,
             )
 
-            await self._lock_manager.wait_for_condition(
-                self._alias_run_method,
-                lambda: (
-                    bool(self._get_first_error_in_tasks(self._coro_tasks))
-                    or self._node_storage.exists_node_result(self.dag.output_node)
-                ),
-            )
+            await self._wait_for_run_result()
 
             return self._get_dag_result()
         except Exception as ex:
             logger.error('DAG run raised error', exc_info=ex)
             raise
         finally:
-            self._stop_coro_tasks(*self._coro_tasks)
+            self._stop_coro_tasks(*self._coro_tasks, *self._speculations.values())
+            self.ctx.cancellation_token.cancel()
+
+    async def _wait_for_run_result(self) -> None:
+        """
+        Wait until the main DAG gets the result or any task fails
+        """
+
+        await self._lock_manager.wait_for_condition(
+            self._alias_run_method,
+            lambda: (
+                bool(self._get_first_error_in_tasks(self._coro_tasks))
+                or self._node_storage.exists_node_result(self.dag.output_node)
+            ),
+        )
+
+    async def _wait_for_node_result(self, node_id: NodeId) -> None:
+        """
+        Wait until the node gets a result
+        """
+
+        await self._lock_manager.wait_for_condition(
+            node_id,
+            functools.partial(self._node_storage.exists_node_result, node_id),
+        )
 
     def _get_dag_result(self) -> NodeResultT:
         """
@@ -188,12 +332,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         kwargs = {}
 
         if node_id != self.dag.input_node:
-            for pred_node_id in self.dag.graph.predecessors(node_id):
-                kwarg_name = self.dag.graph.edges[(pred_node_id, node_id)].get(EdgeField.kwarg_name)
-
-                if kwarg_name is None:
-                    continue
-
+            for kwarg_name, pred_node_id in self.dag.plan.get_kwarg_bindings(node_id):
                 if self._is_switch(pred_node_id):
                     kwargs[kwarg_name] = self._node_storage.get_node_result(
                         self._node_storage.get_switch_result(pred_node_id).node_id,
@@ -207,9 +346,10 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                     )
 
         else:
-            kwargs = self.ctx.input_kwargs
+            # The input kwargs belong to the caller, so they are copied before the additional data is added
+            kwargs = dict(self.ctx.input_kwargs)
 
-        additional_data = self.dag.graph.nodes[node_id].get(NodeField.additional_data)
+        additional_data = self._node_storage.get_additional_data(node_id)
 
         if additional_data is not None:
             kwargs[NodeField.additional_data] = additional_data
@@ -220,17 +360,13 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         """
         Checks if the node is a switch
         """
-
-        try:
-            return self.dag.graph.nodes[node_id].get(NodeField.is_switch) is True
-        except KeyError:
-            return False
+        return self.dag.plan.is_switch(node_id)
 
     def _is_head_of_oneof(self, node_id: NodeId) -> bool:
         """
         Checks if the node is the head of OneOf
         """
-        return bool(self.dag.graph.nodes[node_id].get(NodeField.is_oneof_head))
+        return self.dag.plan.is_head_of_oneof(node_id)
 
     def _is_skipped_for_storage(self, node_id: NodeId) -> bool:
         """
@@ -249,33 +385,10 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         is_nested_oneof: bool = False,
     ) -> DiGraph:
         """
-        Get filtered and connected subgraph
+        Get filtered and connected subgraph from the precompiled plan
         """
 
-        def _filter(u: str, v: str) -> bool:
-            """
-            Delete edges with EdgeField.case_branch from subgraph_view
-
-            Args:
-                u - Node
-                v - Node Edge
-            """
-            return not self.dag.graph.edges[u, v].get(EdgeField.case_branch)
-
-        def _filter_node(u: str) -> bool:
-            """
-            Delete nodes with NodeField.is_oneof_child from subgraph_view
-
-            Args:
-                u -  Node
-            """
-            return not self.dag.graph.nodes[u].get(NodeField.is_oneof_child)
-
-        if is_oneof:
-            self.dag.graph.nodes[dest][NodeField.is_oneof_child] = False
-
-        return get_connected_subgraph(
-            dag=nx.subgraph_view(self.dag.graph, filter_edge=_filter, filter_node=_filter_node),
+        return self.dag.plan.get_subgraph(
             source=source,
             dest=dest,
             is_recurrent=is_recurrent,
@@ -288,16 +401,8 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Save the switch branch
         """
 
-        selected_branch_label = None
-        branch_nodes = {}
-        for pred_id in self.dag.graph.predecessors(switch_node_id):
-            edge = self.dag.graph.edges[(pred_id, switch_node_id)]
-
-            if edge.get(EdgeField.is_switch):
-                selected_branch_label = self._node_storage.get_node_result(pred_id)
-                continue
-
-            branch_nodes[edge.get(EdgeField.case_branch)] = pred_id
+        decision_node_id, branch_nodes = self.dag.plan.get_switch_cases(switch_node_id)
+        selected_branch_label = self._node_storage.get_node_result(decision_node_id)
 
         self._node_storage.set_switch_result(
             switch_node_id,
@@ -317,25 +422,50 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         if self._node_storage.exists_processed_node(node_id):
             logger.debug('Node %s has been executed. Stop new execution', node_id)
 
-            await self._lock_manager.wait_for_condition(
-                node_id,
-                functools.partial(self._node_storage.exists_node_result, node_id),
-            )
+            await self._wait_for_node_result(node_id)
             self._node_storage.set_node_skipped_for_store(node_id)
 
             return self._node_storage.get_node_result(node_id)
 
         self._node_storage.set_node_as_processed(node_id)
+
+        is_reusable = self._is_reusable(node_id) and not force_default
+
+        # The previous result is loaded only if it can be reused, the inputs are compared first
+        if is_reusable and await self._has_unchanged_kwargs(node_id):
+            previous_result = await self.ctx.previous_results.get(node_id, _MISSING)
+
+            if previous_result is not _MISSING:
+                logger.debug('Reuse the result of the previous run, node_id=%s', node_id)
+
+                self._unchanged_nodes.add(node_id)
+                self.ctx.stats.reused_nodes += 1
+
+                return previous_result
+
+            is_reusable = False
+
+        if not force_default and self._is_degraded(node_id):
+            logger.debug('Node %s is not expected to finish before the deadline, use the default', node_id)
+
+            force_default = True
+            self.ctx.stats.degraded_nodes += 1
+
+        kwargs = self._get_node_kwargs(node_id)
+        is_pure = not force_default and self._is_pure_recurrent_node(node_id)
+
+        if is_pure and (pure_result := self._get_pure_node_result(dag, node_id, kwargs)) is not _MISSING:
+            return pure_result
+
         await self.ctx.emit_on_node_start(node_id=node_id)
 
         try:
             logger.info('Preparing node for the execution, node_id=%s', node_id)
 
-            result = await self.__execute_node(
-                node_id=node_id,
-                force_default=force_default,
-                **self._get_node_kwargs(node_id),
-            )
+            result = await self.__execute_node(node_id=node_id, force_default=force_default, **kwargs)
+
+            if is_reusable and not force_default:
+                self._comparable_nodes.add(node_id)
 
             await self.ctx.emit_on_node_complete(node_id=node_id, error=None)
 
@@ -351,10 +481,99 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
             raise ex
 
+    def _is_reusable(self, node_id: NodeId) -> bool:
+        """
+        Check if the node's result can be taken from the previous run.
+        Nodes of recurrent subgraphs are executed several times per run, so they are always executed.
+        """
+
+        return self.ctx.previous_results is not None and node_id not in self.dag.plan.recurrent_nodes
+
+    def _is_pure_recurrent_node(self, node_id: NodeId) -> bool:
+        """
+        Check if the node can be skipped on the next iterations of its recurrent subgraph while its inputs repeat
+        """
+
+        return node_id in self.dag.plan.recurrent_nodes and is_pure_node(self.dag.node_map[node_id])
+
+    def _get_pure_node_result(self, dag: DiGraph, node_id: NodeId, kwargs: t.Dict[str, t.Any]) -> t.Any:
+        """
+        Get the result of the pure node from the previous iteration if the node's inputs have not changed since then.
+        The reused node is not executed, so it emits neither on_node_start nor on_node_complete.
+        """
+
+        if not dag.is_recurrent or node_id not in self._pure_node_runs:
+            return _MISSING
+
+        previous_kwargs, previous_result = self._pure_node_runs[node_id]
+
+        if not _is_equal(kwargs, previous_kwargs):
+            return _MISSING
+
+        logger.debug('The inputs of the pure node have not changed since the previous iteration, node_id=%s', node_id)
+        self.ctx.stats.recurrent_skips[dag.dest][-1] += 1
+
+        return previous_result
+
+    async def _has_unchanged_kwargs(self, node_id: NodeId) -> bool:
+        """
+        Check if all dependencies of the node have the same results as in the previous run.
+        The results of the executed dependencies are compared only if the rest of the dependencies are unchanged.
+        """
+
+        if node_id == self.dag.input_node:
+            return False
+
+        result_node_ids = [
+            self._node_storage.get_switch_result(pred_node_id).node_id
+            if self._is_switch(pred_node_id)
+            else pred_node_id
+            for _, pred_node_id in self.dag.plan.get_kwarg_bindings(node_id)
+        ]
+
+        if not all(
+            result_node_id in self._unchanged_nodes or result_node_id in self._comparable_nodes
+            for result_node_id in result_node_ids
+        ):
+            return False
+
+        for result_node_id in result_node_ids:
+            if not await self._has_unchanged_result(result_node_id):
+                return False
+
+        return True
+
+    async def _has_unchanged_result(self, node_id: NodeId) -> bool:
+        """
+        Check if the node has got the same result as in the previous run.
+        The result of the executed node is compared with the previous one once (early cut-off),
+        the concurrent checks wait for the same comparison.
+        """
+
+        if node_id not in self._comparable_nodes:
+            return node_id in self._unchanged_nodes
+
+        comparison = self._result_comparisons.get(node_id)
+
+        if comparison is None:
+            comparison = self._result_comparisons[node_id] = self._create_task(
+                self._compare_with_previous_result(node_id),
+                name=f'compare-{node_id}',
+            )
+
+        return await asyncio.shield(comparison)
+
+    async def _compare_with_previous_result(self, node_id: NodeId) -> bool:
+        previous_result = await self.ctx.previous_results.get(node_id, _MISSING)
+        result = self._node_storage.get_node_result(node_id)
+
+        return previous_result is not _MISSING and _is_equal(result, previous_result)
+
     async def __execute_node(
         self,
         node_id: NodeId,
         force_default: bool = False,
+        retry_errors: t.Optional[t.List[Exception]] = None,
         **kwargs: t.Any,
     ) -> t.Union[NodeResultT, t.Any]:
         """
@@ -363,12 +582,16 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Args:
             node_id: Node id
             force_default: If the node should return default result
+            retry_errors: If passed, the errors of the failed attempts are collected instead of being emitted
             **kwargs: Key value args for the node
         """
 
         node = self.dag.node_map[node_id]
 
-        retry_policy = NodeRetryPolicy(node=node)
+        retry_policy = self.dag.retry_policy(node=node)
+
+        if not force_default:
+            retry_policy.record_call()
 
         n_attempts = 1
         while True:
@@ -377,29 +600,198 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                     return run_node_default(node, **kwargs)
 
                 logger.debug('Start execution node_id=%s', node_id)
-                result = await run_node(**kwargs, node=node, node_id=node_id)
+
+                async with _guard_circuit(node, node_id, [self.ctx]):
+                    if node.max_concurrency is None:
+                        result = await self._run_node_attempt(node_id, retry_policy, **kwargs)
+                    else:
+                        async with get_concurrency_limiter(node).acquire() as queue_wait:
+                            self.ctx.stats.queue_wait += queue_wait
+                            await self.ctx.emit_on_node_dequeue(node_id=node_id, queue_wait=queue_wait)
+
+                            result = await self._run_node_attempt(node_id, retry_policy, **kwargs)
 
                 logger.debug('Finish the node execution, node_id=%s', node_id)
                 return result
 
-            except retry_policy.exceptions as error:  # noqa: PERF203
-                logger.debug(
-                    'Node %s will be restarted in %s seconds...',
-                    node_id,
-                    retry_policy.delay,
-                    exc_info=error,
-                )
-
-                if n_attempts == retry_policy.attempts:
+            except (*retry_policy.exceptions, NodeTimeoutError) as error:  # noqa: PERF203
+                if self._is_last_attempt(retry_policy, n_attempts, error):
                     if node.use_default:
                         return run_node_default(node, **kwargs)
 
                     raise error
 
-                await self.ctx.emit_on_node_complete(node_id=node_id, error=error)
+                delay = retry_policy.get_delay(n_attempts)
+                logger.debug('Node %s will be restarted in %s seconds...', node_id, delay, exc_info=error)
+
+                if retry_errors is None:
+                    await self.ctx.emit_on_node_complete(node_id=node_id, error=error)
+                else:
+                    retry_errors.append(error)
+
+                n_attempts += 1
+                await asyncio.sleep(delay)
+
+            except Exception:
+                if node.use_default:
+                    return run_node_default(node, **kwargs)
+
+                raise
+
+    async def _run_node_attempt(self, node_id: NodeId, retry_policy: RetryPolicyLike, **kwargs: t.Any) -> t.Any:
+        """
+        Run a single attempt of the node limited by its timeout and collect its latency if needed.
+        The result of the pure node is kept for the next iterations only if the attempt has succeeded.
+        """
+
+        node = self.dag.node_map[node_id]
+        started_at = asyncio.get_running_loop().time()
+
+        result = await _wait_for_node(
+            run_node(**kwargs, node=node, node_id=node_id),
+            node_id=node_id,
+            timeout=self._get_node_timeout(retry_policy),
+        )
+
+        if self.dag.scheduling == SchedulingPolicy.critical_path or NodeTag.degradable in (node.tags or ()):
+            self.dag.latency_profile.add(node_id, asyncio.get_running_loop().time() - started_at)
+
+        if self._is_pure_recurrent_node(node_id):
+            self._pure_node_runs[node_id] = (kwargs, result)
+
+        return result
+
+    def _is_last_attempt(self, retry_policy: RetryPolicyLike, n_attempts: int, error: Exception) -> bool:
+        """
+        Check if the failed attempt must not be retried. The attempt rejected by the open circuit breaker is final.
+        The retry budget is spent only when the attempts and the run's deadline allow one more attempt.
+        """
+
+        return (
+            isinstance(error, CircuitOpenError)
+            or n_attempts == retry_policy.attempts
+            or self._is_deadline_exceeded()
+            or not retry_policy.can_retry()
+        )
+
+    def _get_node_timeout(self, retry_policy: RetryPolicyLike) -> t.Optional[float]:
+        """
+        Get the timeout of the node's attempt limited by the time left until the run's deadline
+        """
+
+        timeout = retry_policy.timeout
+
+        if self.ctx.deadline is not None:
+            remaining = self.ctx.deadline - asyncio.get_running_loop().time()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        return timeout
+
+    def _is_degraded(self, node_id: NodeId) -> bool:
+        """
+        Check if the degradable node is not expected to finish before the run's deadline.
+        The expected latency is the p95 latency of the node in the previous runs.
+        """
+
+        if self.ctx.deadline is None or NodeTag.degradable not in (self.dag.node_map[node_id].tags or ()):
+            return False
+
+        latency = self.dag.latency_profile.get_quantile(node_id, 0.95)
+        return latency is not None and asyncio.get_running_loop().time() + latency > self.ctx.deadline
+
+    def _is_deadline_exceeded(self) -> bool:
+        return self.ctx.deadline is not None and asyncio.get_running_loop().time() >= self.ctx.deadline
+
+    def _execute_sync_nodes(
+        self,
+        node_ids: t.Sequence[NodeId],
+        loop: asyncio.AbstractEventLoop,
+    ) -> t.List[_SyncNodeRecord]:
+        """
+        Execute sync nodes one by one in the current thread with the retry protocol.
+        The nodes must be in topological order. The execution stops at the first failed node.
+
+        The node's events are emitted in the event loop as the node runs, so the event managers see the real timing.
+        Nothing is written to the node storage, because the method is called outside the event loop.
+        The results are passed to the next nodes directly and have to be committed by the caller.
+        """
+
+        records = []
+        results = {}
+
+        for node_id in node_ids:
+            # The job cannot be interrupted, so the rest of the nodes are skipped when the run is over
+            if self.ctx.cancellation_token.is_cancelled:
+                break
+
+            record = _SyncNodeRecord(node_id=node_id, is_emitted=True)
+            records.append(record)
+
+            kwargs = self._get_node_kwargs(node_id)
+            for kwarg_name, pred_node_id in self.dag.plan.get_kwarg_bindings(node_id):
+                if pred_node_id in results:
+                    kwargs[kwarg_name] = results[pred_node_id]
+
+            self._emit_from_thread(loop, self.ctx.emit_on_node_start, node_id=node_id)
+
+            try:
+                record.result = results[node_id] = self._execute_sync_node(record, loop, **kwargs)
+            except Exception as ex:
+                record.error = ex
+
+            self._emit_from_thread(loop, self.ctx.emit_on_node_complete, node_id=node_id, error=record.error)
+
+            if record.error is not None:
+                break
+
+        return records
+
+    def _emit_from_thread(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        emit: t.Callable[..., t.Awaitable],
+        **kwargs: t.Any,
+    ) -> None:
+        """
+        Emit the event in the event loop and wait until the event managers have handled it.
+        The thread does not switch to the event loop if there are no event managers.
+        """
+
+        if self.ctx.chart.event_managers:
+            asyncio.run_coroutine_threadsafe(emit(**kwargs), loop).result()
+
+    def _execute_sync_node(self, record: _SyncNodeRecord, loop: asyncio.AbstractEventLoop, **kwargs: t.Any) -> t.Any:
+        """
+        Execute the sync node with the same retry protocol as async nodes have.
+        The nodes with a retry delay are never executed here, so the failed attempts are retried at once.
+        """
+
+        node = self.dag.node_map[record.node_id]
+        run_method = get_callable_run_method(node)
+
+        retry_policy = self.dag.retry_policy(node=node)
+        retry_policy.record_call()
+
+        run_kwargs = kwargs
+        if accepts_cancellation_token(node, run_method.__name__):
+            run_kwargs = {**kwargs, CANCELLATION_TOKEN_KWARG: self.ctx.cancellation_token}
+
+        n_attempts = 1
+        while True:
+            try:
+                return run_method(**run_kwargs)
+
+            except retry_policy.exceptions as error:  # noqa: PERF203
+                if n_attempts == retry_policy.attempts or not retry_policy.can_retry():
+                    if node.use_default:
+                        return run_node_default(node, **kwargs)
+
+                    raise
+
+                logger.debug('Node %s will be restarted', record.node_id, exc_info=error)
+                self._emit_from_thread(loop, self.ctx.emit_on_node_complete, node_id=record.node_id, error=error)
 
                 n_attempts += 1
-                await asyncio.sleep(retry_policy.delay)
 
             except Exception:
                 if node.use_default:
@@ -407,6 +799,32 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
                 raise
 
+    async def _commit_sync_record(self, record: _SyncNodeRecord) -> None:
+        """
+        Emit the node's events if they have not been emitted yet and save the node's result
+        as if the node had been executed in the event loop
+        """
+
+        node_id = record.node_id
+
+        if not record.is_emitted:
+            await self.ctx.emit_on_node_start(node_id=node_id)
+
+            for error in record.retry_errors:
+                await self.ctx.emit_on_node_complete(node_id=node_id, error=error)
+
+            await self.ctx.emit_on_node_complete(node_id=node_id, error=record.error)
+
+        if record.error is not None:
+            logger.error('Execution error node_id=%s', node_id, exc_info=record.error)
+            raise record.error
+
+        self._node_storage.set_node_result(node_id, record.result)
+        self._start_speculations()
+
+        if not self._is_skipped_for_storage(node_id):
+            await self.ctx.save_node_result(node_id, record.result)
+
     def _get_node_order(self, dag: DiGraph) -> t.List[NodeId]:
         """
         Calculate the order for nodes according to the dag's type
@@ -414,7 +832,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         return [
             node_id
-            for node_id in nx.topological_sort(dag)
+            for node_id in self.dag.get_node_order(dag)
             if (not self._node_storage.exists_processed_node(node_id) if not dag.is_recurrent else True)
         ]
 
@@ -424,21 +842,24 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
         Get the node's dependencies
         """
 
-        node_predecessors = set(self.dag.graph.predecessors(node_id))
-        current_dag = set(nx.topological_sort(dag))
+        return {pred_node_id for pred_node_id in self.dag.plan.get_predecessors(node_id) if pred_node_id in dag}
+
+    def _get_node_predecessors(self, dag: DiGraph, node_id: NodeId) -> t.Iterable[NodeId]:
+        """
+        Get the node's predecessors that have to be resolved in the scope of the dag
+        """
+
+        if self._is_switch(node_id) or self._is_head_of_oneof(node_id) or dag.is_recurrent:
+            return self._get_node_dependencies(dag, node_id)
 
-        return current_dag.intersection(node_predecessors)
+        return self.dag.plan.get_predecessors(node_id)
 
     def _get_predecessors(self, dag: DiGraph, node_id: NodeId) -> t.List[NodeId]:
         """
         Get the node's predecessors
         """
 
-        predecessors = list(
-            self._get_node_dependencies(dag, node_id)
-            if self._is_switch(node_id) or self._is_head_of_oneof(node_id) or dag.is_recurrent
-            else self.dag.graph.predecessors(node_id),
-        )
+        predecessors = list(self._get_node_predecessors(dag, node_id))
 
         for idx, predecessors_node_id in enumerate(predecessors):
             if self._is_switch(predecessors_node_id):
@@ -490,49 +911,71 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         local_tasks = []
 
-        for node_id in list_node_ids:
-            await self._lock_manager.wait_for_condition(
-                node_id,
-                functools.partial(self._is_ready_to_execute, dag, node_id),
-            )
+        try:
+            for node_id in list_node_ids:
+                await self._lock_manager.wait_for_condition(
+                    node_id,
+                    functools.partial(self._is_ready_to_execute, dag, node_id),
+                )
 
-            if dag.is_oneof and self.__has_subgraph_error(dag):
-                logger.debug('An error has been found in the %s', dag)
-                self._stop_coro_tasks(*local_tasks)
+                if dag.is_oneof and self._has_subgraph_error(dag):
+                    logger.debug('An error has been found in the %s', dag)
+                    self._stop_coro_tasks(*local_tasks)
 
-                # We must unlock descendants because the next OneOf subgraph should start the process.
-                # Otherwise, the entire subgraph will be locked.
-                await self.__unlock_descendants(node_id=node_id, dag=dag)
-                return None
+                    # We must unlock descendants because the next OneOf subgraph should start the process.
+                    # Otherwise, the entire subgraph will be locked.
+                    await self._unlock_descendants(node_id=node_id, dag=dag)
+                    return None
 
-            if self._is_switch(node_id):
-                coro_to_run = self._run_switch(dag, node_id)
+                if self._can_run_inline(node_id):
+                    await self._run_node(dag=dag, node_id=node_id)
+                else:
+                    local_tasks.append(self._create_task(self._get_node_coro(dag, node_id), name=node_id))
 
-            elif self._is_head_of_oneof(node_id):
-                coro_to_run = self._run_oneof(dag, node_id)
+            logger.debug('Await for result for %s the dag %s', dag.dest, dag)
 
-            else:
-                coro_to_run = self._run_node(
-                    node_id=node_id,
-                    dag=dag,
-                )
+            await self._wait_for_node_result(dag.dest)
 
-            local_tasks.append(self._create_task(coro_to_run, name=node_id))
+        except asyncio.CancelledError:
+            self._stop_cancelled_nodes(local_tasks)
+            raise
 
-        logger.debug('Await for result for %s the dag %s', dag.dest, dag)
+        return self._node_storage.get_node_result(dag.dest, with_hidden=True)
 
-        await self._lock_manager.wait_for_condition(
-            dag.dest,
-            functools.partial(self._node_storage.exists_node_result, dag.dest),
+    def _can_run_inline(self, node_id: NodeId) -> bool:
+        """
+        Check if the node can be executed right in the scheduler loop, since creating a task costs more than the node.
+        The node must not wait for the result of another subgraph or of the previous run.
+        """
+
+        return (
+            self.dag.plan.is_inline(node_id)
+            and not self._node_storage.exists_processed_node(node_id)
+            and not self._is_reusable(node_id)
         )
 
-        return self._node_storage.get_node_result(dag.dest, with_hidden=True)
+    def _get_node_coro(self, dag: DiGraph, node_id: NodeId) -> t.Coroutine:
+        """
+        Get the coroutine that runs the node according to its kind
+        """
+
+        if self._is_switch(node_id):
+            return self._run_switch(dag, node_id)
+
+        if self._is_head_of_oneof(node_id):
+            return self._run_oneof(dag, node_id)
 
-    def __has_subgraph_error(self, dag: DiGraph) -> bool:
+        fused_chain = self.dag.plan.get_fused_chain(node_id)
+        if fused_chain is not None:
+            return self._run_fused_chain(dag, fused_chain)
+
+        return self._run_node(node_id=node_id, dag=dag)
+
+    def _has_subgraph_error(self, dag: DiGraph) -> bool:
         """
         Check if the subgraph has an error
         """
-        return any([self._node_storage.exists_node_error(node_id) for node_id in dag.nodes])
+        return self._node_storage.exists_error_in(dag.node_indexes)
 
     async def _run_oneof(self, dag: DiGraph, node_id: NodeId) -> t.Any:
         """
@@ -541,49 +984,203 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         logger.debug('Prepare OneOf DAG node_id=%s', node_id)
 
-        for idx, subgraph_node_id in enumerate(self.dag.graph.nodes[node_id][NodeField.oneof_nodes]):
-            oneof_dag = self._get_reduced_dag(
+        node_data = self.dag.graph.nodes[node_id]
+        oneof_dags = [
+            self._get_reduced_dag(
                 source=self.dag.input_node,
                 dest=subgraph_node_id,
                 is_oneof=True,
                 is_nested_oneof=True,
             )
+            for subgraph_node_id in node_data[NodeField.oneof_nodes]
+        ]
 
-            logger.debug('Prepare [%s]%s to start. OneOf result node %s', idx, oneof_dag, node_id)
+        if node_data.get(NodeField.oneof_strategy, OneOfStrategy.sequential) == OneOfStrategy.sequential:
+            oneof_dag = await self._run_oneof_sequentially(oneof_dags)
+        else:
+            oneof_dag = await self._run_oneof_concurrently(node_id, oneof_dags)
 
-            self._create_task(coro=self._run_dag(dag=oneof_dag), name=str(oneof_dag))
+        if oneof_dag is not None:
+            # The node_id is a synthetic node and cannot be executed anywhere. Hence, we should copy the
+            # result of the last successful subgraph and unlock everything related to the synthetic node.
+            self._node_storage.copy_node_result(oneof_dag.dest, node_id)
 
-            await self._lock_manager.wait_for_condition(
-                subgraph_node_id,
-                lambda: (
-                    self.__has_subgraph_error(oneof_dag)  # noqa: B023
-                    or self._node_storage.exists_result_type(
-                        subgraph_node_id,  # noqa: B023
-                        exclude_type=(Recurrent,),
-                    )
-                ),
-            )
-
-            if not self.__has_subgraph_error(oneof_dag):
-                # The node_id is a synthetic node and cannot be executed anywhere. Hence, we should copy the
-                # result of the last successful subgraph and unlock everything related to the synthetic node.
-                self._node_storage.copy_node_result(subgraph_node_id, node_id)
+            await self._unlock_itself(node_id)
+            await self._unlock_descendants(node_id=node_id, dag=dag)
+            await self._unlock_run_method()
 
-                await self.__unlock_itself(node_id)
-                await self.__unlock_descendants(node_id=node_id, dag=dag)
-                await self.__unlock_run_method()
-
-                logger.debug('The %s has been succeeded', oneof_dag)
-                return
+            logger.debug('The %s has been succeeded', oneof_dag)
+            return
 
         if dag.is_nested_oneof:
             self._node_storage.set_node_result(node_id, OneOfDoesNotHaveResultError(node_id))
-            await self.__unlock_itself(node_id)
-            await self.__unlock_descendants(node_id=node_id, dag=dag)
+            await self._unlock_itself(node_id)
+            await self._unlock_descendants(node_id=node_id, dag=dag)
         else:
             errors: dict[NodeId, t.Type[Exception]] = self._node_storage.get_nodes_errors()
             await self.__raise_exc(OneOfDoesNotHaveResultError(node_id, errors))
 
+    async def _run_oneof_sequentially(self, oneof_dags: t.Sequence[DiGraph]) -> t.Optional[DiGraph]:
+        """
+        Run the alternatives one by one until one of them succeeds
+        """
+
+        for idx, oneof_dag in enumerate(oneof_dags):
+            logger.debug('Prepare [%s]%s to start', idx, oneof_dag)
+
+            if await self._run_oneof_alternative(oneof_dag):
+                return oneof_dag
+
+        return None
+
+    async def _run_oneof_concurrently(self, node_id: NodeId, oneof_dags: t.Sequence[DiGraph]) -> t.Optional[DiGraph]:
+        """
+        Run the alternatives concurrently according to the OneOf strategy.
+        In the hedged mode the next alternative starts when the running ones have failed or the last one is slower
+        than the hedging delay, the highest-priority alternative among the succeeded ones wins.
+        In the race mode all alternatives start at once, the succeeded one wins when no higher-priority alternative
+        is running. The rest are cancelled together with the nodes that they have launched.
+        """
+
+        loop = asyncio.get_running_loop()
+        node_data = self.dag.graph.nodes[node_id]
+        hedge_after = node_data.get(NodeField.hedge_after)
+        is_race = node_data[NodeField.oneof_strategy] == OneOfStrategy.race
+
+        running: t.Dict[asyncio.Task, int] = {}
+        succeeded: t.List[int] = []
+        last_started_at = 0.0
+        next_idx = 0
+
+        try:
+            while (winner := self._get_oneof_winner(succeeded, running.values(), is_race)) is None and (
+                running or next_idx < len(oneof_dags)
+            ):
+                while next_idx < len(oneof_dags) and (is_race or not running):
+                    logger.debug('Prepare [%s]%s to start', next_idx, oneof_dags[next_idx])
+
+                    running[self._start_oneof_alternative(oneof_dags[next_idx])] = next_idx
+                    last_started_at = loop.time()
+                    next_idx += 1
+
+                timeout = None
+                if next_idx < len(oneof_dags):
+                    delay = (
+                        hedge_after
+                        if hedge_after is not None
+                        else self.dag.latency_profile.get_quantile(oneof_dags[next_idx - 1].dest, 0.95)
+                    )
+
+                    if delay is not None:
+                        timeout = max(delay - (loop.time() - last_started_at), 0)
+
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    logger.debug('Hedge [%s]%s after %s seconds', next_idx, oneof_dags[next_idx], timeout)
+
+                    running[self._start_oneof_alternative(oneof_dags[next_idx])] = next_idx
+                    last_started_at = loop.time()
+                    next_idx += 1
+
+                for task in done:
+                    idx = running.pop(task)
+
+                    if task.result():
+                        succeeded.append(idx)
+
+        finally:
+            for task, idx in running.items():
+                self._cancel_oneof_alternative(task, oneof_dags[idx], node_id)
+
+        return oneof_dags[winner] if winner is not None else None
+
+    @staticmethod
+    def _get_oneof_winner(
+        succeeded: t.Collection[int],
+        running: t.Collection[int],
+        wait_higher_priority: bool,
+    ) -> t.Optional[int]:
+        """
+        Get the index of the winning alternative or None if the winner is not known yet
+        """
+
+        if not succeeded:
+            return None
+
+        winner = min(succeeded)
+
+        if wait_higher_priority and any(idx < winner for idx in running):
+            return None
+
+        return winner
+
+    def _start_oneof_alternative(self, oneof_dag: DiGraph) -> asyncio.Task:
+        return self._create_task(coro=self._run_oneof_alternative(oneof_dag), name=f'alternative-{oneof_dag}')
+
+    async def _run_oneof_alternative(self, oneof_dag: DiGraph) -> bool:
+        """
+        Run the OneOf alternative and check if it has succeeded.
+        The latency of the succeeded alternatives is collected to the DAG's latency profile.
+        """
+
+        started_at = asyncio.get_running_loop().time()
+        await self._run_oneof_subgraph(oneof_dag)
+
+        if self._has_subgraph_error(oneof_dag):
+            return False
+
+        self.dag.latency_profile.add(oneof_dag.dest, asyncio.get_running_loop().time() - started_at)
+        return True
+
+    def _cancel_oneof_alternative(self, task: asyncio.Task, oneof_dag: DiGraph, node_id: NodeId) -> None:
+        """
+        Cancel the OneOf alternative that has lost together with the nodes needed only by the OneOf's alternatives.
+        Its destination node gets an error result, so nothing waits for the cancelled node.
+        """
+
+        self._cancelled_nodes.update(self.dag.plan.get_oneof_exclusive_nodes(node_id))
+        self._stop_coro_tasks(
+            task,
+            *(coro_task for coro_task in self._coro_tasks if coro_task.get_name() == oneof_dag.dest),
+        )
+
+        if self._node_storage.exists_processed_node(oneof_dag.dest) and not self._node_storage.exists_node_result(
+            oneof_dag.dest,
+        ):
+            self._node_storage.set_node_result(oneof_dag.dest, OneOfAlternativeCancelledError(oneof_dag.dest))
+
+    def _stop_cancelled_nodes(self, coro_tasks: t.Iterable[asyncio.Task]) -> None:
+        """
+        Stop the tasks of the cancelled subgraph that execute the nodes of the cancelled OneOf alternatives.
+        The tasks of the rest of the nodes keep running, since other subgraphs can wait for their results.
+        The nodes executed in the thread pool get their cancellation tokens cancelled.
+        """
+
+        self._stop_coro_tasks(*(coro_task for coro_task in coro_tasks if coro_task.get_name() in self._cancelled_nodes))
+
+    async def _run_oneof_subgraph(self, oneof_dag: DiGraph) -> None:
+        """
+        Run one OneOf alternative and wait until it has either a final result or an error
+        """
+
+        task = self._create_task(coro=self._run_dag(dag=oneof_dag), name=str(oneof_dag))
+
+        try:
+            await self._lock_manager.wait_for_condition(
+                oneof_dag.dest,
+                lambda: (
+                    self._has_subgraph_error(oneof_dag)
+                    or self._node_storage.exists_result_type(
+                        oneof_dag.dest,
+                        exclude_type=(Recurrent,),
+                    )
+                ),
+            )
+        except asyncio.CancelledError:
+            self._stop_coro_tasks(task)
+            raise
+
     async def _run_switch(self, dag: DiGraph, node_id: NodeId) -> t.Any:
         """
         Run switch subgraph
@@ -593,13 +1190,133 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         self._add_case_result(node_id)
 
-        return await self._run_dag(
-            dag=self._get_reduced_dag(
-                self.dag.input_node,
-                (self._node_storage.get_switch_result(node_id)).node_id,
-                is_oneof=dag.is_oneof,
-            ),
+        branch_dag = self._get_reduced_dag(
+            self.dag.input_node,
+            (self._node_storage.get_switch_result(node_id)).node_id,
+            is_oneof=dag.is_oneof,
         )
+        await self._commit_speculation(branch_dag, node_id)
+
+        return await self._run_dag(dag=branch_dag)
+
+    def _get_speculative_branches(self) -> t.List[t.Tuple[NodeId, SpeculativeBranch]]:
+        """
+        Get the switch branches to speculate according to the frequencies of the branches in the previous runs
+        """
+
+        branches = []
+
+        for switch_node_id, (min_probability, switch_branches) in self.dag.plan.speculative_switches.items():
+            counts = self.dag.branch_counts.get(switch_node_id) or {}
+            total = sum(counts.values())
+
+            branches.extend(
+                (switch_node_id, branch)
+                for branch in switch_branches
+                if not total or counts.get(branch.label, 0) / total >= min_probability
+            )
+
+        return branches
+
+    def _start_speculations(self) -> None:
+        """
+        Start the speculative branches whose dependencies have results.
+        A branch is not started if its switch decision is already known.
+        """
+
+        if not self._pending_speculations:
+            return
+
+        pending = []
+
+        for switch_node_id, branch in self._pending_speculations:
+            decision_node_id, _ = self.dag.plan.get_switch_cases(switch_node_id)
+
+            if self._node_storage.exists_node_result(decision_node_id):
+                continue
+
+            if not all(self._node_storage.exists_node_result(node_id) for node_id in branch.dependencies):
+                pending.append((switch_node_id, branch))
+                continue
+
+            logger.debug('Start the speculative execution of the branch %s', branch.node_id)
+            self._speculations[switch_node_id, branch.label] = asyncio.get_running_loop().create_task(
+                self._speculate_branch(branch),
+                name=f'speculative-{branch.node_id}',
+            )
+
+        self._pending_speculations = pending
+
+    async def _speculate_branch(self, branch: SpeculativeBranch) -> t.Optional[t.List[_SyncNodeRecord]]:
+        """
+        Execute the branch's own nodes without events and saving the results.
+        If any node fails, the branch is dropped and executed as usual after the switch decision.
+        """
+
+        records = []
+        results = {}
+
+        try:
+            for node_id in branch.node_ids:
+                record = _SyncNodeRecord(node_id=node_id)
+
+                kwargs = self._get_node_kwargs(node_id)
+                for kwarg_name, pred_node_id in self.dag.plan.get_kwarg_bindings(node_id):
+                    if pred_node_id in results:
+                        kwargs[kwarg_name] = results[pred_node_id]
+
+                record.result = results[node_id] = await self.__execute_node(
+                    node_id=node_id,
+                    retry_errors=record.retry_errors,
+                    **kwargs,
+                )
+                records.append(record)
+
+        except Exception as ex:
+            logger.debug('The speculative execution of the branch %s has failed', branch.node_id, exc_info=ex)
+            return None
+
+        return records
+
+    async def _commit_speculation(self, branch_dag: DiGraph, switch_node_id: NodeId) -> None:
+        """
+        Cancel the speculative branches that lost and commit the results of the selected one
+        as if its nodes had been executed after the switch decision
+        """
+
+        if switch_node_id not in self.dag.plan.speculative_switches:
+            return
+
+        label = self._node_storage.get_switch_result(switch_node_id).label
+        self.dag.branch_counts[switch_node_id][label] += 1
+
+        self._pending_speculations = [
+            (node_id, branch) for node_id, branch in self._pending_speculations if node_id != switch_node_id
+        ]
+
+        selected_task = None
+        for key in [key for key in self._speculations if key[0] == switch_node_id]:
+            task = self._speculations.pop(key)
+
+            if key[1] == label:
+                selected_task = task
+            else:
+                task.cancel()
+
+        records = await selected_task if selected_task is not None else None
+        if records is None:
+            return
+
+        logger.debug('Commit the speculative execution of the branch %s', label)
+        self.ctx.stats.speculative_hits += 1
+
+        # The nodes could have been executed by another subgraph while the branch was speculated
+        records = [record for record in records if not self._node_storage.exists_processed_node(record.node_id)]
+
+        for record in records:
+            self._node_storage.set_node_as_processed(record.node_id)
+
+        await self._commit_sync_records(branch_dag, records)
 
     async def _run_node(
         self,
@@ -627,14 +1344,19 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
             )
 
             if isinstance(result, Recurrent):
-                self._create_task(
-                    name=f'rec-{node_id}',
-                    coro=self._run_recurrent_subgraph(
-                        node_result=result,
-                        node_id=node_id,
-                        dag=dag,
-                    ),
-                )
+                # The next iteration of the active recurrent subgraph is started by the subgraph's loop itself
+                if not self._node_storage.exists_active_rec_subgraph(
+                    self.dag.graph.nodes[node_id].get(NodeField.start_node),
+                    node_id,
+                ):
+                    self._create_task(
+                        name=f'rec-{node_id}',
+                        coro=self._run_recurrent_subgraph(
+                            node_result=result,
+                            node_id=node_id,
+                            dag=dag,
+                        ),
+                    )
 
                 # We shouldn't unlock the node's descendants if we have to perform recurrent subgraph.
                 # It has to be this way because the node, which has `Recurrent` result,
@@ -643,6 +1365,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
             logger.debug('Save the result "%s" for the node %s', result, node_id)
             self._node_storage.set_node_result(node_id, result)
+            self._start_speculations()
 
             # TODO: Needs to reorganize saving policy for artifact storage
             if not self._is_skipped_for_storage(node_id):
@@ -656,7 +1379,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                 self.__unlock_execution_lock(node_id)
 
                 # Unlock itself to perform the next step in the node's DAG
-                await self.__unlock_itself(node_id)
+                await self._unlock_itself(node_id)
 
                 return  # noqa: B012
 
@@ -664,20 +1387,69 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
             self.__unlock_execution_lock(node_id)
 
-            await self.__unlock_descendants(node_id=node_id, dag=dag)
-            await self.__unlock_run_method()
+            await self._unlock_descendants(node_id=node_id, dag=dag)
+            await self._unlock_run_method()
 
             if node_id == dag.dest:
                 logger.debug('The node %s is an output node', node_id)
-                await self.__unlock_itself(node_id)
+                await self._unlock_itself(node_id)
 
-    async def __unlock_itself(self, node_id: NodeId) -> None:
+    async def _run_fused_chain(self, dag: DiGraph, node_ids: t.Tuple[NodeId, ...]) -> None:
+        """
+        Run a linear chain of sync nodes in a single executor job. Each node emits its events as it runs.
+        The next nodes of the chain are marked as processed, so they are not executed again when they are launched.
+        """
+
+        # A failed node of a OneOf subgraph is a result rather than an error, so such chains run node by node.
+        # The same goes for a chain that has been partially processed by another subgraph
+        # and for a rerun, where the nodes may reuse the results of the previous run.
+        if (
+            dag.is_oneof
+            or self.ctx.previous_results is not None
+            or self.ctx.deadline is not None
+            or any(self._node_storage.exists_processed_node(node_id) for node_id in node_ids)
+        ):
+            return await self._run_node(dag=dag, node_id=node_ids[0])
+
+        for node_id in node_ids:
+            self._node_storage.set_node_as_processed(node_id)
+
+        loop = asyncio.get_running_loop()
+        records = await loop.run_in_executor(
+            threads_pool_registry.get_pool_executor(),
+            functools.partial(contextvars.copy_context().run, self._execute_sync_nodes, node_ids, loop),
+        )
+
+        self.ctx.stats.saved_executor_hops += len(records) - 1
+        logger.debug('The chain %s has been executed in a single executor job', node_ids)
+
+        await self._commit_sync_records(dag, records)
+        return None
+
+    async def _commit_sync_records(self, dag: DiGraph, records: t.Iterable[_SyncNodeRecord]) -> None:
+        """
+        Commit the records one by one and unlock the nodes' dependencies as if the nodes had been run by the DAG
+        """
+
+        for record in records:
+            try:
+                await self._commit_sync_record(record)
+            finally:
+                self.__unlock_execution_lock(record.node_id)
+
+                await self._unlock_descendants(node_id=record.node_id, dag=dag)
+                await self._unlock_run_method()
+
+                if record.node_id == dag.dest:
+                    await self._unlock_itself(record.node_id)
+
+    async def _unlock_itself(self, node_id: NodeId) -> None:
         """
         Unlock the node itself to perform the next step in DAGs
         """
         await self._lock_manager.unlock_condition(node_id)
 
-    async def __unlock_run_method(self) -> None:
+    async def _unlock_run_method(self) -> None:
         """
         Unlock the main method in order to return the main DAG result
         """
@@ -713,35 +1485,36 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
             return
 
         self._node_storage.set_active_rec_subgraph(start_from_node_id, node_id)
-        max_iterations = self.dag.graph.nodes[node_id].get(NodeField.max_iterations)
 
-        recurrent_subgraph = get_connected_subgraph(
-            self.dag.graph,
-            start_from_node_id,
-            node_id,
-            is_recurrent=True,
-            is_oneof=dag.is_oneof,
-        )
+        recurrent_loop = self.dag.plan.get_recurrent_loop(start_from_node_id, node_id, is_oneof=dag.is_oneof)
+        recurrent_subgraph = recurrent_loop.subgraph
         logger.debug('%s Start the process of the recurrent subgraph', recurrent_subgraph)
 
-        for current_iter in range(max_iterations):
-            name = f'Recurrent-subgraph[attempt={current_iter}] {start_from_node_id} --> {node_id}'
-            logger.debug('Executing the %s', name)
+        for current_iter in range(recurrent_loop.max_iterations):
+            logger.debug('Executing the %s, attempt=%s', recurrent_subgraph, current_iter)
+
+            self._node_storage.set_additional_data(start_from_node_id, node_result.data)
 
-            start_node = self.dag.graph.nodes[start_from_node_id]
-            start_node[NodeField.additional_data] = node_result.data
+            if recurrent_loop.has_pure_nodes:
+                self.ctx.stats.recurrent_skips.setdefault(node_id, []).append(0)
 
-            node_result = await self._run_dag(dag=recurrent_subgraph)
+            if recurrent_loop.is_sequential:
+                node_result = await self._run_sequential_loop_body(recurrent_loop)
+            else:
+                node_result = await self._run_dag(dag=recurrent_subgraph)
 
             is_rec_result = isinstance(node_result, Recurrent)
-            has_errors = self.__has_subgraph_error(recurrent_subgraph)
+            has_errors = self._has_subgraph_error(recurrent_subgraph)
 
             if has_errors:
-                logger.debug('The subgraph should be stopped. There is an error in %s', name)
+                logger.debug('The subgraph should be stopped. There is an error in %s', recurrent_subgraph)
                 return
 
             if not is_rec_result and not has_errors:
-                logger.debug('The subgraph should be stopped. The result has been processed for the subgraph %s', name)
+                logger.debug(
+                    'The subgraph should be stopped. The result has been processed for the subgraph %s',
+                    recurrent_subgraph,
+                )
                 break
 
         else:
@@ -779,23 +1552,36 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
                     # In this particular situation we should return it via the node's descendants so that
                     # another node could continue its process.
                     self._node_storage.set_node_result(node_id, error)
-                    await self.__unlock_itself(node_id)
-                    await self.__unlock_descendants(node_id=node_id, dag=dag)
+                    await self._unlock_itself(node_id)
+                    await self._unlock_descendants(node_id=node_id, dag=dag)
 
                 else:
                     await self.__raise_exc(error)
 
         self._node_storage.delete_active_rec_subgraph(start_from_node_id, node_id)
 
+    async def _run_sequential_loop_body(self, recurrent_loop: RecurrentLoop) -> t.Any:
+        """
+        Run a single iteration of the sequential loop body node by node in the topological order,
+        every node's dependencies inside the body are resolved by the time it is started
+        """
+
+        self._node_storage.hide_last_execution(*recurrent_loop.node_ids)
+
+        for node_id in recurrent_loop.node_ids:
+            await self._run_node(dag=recurrent_loop.subgraph, node_id=node_id)
+
+        return self._node_storage.get_node_result(recurrent_loop.subgraph.dest, with_hidden=True)
+
     async def __raise_exc(self, exc: Exception) -> None:
         """
         Raise an exception and let the run method know about the exception so the entire graph could be ended
         """
 
-        await self.__unlock_run_method()
+        await self._unlock_run_method()
         raise exc
 
-    async def __unlock_descendants(self, node_id: NodeId, dag: DiGraph) -> None:
+    async def _unlock_descendants(self, node_id: NodeId, dag: DiGraph) -> None:
         """
         Send a notification to the node's descendants to unlock them
         """
@@ -812,7 +1598,7 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
         logger.debug('Getting descendants for the node %s', node_id)
 
-        descendants = nx.descendants_at_distance(self.dag.graph, node_id, 1)
+        descendants = set(self.dag.plan.get_successors(node_id))
 
         for descendant_node_id in set(descendants):
             if dag.is_oneof or self._is_switch(descendant_node_id):
@@ -821,3 +1607,520 @@ class DAGRunConcurrentManager(DAGRunManagerLike):
 
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__} nnodes="{len(self.dag.graph.nodes)}" nedges="{len(self.dag.graph.edges)}">'
+
+
+@dataclass
+class _SubgraphRunState:
+    """
+    Scheduling state of a single subgraph execution
+    """
+
+    dag: DiGraph
+    done: asyncio.Future
+    wait_final_result: bool = False
+    counters: t.Dict[NodeId, int] = field(default_factory=dict)
+    tasks: t.List[asyncio.Task] = field(default_factory=list)
+    is_closed: bool = False
+    is_stopped: bool = False
+
+    def close(self) -> None:
+        """
+        Close the state so that its pending dependency counters are ignored from now on
+        """
+
+        self.is_closed = True
+
+        if not self.done.done():
+            self.done.set_result(None)
+
+    def stop(self) -> None:
+        """
+        Stop the subgraph execution because of an error
+        """
+
+        self.is_stopped = True
+        DAGRunConcurrentManager._stop_coro_tasks(*self.tasks)
+        self.close()
+
+
+@dataclass
+class DAGRunDependencyManager(DAGRunConcurrentManager):
+    """
+    Менеджер запуска графов на счетчиках зависимостей.
+    Узел запускается в момент, когда счетчик его неразрешенных зависимостей становится равным нулю.
+    Готовность предшественников не перепроверяется, а asyncio.Condition не используются.
+    """
+
+    _dependents: t.Dict[NodeId, t.List[t.Tuple[_SubgraphRunState, NodeId]]] = field(
+        default_factory=functools.partial(defaultdict, list),
+    )
+    _dest_waiters: t.Dict[NodeId, t.List[_SubgraphRunState]] = field(
+        default_factory=functools.partial(defaultdict, list),
+    )
+    _result_waiters: t.Dict[NodeId, t.List[asyncio.Future]] = field(
+        default_factory=functools.partial(defaultdict, list),
+    )
+    _oneof_run_states: t.List[_SubgraphRunState] = field(default_factory=list)
+    _run_done: t.Optional[asyncio.Future] = None
+
+    def _create_task(self, coro: t.Coroutine, name: str) -> asyncio.Task:
+        task = super()._create_task(coro, name)
+        task.add_done_callback(lambda _: self._check_run_done())
+
+        return task
+
+    def _check_run_done(self) -> None:
+        """
+        Release the main method if the main DAG has the result or any task has failed
+        """
+
+        if self._run_done is None or self._run_done.done():
+            return
+
+        if self._node_storage.exists_node_result(self.dag.output_node) or self._get_first_error_in_tasks(
+            self._coro_tasks,
+        ):
+            self._run_done.set_result(None)
+
+    async def _wait_for_run_result(self) -> None:
+        self._run_done = asyncio.get_running_loop().create_future()
+        self._check_run_done()
+
+        await self._run_done
+
+    async def _wait_for_node_result(self, node_id: NodeId) -> None:
+        # The result can be hidden by a recurrent subgraph before the waiter wakes up
+        while not self._node_storage.exists_node_result(node_id):
+            waiter = asyncio.get_running_loop().create_future()
+            self._result_waiters[node_id].append(waiter)
+
+            await waiter
+
+    async def _unlock_run_method(self) -> None:
+        self._check_run_done()
+
+    async def _unlock_itself(self, node_id: NodeId) -> None:
+        self._notify_result(node_id)
+
+    async def _unlock_descendants(self, node_id: NodeId, dag: DiGraph) -> None:  # noqa: ARG002
+        self._notify_result(node_id)
+        self._notify_resolved(node_id)
+
+    def _is_resolved(self, node_id: NodeId) -> bool:
+        """
+        Check if the node's result can be consumed by its descendants
+        """
+
+        if self._is_switch(node_id):
+            case_result = self._node_storage.get_switch_result(node_id)
+            return case_result is not None and self._is_resolved(case_result.node_id)
+
+        return self._node_storage.exists_node_result(node_id) and not isinstance(
+            self._node_storage.get_node_result(node_id),
+            Recurrent,
+        )
+
+    def _notify_result(self, node_id: NodeId) -> None:
+        """
+        Release everything that waits for any result of the node
+        """
+
+        if not self._node_storage.exists_node_result(node_id):
+            return
+
+        for waiter in self._result_waiters.pop(node_id, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
+        if self._node_storage.exists_node_error(node_id):
+            for run_state in list(self._oneof_run_states):
+                if not run_state.is_closed and node_id in run_state.dag:
+                    logger.debug('An error has been found in the %s', run_state.dag)
+                    run_state.stop()
+
+        is_final_result = not isinstance(self._node_storage.get_node_result(node_id), Recurrent)
+
+        waiting_states = self._dest_waiters.pop(node_id, ())
+        for run_state in waiting_states:
+            if run_state.wait_final_result and not is_final_result:
+                self._dest_waiters[node_id].append(run_state)
+                continue
+
+            run_state.close()
+
+        if node_id == self.dag.output_node:
+            self._check_run_done()
+
+    def _notify_resolved(self, node_id: NodeId) -> None:
+        """
+        Decrease the dependency counters of the nodes that wait for the node and launch the ready ones
+        """
+
+        if not self._is_resolved(node_id):
+            return
+
+        for switch_node_id in self.dag.plan.get_branch_switches(node_id):
+            case_result = self._node_storage.get_switch_result(switch_node_id)
+
+            if case_result is not None and case_result.node_id == node_id:
+                self._notify_resolved(switch_node_id)
+
+        for run_state, dependent_node_id in self._dependents.pop(node_id, ()):
+            if run_state.is_closed or dependent_node_id not in run_state.counters:
+                continue
+
+            run_state.counters[dependent_node_id] -= 1
+
+            if run_state.counters[dependent_node_id] == 0:
+                self._launch_node(run_state, dependent_node_id)
+
+    def _launch_node(self, run_state: _SubgraphRunState, node_id: NodeId) -> None:
+        """
+        Launch the node which dependencies have been resolved
+        """
+
+        run_state.counters.pop(node_id)
+        dag = run_state.dag
+
+        if dag.is_oneof and self._has_subgraph_error(dag):
+            logger.debug('An error has been found in the %s', dag)
+            run_state.stop()
+            return
+
+        run_state.tasks.append(self._create_task(self._get_node_coro(dag, node_id), name=node_id))
+
+    def _add_case_result(self, switch_node_id: NodeId) -> None:
+        super()._add_case_result(switch_node_id)
+
+        # The selected branch can be resolved before the switch decision if it is shared with other nodes
+        self._notify_resolved(switch_node_id)
+
+    async def _run_oneof_subgraph(self, oneof_dag: DiGraph) -> None:
+        run_state = _SubgraphRunState(
+            dag=oneof_dag,
+            done=asyncio.get_running_loop().create_future(),
+            wait_final_result=True,
+        )
+
+        await self._create_task(self._run_subgraph(run_state), name=str(oneof_dag))
+
+    async def _run_dag(self, dag: DiGraph) -> t.Any:
+        return await self._run_subgraph(
+            _SubgraphRunState(dag=dag, done=asyncio.get_running_loop().create_future()),
+        )
+
+    def _count_dependencies(self, run_state: _SubgraphRunState, node_id: NodeId) -> int:
+        """
+        Count the unresolved dependencies of the node and subscribe the node to their resolution
+        """
+
+        counter = 0
+
+        for pred_node_id in self._get_node_predecessors(run_state.dag, node_id):
+            if not self._is_resolved(pred_node_id):
+                self._dependents[pred_node_id].append((run_state, node_id))
+                counter += 1
+
+        return counter
+
+    async def _run_subgraph(self, run_state: _SubgraphRunState) -> t.Any:
+        """
+        Run the dag using dependency counters
+        """
+
+        dag = run_state.dag
+        logger.debug('Start DAG execution, dag=%s', str(dag))
+
+        list_node_ids = self._get_node_order(dag)
+
+        if dag.is_recurrent:
+            logger.debug('Hide previous node results for recurrent subgraph %s', list_node_ids)
+            self._node_storage.hide_last_execution(*list_node_ids)
+
+        if len(list_node_ids) == 0 and not run_state.wait_final_result:
+            return None
+
+        for node_id in list_node_ids:
+            run_state.counters[node_id] = self._count_dependencies(run_state, node_id)
+
+        if dag.is_oneof:
+            self._oneof_run_states.append(run_state)
+
+        self._dest_waiters[dag.dest].append(run_state)
+        self._notify_result(dag.dest)
+
+        try:
+            for node_id in list_node_ids:
+                if run_state.is_closed:
+                    break
+
+                if run_state.counters.get(node_id) == 0:
+                    self._launch_node(run_state, node_id)
+
+            logger.debug('Await for result for %s the dag %s', dag.dest, dag)
+            await run_state.done
+
+        except asyncio.CancelledError:
+            self._stop_cancelled_nodes(run_state.tasks)
+            raise
+
+        finally:
+            run_state.close()
+
+            if dag.is_oneof:
+                self._oneof_run_states.remove(run_state)
+
+        if run_state.is_stopped:
+            return None
+
+        return self._node_storage.get_node_result(dag.dest, with_hidden=True)
+
+
+@dataclass
+class DAGRunSyncManager(DAGRunConcurrentManager):
+    """
+    Менеджер запуска синхронных графов.
+    Если граф состоит только из синхронных узлов пула потоков и не содержит управляющих конструкций,
+    то все узлы исполняются в топологическом порядке за одну отправку задачи в пул потоков.
+    Иначе, а также при повторном запуске с результатами предыдущего запуска, граф исполняется конкурентно.
+    """
+
+    async def run(self) -> NodeResultT:
+        if not self.dag.plan.is_sync or self.ctx.previous_results is not None or self.ctx.deadline is not None:
+            return await super().run()
+
+        node_ids = self._get_reduced_dag(self.dag.input_node, self.dag.output_node).topological_order
+
+        for node_id in node_ids:
+            self._node_storage.set_node_as_processed(node_id)
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            records = await loop.run_in_executor(
+                threads_pool_registry.get_pool_executor(),
+                functools.partial(contextvars.copy_context().run, self._execute_sync_nodes, node_ids, loop),
+            )
+
+            self.ctx.stats.saved_executor_hops += len(records) - 1
+
+            for record in records:
+                await self._commit_sync_record(record)
+
+        except Exception as ex:
+            logger.error('DAG run raised error', exc_info=ex)
+            raise
+
+        finally:
+            self.ctx.cancellation_token.cancel()
+
+        return self._node_storage.get_node_result(self.dag.output_node, with_hidden=True)
+
+
+@dataclass
+class DAGBatchRunManager:
+    """
+    Менеджер пакетного запуска графа.
+    Граф исполняется один раз на весь пакет: узлы с методом process_batch получают списки значений,
+    остальные узлы исполняются для каждого элемента пакета отдельно.
+    Ошибка элемента пакета не влияет на остальные элементы.
+    Графы с управляющими конструкциями исполняются отдельно для каждого элемента пакета.
+    """
+
+    ctxs: t.Sequence[PipelineContextLike]
+    dag: DAGLike
+
+    async def run(self) -> t.List[PipelineResult]:
+        if self.dag.plan.has_control_flow:
+            logger.debug('The DAG has control flow, so the batch is executed item by item')
+            return list(await asyncio.gather(*(self._run_item(ctx) for ctx in self.ctxs)))
+
+        main_dag = self.dag.plan.get_subgraph(self.dag.input_node, self.dag.output_node)
+        managers = [DAGRunConcurrentManager(ctx=ctx, dag=self.dag) for ctx in self.ctxs]
+        errors: t.Dict[int, Exception] = {}
+
+        for node_id in main_dag.topological_order:
+            alive = [idx for idx in range(len(managers)) if idx not in errors]
+
+            if not alive:
+                break
+
+            outcomes = await self._run_node(main_dag, node_id, [managers[idx] for idx in alive])
+            errors.update({idx: outcome for idx, outcome in zip(alive, outcomes) if isinstance(outcome, Exception)})
+
+        return [
+            PipelineResult(
+                pipeline_id=manager.ctx.pipeline_id,
+                value=(
+                    manager._node_storage.get_node_result(self.dag.output_node, with_hidden=True)
+                    if idx not in errors
+                    else None
+                ),
+                error=errors.get(idx),
+            )
+            for idx, manager in enumerate(managers)
+        ]
+
+    async def _run_item(self, ctx: PipelineContextLike) -> PipelineResult:
+        """
+        Run the DAG for a single item of the batch
+        """
+
+        try:
+            return PipelineResult(pipeline_id=ctx.pipeline_id, value=await self.dag.run(ctx), error=None)
+        except Exception as ex:
+            return PipelineResult(pipeline_id=ctx.pipeline_id, value=None, error=ex)
+
+    async def _run_node(
+        self,
+        dag: DiGraph,
+        node_id: NodeId,
+        managers: t.List[DAGRunConcurrentManager],
+    ) -> t.List[t.Optional[Exception]]:
+        """
+        Run the node for all alive items. Returns an error or None for every item.
+        """
+
+        kwargs_list = [manager._get_node_kwargs(node_id) for manager in managers]
+
+        if get_callable_batch_method(self.dag.node_map[node_id]) is not None and all(
+            kwargs.keys() == kwargs_list[0].keys() for kwargs in kwargs_list
+        ):
+            return await self._run_batch_node(node_id, managers, kwargs_list)
+
+        return list(
+            await asyncio.gather(
+                *(manager._run_node(dag=dag, node_id=node_id) for manager in managers),
+                return_exceptions=True,
+            ),
+        )
+
+    async def _run_batch_node(
+        self,
+        node_id: NodeId,
+        managers: t.List[DAGRunConcurrentManager],
+        kwargs_list: t.List[t.Dict[str, t.Any]],
+    ) -> t.List[t.Optional[Exception]]:
+        """
+        Run the node's batch method once for all items with the retry protocol
+        """
+
+        node = self.dag.node_map[node_id]
+
+        for manager in managers:
+            manager._node_storage.set_node_as_processed(node_id)
+            await manager.ctx.emit_on_node_start(node_id=node_id)
+
+        retry_policy = self.dag.retry_policy(node=node)
+
+        for _ in managers:
+            retry_policy.record_call()
+
+        n_attempts = 1
+        while True:
+            try:
+                async with _guard_circuit(node, node_id, [manager.ctx for manager in managers]):
+                    results = await self._run_batch_node_attempt(node_id, managers, kwargs_list, retry_policy)
+
+                if len(results) != len(managers):
+                    raise BatchResultSizeError(node_id, len(managers), len(results))
+
+                break
+
+            except CircuitOpenError as error:
+                return await self._complete_batch_node(node_id, managers, kwargs_list, error)
+
+            except (*retry_policy.exceptions, NodeTimeoutError) as error:
+                if n_attempts == retry_policy.attempts or not retry_policy.can_retry():
+                    return await self._complete_batch_node(node_id, managers, kwargs_list, error)
+
+                for manager in managers:
+                    await manager.ctx.emit_on_node_complete(node_id=node_id, error=error)
+
+                await asyncio.sleep(retry_policy.get_delay(n_attempts))
+                n_attempts += 1
+
+            except Exception as error:
+                return await self._complete_batch_node(node_id, managers, kwargs_list, error)
+
+        outcomes = []
+        for manager, result in zip(managers, results):
+            await manager.ctx.emit_on_node_complete(node_id=node_id, error=None)
+            outcomes.append(await self._save_result(manager, node_id, result))
+
+        return outcomes
+
+    async def _run_batch_node_attempt(
+        self,
+        node_id: NodeId,
+        managers: t.List[DAGRunConcurrentManager],
+        kwargs_list: t.List[t.Dict[str, t.Any]],
+        retry_policy: RetryPolicyLike,
+    ) -> t.List[t.Any]:
+        """
+        Run a single attempt of the node's batch method limited by the node's timeout and concurrency
+        """
+
+        node = self.dag.node_map[node_id]
+        batch_kwargs = {kwarg_name: [kwargs[kwarg_name] for kwargs in kwargs_list] for kwarg_name in kwargs_list[0]}
+
+        if node.max_concurrency is None:
+            return await _wait_for_node(
+                run_node_batch(node, node_id=node_id, **batch_kwargs),
+                node_id=node_id,
+                timeout=retry_policy.timeout,
+            )
+
+        async with get_concurrency_limiter(node).acquire() as queue_wait:
+            for manager in managers:
+                manager.ctx.stats.queue_wait += queue_wait
+                await manager.ctx.emit_on_node_dequeue(node_id=node_id, queue_wait=queue_wait)
+
+            return await _wait_for_node(
+                run_node_batch(node, node_id=node_id, **batch_kwargs),
+                node_id=node_id,
+                timeout=retry_policy.timeout,
+            )
+
+    async def _complete_batch_node(
+        self,
+        node_id: NodeId,
+        managers: t.List[DAGRunConcurrentManager],
+        kwargs_list: t.List[t.Dict[str, t.Any]],
+        error: Exception,
+    ) -> t.List[t.Optional[Exception]]:
+        """
+        Complete the failed batch node with the default results or with the error for every item
+        """
+
+        node = self.dag.node_map[node_id]
+        outcomes = []
+
+        for manager, kwargs in zip(managers, kwargs_list):
+            if not node.use_default:
+                await manager.ctx.emit_on_node_complete(node_id=node_id, error=error)
+                outcomes.append(error)
+                continue
+
+            try:
+                result = run_node_default(node, **kwargs)
+            except Exception as ex:
+                await manager.ctx.emit_on_node_complete(node_id=node_id, error=ex)
+                outcomes.append(ex)
+                continue
+
+            await manager.ctx.emit_on_node_complete(node_id=node_id, error=None)
+            outcomes.append(await self._save_result(manager, node_id, result))
+
+        return outcomes
+
+    @staticmethod
+    async def _save_result(manager: DAGRunConcurrentManager, node_id: NodeId, result: t.Any) -> None:
+        """
+        Save the item's result to the item's storage and the artifact store
+        """
+
+        manager._node_storage.set_node_result(node_id, result)
+
+        if not manager._is_skipped_for_storage(node_id):
+            await manager.ctx.save_node_result(node_id, result)
@@ -0,0 +1,554 @@
+import typing as t
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import networkx as nx
+
+from ml_pipeline_engine.dag.enums import EdgeField
+from ml_pipeline_engine.dag.enums import NodeField
+from ml_pipeline_engine.dag.errors import SubgraphIsNotCompiledError
+from ml_pipeline_engine.dag.graph import DiGraph
+from ml_pipeline_engine.dag.graph import get_connected_subgraph
+from ml_pipeline_engine.logs import logger_manager as logger
+from ml_pipeline_engine.node import is_inline_node
+from ml_pipeline_engine.node import is_pure_node
+from ml_pipeline_engine.node import is_thread_pool_node
+from ml_pipeline_engine.types import CaseLabel
+from ml_pipeline_engine.types import DAGPlanLike
+from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import NodeId
+
+KwargName = str
+SwitchCases = t.Tuple[NodeId, t.Mapping[CaseLabel, NodeId]]
+SubgraphKey = t.Tuple[NodeId, NodeId, bool, bool, bool]
+
+
+def _get_subgraph_key(
+    source: NodeId,
+    dest: NodeId,
+    is_recurrent: bool = False,
+    is_oneof: bool = False,
+    is_nested_oneof: bool = False,
+) -> SubgraphKey:
+    return source, dest, is_recurrent, is_oneof, is_nested_oneof
+
+
+@dataclass(frozen=True)
+class SpeculativeBranch:
+    """
+    Switch case branch that can be executed before the switch decision is known.
+
+    The nodes are the branch's own nodes in topological order, i.e. the nodes that are not executed by the main DAG.
+    The dependencies are the main DAG nodes that must have results before the branch can be started.
+    """
+
+    label: CaseLabel
+    node_id: NodeId
+    node_ids: t.Tuple[NodeId, ...]
+    dependencies: t.FrozenSet[NodeId]
+
+
+@dataclass(frozen=True)
+class RecurrentLoop:
+    """
+    Loop body of a recurrent subgraph compiled once per plan.
+
+    The node ids are the body's nodes in topological order, their results are hidden before every iteration.
+    The body has pure nodes if some of its nodes can be skipped when their inputs repeat between the iterations.
+    The body is sequential if its nodes gain nothing from being executed concurrently, i.e. every node but the inline
+    ones depends on the previous one, and it has neither switches, OneOf nodes nor nested recurrent subgraphs.
+    A sequential body is executed node by node without tasks and readiness checks.
+    """
+
+    subgraph: DiGraph
+    node_ids: t.Tuple[NodeId, ...]
+    max_iterations: int
+    is_sequential: bool
+    has_pure_nodes: bool
+
+
+@dataclass(frozen=True)
+class DAGPlan(DAGPlanLike):
+    """
+    Immutable execution plan of a DAG.
+
+    The plan is compiled once per DAG and holds everything the run manager needs at run time:
+    the topological order, predecessor/successor index arrays, kwarg bindings and reduced subgraphs
+    for the main DAG, every switch branch, OneOf alternative and recurrent subgraph.
+
+    The DAG is sync if its main subgraph has no control flow and consists of thread pool nodes only.
+    Fused chains are linear chains of thread pool nodes that can be executed in a single executor job.
+    Recurrent nodes are the nodes of recurrent subgraphs that can be executed several times per run.
+    Inline nodes are the cheap nodes that are executed in the scheduler loop without creating a task.
+    Recurrent loops are the compiled bodies of recurrent subgraphs.
+    OneOf exclusive nodes map a OneOf node to the nodes whose results are needed only by its alternatives.
+    Speculative switches map a switch of the main DAG to the minimal probability of a branch to be speculated
+    and the branches that can be executed before the switch decision is known.
+    """
+
+    node_ids: t.Tuple[NodeId, ...]
+    node_index: t.Mapping[NodeId, int]
+    predecessors: t.Tuple[t.Tuple[int, ...], ...]
+    successors: t.Tuple[t.Tuple[int, ...], ...]
+    kwarg_bindings: t.Tuple[t.Tuple[t.Tuple[KwargName, NodeId], ...], ...]
+    switch_nodes: t.FrozenSet[NodeId]
+    oneof_heads: t.FrozenSet[NodeId]
+    switch_cases: t.Mapping[NodeId, SwitchCases]
+    branch_switches: t.Mapping[NodeId, t.FrozenSet[NodeId]]
+    subgraphs: t.Mapping[SubgraphKey, DiGraph]
+    thread_pool_nodes: t.FrozenSet[NodeId]
+    has_control_flow: bool
+    is_sync: bool
+    fused_chains: t.Mapping[NodeId, t.Tuple[NodeId, ...]]
+    recurrent_nodes: t.FrozenSet[NodeId]
+    inline_nodes: t.FrozenSet[NodeId]
+    recurrent_loops: t.Mapping[SubgraphKey, RecurrentLoop]
+    oneof_exclusive_nodes: t.Mapping[NodeId, t.FrozenSet[NodeId]]
+    speculative_switches: t.Mapping[NodeId, t.Tuple[float, t.Tuple[SpeculativeBranch, ...]]]
+
+    def get_predecessors(self, node_id: NodeId) -> t.Tuple[NodeId, ...]:
+        return tuple(self.node_ids[idx] for idx in self.predecessors[self.node_index[node_id]])
+
+    def get_successors(self, node_id: NodeId) -> t.Tuple[NodeId, ...]:
+        return tuple(self.node_ids[idx] for idx in self.successors[self.node_index[node_id]])
+
+    def get_kwarg_bindings(self, node_id: NodeId) -> t.Tuple[t.Tuple[KwargName, NodeId], ...]:
+        return self.kwarg_bindings[self.node_index[node_id]]
+
+    def is_switch(self, node_id: NodeId) -> bool:
+        return node_id in self.switch_nodes
+
+    def is_head_of_oneof(self, node_id: NodeId) -> bool:
+        return node_id in self.oneof_heads
+
+    def get_switch_cases(self, node_id: NodeId) -> SwitchCases:
+        """
+        Get the switch's decision node and the mapping "case label -> branch node"
+        """
+        return self.switch_cases[node_id]
+
+    def get_branch_switches(self, node_id: NodeId) -> t.FrozenSet[NodeId]:
+        """
+        Get switches that have the node as one of their case branches
+        """
+        return self.branch_switches.get(node_id, frozenset())
+
+    def get_fused_chain(self, node_id: NodeId) -> t.Optional[t.Tuple[NodeId, ...]]:
+        """
+        Get the fused chain that starts with the node
+        """
+        return self.fused_chains.get(node_id)
+
+    def is_inline(self, node_id: NodeId) -> bool:
+        return node_id in self.inline_nodes
+
+    def get_oneof_exclusive_nodes(self, node_id: NodeId) -> t.FrozenSet[NodeId]:
+        """
+        Get the nodes that can be cancelled together with the alternatives of the OneOf node
+        """
+        return self.oneof_exclusive_nodes.get(node_id, frozenset())
+
+    def get_recurrent_loop(self, source: NodeId, dest: NodeId, is_oneof: bool = False) -> RecurrentLoop:
+        """
+        Get a precompiled loop body of the recurrent subgraph
+        """
+
+        key = _get_subgraph_key(source, dest, is_recurrent=True, is_oneof=is_oneof)
+
+        try:
+            return self.recurrent_loops[key]
+        except KeyError as ex:
+            raise SubgraphIsNotCompiledError(f'The subgraph has not been compiled for the plan, key={key}') from ex
+
+    def get_subgraph(
+        self,
+        source: NodeId,
+        dest: NodeId,
+        is_recurrent: bool = False,
+        is_oneof: bool = False,
+        is_nested_oneof: bool = False,
+    ) -> DiGraph:
+        """
+        Get a precompiled connected subgraph
+        """
+
+        key = _get_subgraph_key(source, dest, is_recurrent, is_oneof, is_nested_oneof)
+
+        try:
+            return self.subgraphs[key]
+        except KeyError as ex:
+            raise SubgraphIsNotCompiledError(f'The subgraph has not been compiled for the plan, key={key}') from ex
+
+
+def _get_reduced_view(graph: DiGraph, dest: NodeId, is_oneof: bool) -> nx.DiGraph:
+    """
+    Get a view of the graph without switch case branches and OneOf alternatives.
+    The destination node is kept for OneOf subgraphs even if it is an alternative.
+    """
+
+    def _filter_edge(u: NodeId, v: NodeId) -> bool:
+        return not graph.edges[u, v].get(EdgeField.case_branch)
+
+    def _filter_node(u: NodeId) -> bool:
+        return (is_oneof and u == dest) or not graph.nodes[u].get(NodeField.is_oneof_child)
+
+    return nx.subgraph_view(graph, filter_edge=_filter_edge, filter_node=_filter_node)
+
+
+def _compile_subgraph(
+    graph: DiGraph,
+    node_ids: t.Tuple[NodeId, ...],
+    source: NodeId,
+    dest: NodeId,
+    is_recurrent: bool = False,
+    is_oneof: bool = False,
+    is_nested_oneof: bool = False,
+) -> DiGraph:
+    """
+    Compile a connected subgraph into a standalone frozen graph with a precomputed topological order
+    """
+
+    view = graph if is_recurrent else _get_reduced_view(graph, dest, is_oneof)
+    connected = get_connected_subgraph(view, source, dest)
+
+    subgraph = DiGraph(
+        is_recurrent=is_recurrent,
+        is_oneof=is_oneof,
+        is_nested_oneof=is_nested_oneof,
+        name=f'{source} —> {dest}, rec={is_recurrent}, oneof={is_oneof}, nested_oneof={is_nested_oneof}',
+    )
+    subgraph.add_nodes_from(connected.nodes(data=True))
+    subgraph.add_edges_from(connected.edges(data=True))
+
+    subgraph.source = source
+    subgraph.dest = dest
+    subgraph.topological_order = tuple(node_id for node_id in node_ids if node_id in subgraph)
+    subgraph.node_indexes = frozenset(idx for idx, node_id in enumerate(node_ids) if node_id in subgraph)
+
+    return nx.freeze(subgraph)
+
+
+def _compile_recurrent_loop(
+    graph: DiGraph,
+    subgraph: DiGraph,
+    node_map: t.Mapping[NodeId, NodeBase],
+    inline_nodes: t.AbstractSet[NodeId],
+    control_flow_nodes: t.AbstractSet[NodeId],
+) -> RecurrentLoop:
+    """
+    Compile the loop body of the recurrent subgraph
+    """
+
+    has_control_flow = subgraph.is_oneof or any(
+        node_id in control_flow_nodes
+        or (node_id != subgraph.dest and graph.nodes[node_id].get(NodeField.start_node) is not None)
+        for node_id in subgraph.nodes
+    )
+
+    # The nodes that may suspend must follow each other, otherwise some of them could be executed concurrently
+    suspending_nodes = [node_id for node_id in subgraph.topological_order if node_id not in inline_nodes]
+    is_sequential = not has_control_flow and all(
+        nx.has_path(subgraph, u, v) for u, v in zip(suspending_nodes, suspending_nodes[1:])
+    )
+
+    return RecurrentLoop(
+        subgraph=subgraph,
+        node_ids=subgraph.topological_order,
+        max_iterations=graph.nodes[subgraph.dest].get(NodeField.max_iterations),
+        is_sequential=is_sequential,
+        has_pure_nodes=any(node_id in node_map and is_pure_node(node_map[node_id]) for node_id in subgraph.nodes),
+    )
+
+
+def _find_fused_chains(
+    graph: DiGraph,
+    node_ids: t.Tuple[NodeId, ...],
+    fusible_nodes: t.AbstractSet[NodeId],
+) -> t.Dict[NodeId, t.Tuple[NodeId, ...]]:
+    """
+    Find linear chains of fusible nodes where every node is the only consumer of the previous one
+    and the previous node is its only dependency
+    """
+
+    next_nodes = {}
+
+    for node_id in node_ids:
+        if node_id not in fusible_nodes or graph.out_degree(node_id) != 1:
+            continue
+
+        next_node_id = next(iter(graph.successors(node_id)))
+
+        if (
+            next_node_id in fusible_nodes
+            and graph.in_degree(next_node_id) == 1
+            and graph.edges[node_id, next_node_id].get(EdgeField.kwarg_name) is not None
+        ):
+            next_nodes[node_id] = next_node_id
+
+    chained_nodes = set(next_nodes.values())
+    chains = {}
+
+    for node_id in node_ids:
+        if node_id not in next_nodes or node_id in chained_nodes:
+            continue
+
+        chain = [node_id]
+        while chain[-1] in next_nodes:
+            chain.append(next_nodes[chain[-1]])
+
+        chains[node_id] = tuple(chain)
+
+    return chains
+
+
+def _find_oneof_exclusive_nodes(
+    graph: DiGraph,
+    input_node: NodeId,
+    output_node: NodeId,
+    oneof_heads: t.AbstractSet[NodeId],
+) -> t.Dict[NodeId, t.FrozenSet[NodeId]]:
+    """
+    Find the nodes whose every path to the output node goes through an alternative of the OneOf node
+    """
+
+    exclusive_nodes = {}
+
+    for head_node_id in oneof_heads:
+        alternatives = frozenset(graph.nodes[head_node_id][NodeField.oneof_nodes])
+
+        view = nx.subgraph_view(graph, filter_node=lambda node_id, excluded=alternatives: node_id not in excluded)
+        needed_nodes = nx.ancestors(view, output_node) | {input_node, output_node}
+
+        exclusive_nodes[head_node_id] = frozenset(
+            node_id
+            for alternative_node_id in alternatives
+            for node_id in (*nx.ancestors(graph, alternative_node_id), alternative_node_id)
+            if node_id not in needed_nodes
+        )
+
+    return exclusive_nodes
+
+
+def _find_speculative_branches(
+    graph: DiGraph,
+    main_dag: DiGraph,
+    branch_dags: t.Mapping[CaseLabel, DiGraph],
+    excluded_nodes: t.AbstractSet[NodeId],
+) -> t.Tuple[SpeculativeBranch, ...]:
+    """
+    Find the switch case branches that consist of plain nodes only.
+    Nested control flow is executed by the run manager, so branches that contain it are never speculated.
+    """
+
+    branches = []
+
+    for label, branch_dag in branch_dags.items():
+        node_ids = tuple(node_id for node_id in branch_dag.topological_order if node_id not in main_dag)
+
+        if not node_ids or any(node_id in excluded_nodes for node_id in node_ids):
+            continue
+
+        dependencies = frozenset(
+            pred_id for node_id in node_ids for pred_id in graph.predecessors(node_id) if pred_id not in node_ids
+        )
+
+        if dependencies & excluded_nodes or not dependencies.issubset(main_dag.nodes):
+            continue
+
+        branches.append(
+            SpeculativeBranch(label=label, node_id=branch_dag.dest, node_ids=node_ids, dependencies=dependencies),
+        )
+
+    return tuple(branches)
+
+
+def _find_speculative_switches(
+    graph: DiGraph,
+    main_dag: DiGraph,
+    subgraphs: t.Mapping[SubgraphKey, DiGraph],
+    input_node: NodeId,
+    switch_cases: t.Mapping[NodeId, SwitchCases],
+    excluded_nodes: t.AbstractSet[NodeId],
+) -> t.Dict[NodeId, t.Tuple[float, t.Tuple[SpeculativeBranch, ...]]]:
+    """
+    Find the speculative branches of the main DAG's switches that are marked as speculative
+    """
+
+    speculative_switches = {}
+
+    for switch_node_id, (_, branches) in switch_cases.items():
+        min_probability = graph.nodes[switch_node_id].get(NodeField.speculation_min_probability)
+
+        if min_probability is None or switch_node_id not in main_dag:
+            continue
+
+        branch_dags = {
+            label: subgraphs[key]
+            for label, branch_node_id in branches.items()
+            if (key := _get_subgraph_key(input_node, branch_node_id)) in subgraphs
+        }
+        speculative_switches[switch_node_id] = (
+            min_probability,
+            _find_speculative_branches(graph, main_dag, branch_dags, excluded_nodes),
+        )
+
+    return speculative_switches
+
+
+def compile_dag_plan(
+    graph: DiGraph,
+    input_node: NodeId,
+    output_node: NodeId,
+    node_map: t.Mapping[NodeId, NodeBase],
+    fuse_chains: bool = False,
+) -> DAGPlan:
+    """
+    Compile the execution plan for the graph
+    """
+
+    node_ids = tuple(nx.topological_sort(graph))
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+
+    predecessors = tuple(tuple(node_index[pred_id] for pred_id in graph.predecessors(node_id)) for node_id in node_ids)
+    successors = tuple(tuple(node_index[succ_id] for succ_id in graph.successors(node_id)) for node_id in node_ids)
+    kwarg_bindings = tuple(
+        tuple(
+            (graph.edges[pred_id, node_id][EdgeField.kwarg_name], pred_id)
+            for pred_id in graph.predecessors(node_id)
+            if graph.edges[pred_id, node_id].get(EdgeField.kwarg_name) is not None
+        )
+        for node_id in node_ids
+    )
+
+    switch_nodes = frozenset(node_id for node_id in node_ids if graph.nodes[node_id].get(NodeField.is_switch) is True)
+    oneof_heads = frozenset(node_id for node_id in node_ids if graph.nodes[node_id].get(NodeField.is_oneof_head))
+    thread_pool_nodes = frozenset(
+        node_id for node_id in node_ids if node_id in node_map and is_thread_pool_node(node_map[node_id])
+    )
+    # Neither a timeout, a concurrency limit nor a circuit breaker can be applied to a node inside a sequence of nodes
+    # executed in a single executor job. A retry delay would block the pool's thread there.
+    fusable_nodes = frozenset(
+        node_id
+        for node_id in thread_pool_nodes
+        if node_map[node_id].timeout is None
+        and node_map[node_id].max_concurrency is None
+        and node_map[node_id].circuit_breaker_threshold is None
+        and not (node_map[node_id].delay and (node_map[node_id].attempts or 1) > 1)
+    )
+    inline_nodes = frozenset(
+        node_id
+        for node_id in node_ids
+        if node_id in node_map
+        and node_id not in switch_nodes
+        and node_id not in oneof_heads
+        and is_inline_node(node_map[node_id])
+    )
+    has_recurrent_subgraphs = False
+
+    keys = {_get_subgraph_key(input_node, output_node)}
+    switch_cases = {}
+    branch_switches = defaultdict(set)
+
+    for switch_node_id in switch_nodes:
+        decision_node_id = None
+        branches = {}
+
+        for pred_id in graph.predecessors(switch_node_id):
+            edge = graph.edges[pred_id, switch_node_id]
+
+            if edge.get(EdgeField.is_switch):
+                decision_node_id = pred_id
+                continue
+
+            branches[edge.get(EdgeField.case_branch)] = pred_id
+            branch_switches[pred_id].add(switch_node_id)
+
+            for is_oneof in (False, True):
+                keys.add(_get_subgraph_key(input_node, pred_id, is_oneof=is_oneof))
+
+        switch_cases[switch_node_id] = (decision_node_id, MappingProxyType(branches))
+
+    for head_node_id in oneof_heads:
+        for alternative_node_id in graph.nodes[head_node_id][NodeField.oneof_nodes]:
+            keys.add(_get_subgraph_key(input_node, alternative_node_id, is_oneof=True, is_nested_oneof=True))
+
+    for node_id in node_ids:
+        start_node_id = graph.nodes[node_id].get(NodeField.start_node)
+
+        if start_node_id is None:
+            continue
+
+        has_recurrent_subgraphs = True
+
+        for is_oneof in (False, True):
+            keys.add(_get_subgraph_key(start_node_id, node_id, is_recurrent=True, is_oneof=is_oneof))
+
+    subgraphs = {}
+    for key in keys:
+        try:
+            subgraphs[key] = _compile_subgraph(graph, node_ids, *key)
+        except nx.NodeNotFound:  # noqa: PERF203
+            # One of the subgraph's ends is filtered out, so the subgraph cannot be executed at all.
+            # Requesting it at run time raises SubgraphIsNotCompiledError.
+            logger.debug('Skip precompiling the subgraph %s', key)
+
+    recurrent_nodes = frozenset(
+        node_id for subgraph in subgraphs.values() if subgraph.is_recurrent for node_id in subgraph.nodes
+    )
+    recurrent_loops = {
+        key: _compile_recurrent_loop(graph, subgraph, node_map, inline_nodes, switch_nodes | oneof_heads)
+        for key, subgraph in subgraphs.items()
+        if subgraph.is_recurrent
+    }
+    oneof_exclusive_nodes = _find_oneof_exclusive_nodes(graph, input_node, output_node, oneof_heads)
+    fused_chains = {}
+
+    if fuse_chains:
+        # Nodes of recurrent subgraphs are executed again on every iteration, so they are never fused
+        fused_chains = _find_fused_chains(graph, node_ids, fusable_nodes - recurrent_nodes)
+
+    main_dag = subgraphs[_get_subgraph_key(input_node, output_node)]
+    speculative_switches = _find_speculative_switches(
+        graph,
+        main_dag,
+        subgraphs,
+        input_node,
+        switch_cases,
+        excluded_nodes=switch_nodes | oneof_heads | recurrent_nodes,
+    )
+
+    has_control_flow = bool(switch_nodes or oneof_heads or has_recurrent_subgraphs)
+    is_sync = not has_control_flow and fusable_nodes.issuperset(main_dag.nodes)
+
+    logger.debug(
+        'The plan has been compiled, nnodes=%s, nsubgraphs=%s, is_sync=%s, nfused_chains=%s',
+        len(node_ids),
+        len(subgraphs),
+        is_sync,
+        len(fused_chains),
+    )
+
+    return DAGPlan(
+        node_ids=node_ids,
+        node_index=MappingProxyType(node_index),
+        predecessors=predecessors,
+        successors=successors,
+        kwarg_bindings=kwarg_bindings,
+        switch_nodes=switch_nodes,
+        oneof_heads=oneof_heads,
+        switch_cases=MappingProxyType(switch_cases),
+        branch_switches=MappingProxyType(
+            {node_id: frozenset(switches) for node_id, switches in branch_switches.items()},
+        ),
+        subgraphs=MappingProxyType(subgraphs),
+        thread_pool_nodes=thread_pool_nodes,
+        has_control_flow=has_control_flow,
+        is_sync=is_sync,
+        fused_chains=MappingProxyType(fused_chains),
+        recurrent_nodes=recurrent_nodes,
+        inline_nodes=inline_nodes,
+        recurrent_loops=MappingProxyType(recurrent_loops),
+        oneof_exclusive_nodes=MappingProxyType(oneof_exclusive_nodes),
+        speculative_switches=MappingProxyType(speculative_switches),
+    )
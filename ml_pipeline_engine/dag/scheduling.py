@@ -0,0 +1,52 @@
+import heapq
+import typing as t
+
+from ml_pipeline_engine.dag.graph import DiGraph
+from ml_pipeline_engine.dag.plan import DAGPlan
+from ml_pipeline_engine.types import NodeId
+
+
+def get_critical_path_lengths(plan: DAGPlan, costs: t.Mapping[NodeId, float]) -> t.Dict[NodeId, float]:
+    """
+    Get the length of the longest path from every node to the end of the graph, the node itself included
+    """
+
+    lengths: t.Dict[NodeId, float] = {}
+
+    for node_id in reversed(plan.node_ids):
+        lengths[node_id] = costs.get(node_id, 0.0) + max(
+            (lengths[successor_id] for successor_id in plan.get_successors(node_id)),
+            default=0.0,
+        )
+
+    return lengths
+
+
+def get_priority_order(subgraph: DiGraph, priorities: t.Mapping[NodeId, float]) -> t.Tuple[NodeId, ...]:
+    """
+    Get the topological order of the subgraph in which the ready nodes with the higher priority go first.
+    Nodes with equal priorities keep the plain topological order.
+    """
+
+    in_degrees = {node_id: subgraph.in_degree(node_id) for node_id in subgraph.topological_order}
+    ready = [
+        (-priorities.get(node_id, 0.0), idx, node_id)
+        for idx, node_id in enumerate(subgraph.topological_order)
+        if in_degrees[node_id] == 0
+    ]
+    heapq.heapify(ready)
+
+    order_index = {node_id: idx for idx, node_id in enumerate(subgraph.topological_order)}
+    order = []
+
+    while ready:
+        _, _, node_id = heapq.heappop(ready)
+        order.append(node_id)
+
+        for successor_id in subgraph.successors(node_id):
+            in_degrees[successor_id] -= 1
+
+            if in_degrees[successor_id] == 0:
+                heapq.heappush(ready, (-priorities.get(successor_id, 0.0), order_index[successor_id], successor_id))
+
+    return tuple(order)
@@ -1,72 +1,119 @@
 import typing as t
-from collections import UserDict
-from dataclasses import dataclass
-from dataclasses import field
 
 from ml_pipeline_engine.types import NodeId
 
 
-class HiddenDict(UserDict):
+class GenerationArray:
     """
-    Dict object that can hide some keys until they are set again
+    Dense array of values addressed by node indexes that can hide some values until they are set again.
+
+    Hiding does not touch the value. Every write and every hide is stamped with the next generation
+    of the array's clock, and the value is visible while it has been written after it has been hidden.
     """
 
-    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
-        super().__init__(*args, **kwargs)
-        self._hidden_keys: set = set()
+    __slots__ = ('_clock', '_hidden', '_order', '_values', '_written')
+
+    def __init__(self, size: int) -> None:
+        self._clock = 0
+        self._values: t.List[t.Any] = [None] * size
+        self._written: t.List[int] = [0] * size
+        self._hidden: t.List[int] = [0] * size
+        self._order: t.Dict[int, None] = {}
+
+    def get(self, idx: int, with_hidden: bool = True) -> t.Any:
+        written = self._written[idx]
 
-    def get(self, key: t.Any, with_hidden: bool = True) -> t.Any:
-        if with_hidden is False and key in self._hidden_keys:
+        if written == 0 or (with_hidden is False and written < self._hidden[idx]):
             return None
 
-        return super().get(key)
+        return self._values[idx]
 
-    def exists(self, key: t.Any, with_hidden: bool = True) -> bool:
-        if with_hidden is False and key in self._hidden_keys:
-            return False
+    def exists(self, idx: int, with_hidden: bool = True) -> bool:
+        written = self._written[idx]
+        return written != 0 and (with_hidden or written > self._hidden[idx])
 
-        return key in self
+    def set(self, idx: int, value: t.Any) -> None:
+        if self._written[idx] == 0:
+            self._order[idx] = None
 
-    def set(self, key: t.Any, value: t.Any) -> None:
-        if key in self._hidden_keys:
-            self._hidden_keys.remove(key)
+        self._clock += 1
+        self._values[idx] = value
+        self._written[idx] = self._clock
 
-        self[key] = value
+    def hide(self, idx: int) -> None:
+        self._clock += 1
+        self._hidden[idx] = self._clock
 
-    def hide(self, key: t.Any) -> None:
-        self._hidden_keys.add(key)
+    def delete(self, idx: int) -> None:
+        self._values[idx] = None
+        self._written[idx] = 0
+        self._hidden[idx] = 0
+        self._order.pop(idx, None)
 
-    def delete(self, key: t.Any) -> None:
-        self.pop(key)
+    def delete_if_exists(self, idx: int) -> None:
+        if self.exists(idx, with_hidden=False):
+            self.delete(idx)
 
-    def delete_if_exists(self, key: t.Any) -> None:
-        if self.exists(key, with_hidden=False):
-            self.delete(key)
+    def iter_indexes(self) -> t.Iterator[int]:
+        """
+        Iterate over the indexes of the written values in the order of their first write
+        """
+        return iter(self._order)
 
 
-@dataclass
 class DAGNodeStorage:
     """
-    A container for all information about node results
+    A container for all information about node results.
+
+    Nodes are addressed by the dense indexes of the compiled DAG plan.
+    The indexes of the nodes which visible result is an error are kept up to date as the results are written and hidden,
+    so checking a subgraph for errors does not scan the subgraph.
     """
 
-    node_results: HiddenDict = field(default_factory=HiddenDict)
-    processed_nodes: HiddenDict = field(default_factory=HiddenDict)
-    switch_results: HiddenDict = field(default_factory=HiddenDict)
-    recurrent_subgraph: HiddenDict = field(default_factory=HiddenDict)
-    skipped_nodes_for_artifact_storage: HiddenDict = field(default_factory=HiddenDict)
+    __slots__ = (
+        '_active_rec_subgraphs',
+        '_additional_data',
+        '_error_nodes',
+        '_node_ids',
+        '_node_index',
+        'node_results',
+        'processed_nodes',
+        'skipped_nodes_for_artifact_storage',
+        'switch_results',
+    )
+
+    def __init__(self, node_ids: t.Sequence[NodeId], node_index: t.Mapping[NodeId, int]) -> None:
+        self._node_ids = node_ids
+        self._node_index = node_index
+        self._active_rec_subgraphs: t.Set[t.Tuple[NodeId, NodeId]] = set()
+        self._additional_data: t.Dict[NodeId, t.Any] = {}
+        self._error_nodes: t.Set[int] = set()
+
+        self.node_results = GenerationArray(len(node_ids))
+        self.processed_nodes = GenerationArray(len(node_ids))
+        self.switch_results = GenerationArray(len(node_ids))
+        self.skipped_nodes_for_artifact_storage = GenerationArray(len(node_ids))
 
     def set_node_result(self, node_id: NodeId, data: t.Any) -> None:
-        self.node_results.set(node_id, data)
+        idx = self._node_index[node_id]
+        self.node_results.set(idx, data)
+
+        if isinstance(data, BaseException):
+            self._error_nodes.add(idx)
+        else:
+            self._error_nodes.discard(idx)
 
     def get_node_result(self, node_id: NodeId, with_hidden: bool = False) -> t.Any:
-        return self.node_results.get(node_id, with_hidden)
+        return self.node_results.get(self._node_index[node_id], with_hidden)
 
     def hide_node_result(self, node_id: NodeId) -> None:
-        self.node_results.hide(node_id)
+        idx = self._node_index[node_id]
+
+        self.node_results.hide(idx)
+        self._error_nodes.discard(idx)
 
     def exists_node_result(self, node_id: NodeId, with_hidden: bool = False) -> bool:
-        return self.node_results.exists(node_id, with_hidden)
+        return self.node_results.exists(self._node_index[node_id], with_hidden)
 
     def copy_node_result(self, from_node_id: NodeId, to_node_id: NodeId) -> None:
         self.set_node_result(to_node_id, self.get_node_result(from_node_id, with_hidden=True))
@@ -74,6 +121,13 @@ class DAGNodeStorage:
     def exists_node_error(self, node_id: NodeId, with_hidden: bool = False) -> bool:
         return self.exists_result_type(node_id, (BaseException,), with_hidden=with_hidden)
 
+    def exists_error_in(self, node_indexes: t.AbstractSet[int]) -> bool:
+        """
+        Check if any of the nodes has an error as its visible result.
+        Only the smaller of the two sets is iterated, which is usually the set of errors.
+        """
+        return not self._error_nodes.isdisjoint(node_indexes)
+
     def exists_result_type(
         self,
         node_id: NodeId,
@@ -82,7 +136,7 @@ class DAGNodeStorage:
         exclude_none: bool = True,
         with_hidden: bool = False,
     ) -> bool:
-        result = self.node_results.get(node_id, with_hidden)
+        result = self.node_results.get(self._node_index[node_id], with_hidden)
 
         if exclude_none and result is None:
             return False
@@ -90,45 +144,56 @@ class DAGNodeStorage:
         return isinstance(result, target_type) and not isinstance(result, exclude_type)
 
     def set_switch_result(self, node_id: NodeId, data: t.Any) -> t.Any:
-        self.switch_results.set(node_id, data)
+        self.switch_results.set(self._node_index[node_id], data)
 
     def get_switch_result(self, node_id: NodeId, with_hidden: bool = False) -> t.Any:
-        return self.switch_results.get(node_id, with_hidden)
+        return self.switch_results.get(self._node_index[node_id], with_hidden)
 
     def set_node_as_processed(self, node_id: NodeId) -> None:
-        self.processed_nodes.set(node_id, 1)
+        self.processed_nodes.set(self._node_index[node_id], 1)
 
     def hide_processed_node(self, node_id: NodeId) -> None:
-        self.processed_nodes.hide(node_id)
+        self.processed_nodes.hide(self._node_index[node_id])
 
     def exists_processed_node(self, node_id: NodeId, with_hidden: bool = False) -> bool:
-        return self.processed_nodes.exists(node_id, with_hidden)
+        return self.processed_nodes.exists(self._node_index[node_id], with_hidden)
 
     def set_active_rec_subgraph(self, source: NodeId, dest: NodeId) -> None:
-        self.processed_nodes.set((source, dest), 1)
+        self._active_rec_subgraphs.add((source, dest))
 
     def delete_active_rec_subgraph(self, source: NodeId, dest: NodeId) -> None:
-        self.processed_nodes.delete((source, dest))
+        self._active_rec_subgraphs.remove((source, dest))
 
     def exists_active_rec_subgraph(self, source: NodeId, dest: NodeId) -> bool:
-        return self.processed_nodes.exists((source, dest))
+        return (source, dest) in self._active_rec_subgraphs
+
+    def set_additional_data(self, node_id: NodeId, data: t.Any) -> None:
+        self._additional_data[node_id] = data
+
+    def get_additional_data(self, node_id: NodeId) -> t.Any:
+        return self._additional_data.get(node_id)
 
     def hide_last_execution(self, *node_ids: NodeId) -> None:
         for node_id in node_ids:
-            self.hide_processed_node(node_id)
-            self.hide_node_result(node_id)
-            self.reset_node_skipped_for_store(node_id)
+            idx = self._node_index[node_id]
+
+            self.processed_nodes.hide(idx)
+            self.node_results.hide(idx)
+            self._error_nodes.discard(idx)
+            self.skipped_nodes_for_artifact_storage.delete_if_exists(idx)
 
     def set_node_skipped_for_store(self, node_id: NodeId) -> None:
-        self.skipped_nodes_for_artifact_storage.set(node_id, 1)
+        self.skipped_nodes_for_artifact_storage.set(self._node_index[node_id], 1)
 
     def check_node_skipped_for_store(self, node_id: NodeId) -> bool:
-        return self.skipped_nodes_for_artifact_storage.exists(node_id)
+        return self.skipped_nodes_for_artifact_storage.exists(self._node_index[node_id])
 
     def reset_node_skipped_for_store(self, node_id: NodeId) -> None:
-        self.skipped_nodes_for_artifact_storage.delete_if_exists(node_id)
+        self.skipped_nodes_for_artifact_storage.delete_if_exists(self._node_index[node_id])
 
     def get_nodes_errors(self) -> dict[NodeId, t.Type[Exception]]:
         return {
-            key: self.node_results[key] for key in self.node_results if isinstance(self.node_results[key], Exception)
+            self._node_ids[idx]: self.node_results.get(idx)
+            for idx in self.node_results.iter_indexes()
+            if isinstance(self.node_results.get(idx), Exception)
         }
@@ -6,6 +6,7 @@ from collections import deque
 from ml_pipeline_engine.dag import DAG
 from ml_pipeline_engine.dag import EdgeField
 from ml_pipeline_engine.dag import NodeField
+from ml_pipeline_engine.dag import SchedulingPolicy
 from ml_pipeline_engine.dag.graph import DiGraph
 from ml_pipeline_engine.dag_builders.annotation import errors
 from ml_pipeline_engine.dag_builders.annotation.marks import InputGenericMark
@@ -127,12 +128,21 @@ class AnnotationDAGBuilder:
 
         self._dag.add_edge(source_node_id, dest_node_id, **edge_data)
 
-    def _add_switch_node(self, node_id: NodeId, switch_decide_node_id: NodeId) -> None:
+    def _add_switch_node(
+        self,
+        node_id: NodeId,
+        switch_decide_node_id: NodeId,
+        speculation_min_probability: t.Optional[float] = None,
+    ) -> None:
         """
         Добавить в граф узел типа switch
         """
 
-        self._dag.add_node(node_id, **{NodeField.is_switch: True})
+        node_data = {NodeField.is_switch: True}
+        if speculation_min_probability is not None:
+            node_data[NodeField.speculation_min_probability] = speculation_min_probability
+
+        self._dag.add_node(node_id, **node_data)
         self._dag.add_edge(switch_decide_node_id, node_id, **{EdgeField.is_switch: True})
 
     def _traverse_breadth_first_to_dag(self, input_node: NodeBase, output_node: NodeBase):  # noqa
@@ -195,7 +205,13 @@ class AnnotationDAGBuilder:
                     node_id_list = [get_node_id(node) for node in input_mark.nodes]
 
                     self._dag.add_node(
-                        synthetic_node_id, **{NodeField.is_oneof_head: True, NodeField.oneof_nodes: node_id_list},
+                        synthetic_node_id,
+                        **{
+                            NodeField.is_oneof_head: True,
+                            NodeField.oneof_nodes: node_id_list,
+                            NodeField.oneof_strategy: input_mark.strategy,
+                            NodeField.hedge_after: input_mark.hedge_after,
+                        },
                     )
                     self._dag.add_edge(get_node_id(input_node), synthetic_node_id)
 
@@ -225,7 +241,11 @@ class AnnotationDAGBuilder:
                     switch_node_id = generate_node_id(NodeType.switch.value, input_mark.name)
 
                     self._add_node_to_map(input_mark.switch)
-                    self._add_switch_node(switch_node_id, get_node_id(input_mark.switch))
+                    self._add_switch_node(
+                        switch_node_id,
+                        get_node_id(input_mark.switch),
+                        input_mark.min_probability if input_mark.speculative else None,
+                    )
                     _set_visited(input_mark.switch)
 
                     for case_branch, case_node in input_mark.cases:
@@ -297,7 +317,13 @@ class AnnotationDAGBuilder:
 
         return is_process_pool_needed, is_thread_pool_needed
 
-    def build(self, input_node: NodeBase, output_node: NodeBase = None) -> DAGLike:
+    def build(
+        self,
+        input_node: NodeBase,
+        output_node: NodeBase = None,
+        fuse_chains: bool = False,
+        scheduling: SchedulingPolicy = SchedulingPolicy.topological,
+    ) -> DAGLike:
         """
         Построить граф путем сборки зависимостей по аннотациям типа (меткам входов)
         """
@@ -321,12 +347,16 @@ class AnnotationDAGBuilder:
             node_map=copy.deepcopy(self._node_map),
             is_process_pool_needed=is_process_pool_needed,
             is_thread_pool_needed=is_thread_pool_needed,
+            fuse_chains=fuse_chains,
+            scheduling=scheduling,
         )
 
 
 def build_dag(
     input_node: NodeBase[t.Any],
     output_node: NodeBase[NodeResultT],
+    fuse_chains: bool = False,
+    scheduling: SchedulingPolicy = SchedulingPolicy.topological,
 ) -> DAGLike[NodeResultT]:
     """
     Построить граф путем сборки зависимостей по аннотациям типа (меткам входов)
@@ -334,6 +364,9 @@ def build_dag(
     Args:
         input_node: Входной узел
         output_node: Выходной узел
+        fuse_chains: Исполнять линейные цепочки синхронных узлов пула потоков за одну отправку задачи в пул
+        scheduling: Порядок запуска готовых узлов. При SchedulingPolicy.critical_path первыми запускаются узлы
+                    с самым длинным оставшимся критическим путем по замерам прошлых запусков и подсказкам cost
 
     Returns:
         Граф
@@ -341,7 +374,7 @@ def build_dag(
 
     return (
         AnnotationDAGBuilder()
-        .build(input_node=input_node, output_node=output_node)
+        .build(input_node=input_node, output_node=output_node, fuse_chains=fuse_chains, scheduling=scheduling)
     )
 
 
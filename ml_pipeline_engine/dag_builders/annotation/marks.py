@@ -1,6 +1,7 @@
 import typing as t
 from dataclasses import dataclass
 
+from ml_pipeline_engine.dag.enums import OneOfStrategy
 from ml_pipeline_engine.types import CaseLabel
 from ml_pipeline_engine.types import NodeBase
 
@@ -20,13 +21,29 @@ class InputMark:
 @dataclass(frozen=True)
 class InputOneOfMark:
     nodes: t.List[NodeBase[t.Any]]
+    strategy: OneOfStrategy = OneOfStrategy.sequential
+    hedge_after: t.Optional[float] = None
 
 
-def InputOneOf(nodes: t.List[NodeBase[NodeResultT]]) -> t.Type[NodeResultT]:  # noqa:  N802,RUF100
+def InputOneOf(  # noqa:  N802,RUF100
+    nodes: t.List[NodeBase[NodeResultT]],
+    strategy: OneOfStrategy = OneOfStrategy.sequential,
+    hedge_after: t.Optional[float] = None,
+) -> t.Type[NodeResultT]:
     """
     Принимает список нод, возвращает результат первой успешно выполненной ноды
+
+    Args:
+        nodes: Альтернативы в порядке приоритета.
+        strategy: Стратегия исполнения альтернатив. При OneOfStrategy.hedged следующая альтернатива запускается
+                  не только после ошибки, но и когда текущая исполняется дольше hedge_after.
+                  Из завершившихся успешно альтернатив выбирается самая приоритетная, остальные отменяются.
+                  При OneOfStrategy.race все альтернативы запускаются одновременно, а результат возвращается,
+                  как только не осталось исполняющихся альтернатив с более высоким приоритетом.
+        hedge_after: Задержка в секундах перед запуском следующей альтернативы. Если не указана,
+                     то используется 95-й перцентиль времени исполнения альтернативы в прошлых запусках.
     """
-    return t.cast(t.Any, InputOneOfMark(nodes))
+    return t.cast(t.Any, InputOneOfMark(nodes, OneOfStrategy(strategy), hedge_after))
 
 
 def InputGeneric(node: NodeBase[NodeResultT]) -> t.Type[NodeResultT]:  # noqa:  N802,RUF100
@@ -51,14 +68,30 @@ class SwitchCaseMark:
     switch: NodeBase[t.Any]
     cases: t.List[t.Tuple[str, NodeBase]]
     name: str
+    speculative: bool = False
+    min_probability: float = 0.0
 
 
 def SwitchCase(  # noqa:  N802,RUF100
     switch: NodeBase[t.Any],
     cases: t.List[t.Tuple[CaseLabel, NodeBase[NodeResultT]]],
     name: t.Optional[str] = None,
+    speculative: bool = False,
+    min_probability: float = 0.0,
 ) -> t.Type[NodeResultT]:
-    return t.cast(t.Any, SwitchCaseMark(switch, cases, name))
+    """
+    Выбор результата одной из веток по решению узла switch.
+
+    Args:
+        switch: Узел, который возвращает метку выбранной ветки.
+        cases: Список пар "метка ветки -> узел ветки".
+        name: Имя узла switch.
+        speculative: Исполнять ветки одновременно с узлом switch. Результаты проигравших веток отбрасываются,
+                     события и артефакты создаются только для выбранной ветки.
+        min_probability: Исполнять заранее только ветки, частота выбора которых в прошлых запусках не меньше
+                         указанной. Пока ветка ни разу не выбиралась, исполняются все ветки.
+    """
+    return t.cast(t.Any, SwitchCaseMark(switch, cases, name, speculative, min_probability))
 
 
 @dataclass(frozen=True)
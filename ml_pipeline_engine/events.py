@@ -1,5 +1,6 @@
 import typing as t
 
+from ml_pipeline_engine.node.enums import CircuitState
 from ml_pipeline_engine.types import EventManagerLike
 from ml_pipeline_engine.types import NodeId
 from ml_pipeline_engine.types import PipelineResult
@@ -18,9 +19,15 @@ class EventSourceMixin:
     async def emit_on_node_start(self, node_id: NodeId) -> None:
         await self._emit('on_node_start', node_id=node_id)
 
+    async def emit_on_node_dequeue(self, node_id: NodeId, queue_wait: float) -> None:
+        await self._emit('on_node_dequeue', node_id=node_id, queue_wait=queue_wait)
+
     async def emit_on_node_complete(self, node_id: NodeId, error: t.Optional[Exception]) -> None:
         await self._emit('on_node_complete', node_id=node_id, error=error)
 
+    async def emit_on_circuit_state_change(self, node_id: NodeId, state: CircuitState) -> None:
+        await self._emit('on_circuit_state_change', node_id=node_id, state=state)
+
     async def emit_on_pipeline_start(self) -> None:
         await self._emit('on_pipeline_start')
 
@@ -27,3 +27,19 @@ class RecurrentProcessor(ProcessorBase, RecurrentProtocol):
 
     def next_iteration(self, data: AdditionalDataT) -> Recurrent:
         return Recurrent(data=data)
+
+
+class MicroBatchProcessor(ProcessorBase):
+    """
+    Узел процессора, конкурентные вызовы которого из разных запусков пайплайнов объединяются в пакеты.
+
+    Пакет исполняется одним вызовом process_batch, когда набрано max_batch_size вызовов
+    или прошло max_batch_wait_ms миллисекунд с первого вызова в пакете.
+    Метод process описывает входы узла и не вызывается движком.
+    """
+
+    max_batch_size: t.ClassVar[int] = 32
+    max_batch_wait_ms: t.ClassVar[float] = 5.0
+
+    @abc.abstractmethod
+    def process_batch(self, **kwargs: t.List[t.Any]) -> t.List[NodeResultT]: ...
@@ -7,6 +7,7 @@ class NodeType(str, enum.Enum):
     switch = 'switch'
     input_one_of = 'input_one_of'
     recurrent = 'recurrent'
+    outputs = 'outputs'
 
     @classmethod
     def is_generic(cls, value: str) -> bool:
@@ -29,4 +30,25 @@ class NodeTag(str, enum.Enum):
     process = 'process'
     thread = 'thread'
     non_async = 'non_async'
+    # Корутина узла не ожидает ввода-вывода и исполняется менеджером запуска без создания asyncio.Task
+    inline = 'inline'
+    # Результат узла зависит только от его входов. Если входы не изменились с прошлой итерации рекуррентного
+    # подграфа, узел не исполняется повторно, а возвращает прошлый результат без событий on_node_start
+    # и on_node_complete. Результат get_default повторно не используется
+    pure = 'pure'
     skip_store = 'skip_store'
+    # Узел может быть заменен результатом get_default, если не успевает исполниться до дедлайна запуска
+    degradable = 'degradable'
+
+
+class CircuitState(str, enum.Enum):
+    """
+    Состояния предохранителя узла
+    """
+
+    # Вызовы узла разрешены
+    closed = 'closed'
+    # Узел не вызывается, пока не истечет время сброса
+    open = 'open'
+    # Разрешен один пробный вызов, результат которого закроет или снова откроет предохранитель
+    half_open = 'half_open'
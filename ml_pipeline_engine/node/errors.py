@@ -8,3 +8,15 @@ class ClassExpectedError(BaseNodeError):
 
 class RunMethodExpectedError(BaseNodeError):
     pass
+
+
+class MicroBatchResultSizeError(BaseNodeError):
+    pass
+
+
+class NodeTimeoutError(BaseNodeError):
+    pass
+
+
+class CircuitOpenError(BaseNodeError):
+    pass
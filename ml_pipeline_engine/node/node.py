@@ -1,13 +1,22 @@
 import asyncio
+import contextlib
+import contextvars
 import functools
 import inspect
 import typing as t
 import uuid
+import weakref
 
+from ml_pipeline_engine.context.cancellation import CANCELLATION_TOKEN_KWARG
+from ml_pipeline_engine.context.cancellation import CancellationToken
+from ml_pipeline_engine.context.cancellation import get_cancellation_token
+from ml_pipeline_engine.context.cancellation import set_cancellation_token
 from ml_pipeline_engine.logs import logger_node as logger
 from ml_pipeline_engine.module_loading import get_instance
+from ml_pipeline_engine.node.base_nodes import MicroBatchProcessor
 from ml_pipeline_engine.node.enums import NodeTag
 from ml_pipeline_engine.node.errors import ClassExpectedError
+from ml_pipeline_engine.node.errors import MicroBatchResultSizeError
 from ml_pipeline_engine.node.errors import RunMethodExpectedError
 from ml_pipeline_engine.parallelism import process_pool_registry
 from ml_pipeline_engine.parallelism import threads_pool_registry
@@ -44,6 +53,59 @@ def get_callable_run_method(node: NodeBase) -> t.Callable:
     return node.process
 
 
+def is_thread_pool_node(node: NodeBase) -> bool:
+    """
+    Check if the node is a sync node that is executed in the thread pool
+    """
+
+    tags = node.tags or ()
+
+    return (
+        not inspect.iscoroutinefunction(get_callable_run_method(node))
+        and NodeTag.non_async not in tags
+        and NodeTag.process not in tags
+        and not is_micro_batch_node(node)
+    )
+
+
+def is_inline_node(node: NodeBase) -> bool:
+    """
+    Check if the node is cheap enough to be executed by the run manager without creating a task.
+    Such a node never suspends: it has neither a timeout, a concurrency limit nor a delay between attempts.
+    """
+
+    tags = node.tags or ()
+
+    return (
+        (
+            NodeTag.non_async in tags
+            or (NodeTag.inline in tags and inspect.iscoroutinefunction(get_callable_run_method(node)))
+        )
+        and node.timeout is None
+        and node.max_concurrency is None
+        and not node.delay
+        and not is_micro_batch_node(node)
+    )
+
+
+def is_pure_node(node: NodeBase) -> bool:
+    """
+    Check if the node's result depends on its inputs only
+    """
+
+    return NodeTag.pure in (node.tags or ())
+
+
+def is_micro_batch_node(node: NodeBase) -> bool:
+    """
+    Check if the node's calls from concurrent runs are collected into batches
+    """
+
+    return isinstance(node, MicroBatchProcessor) or (
+        isinstance(node, type) and issubclass(node, MicroBatchProcessor)
+    )
+
+
 def run_node_default(node: NodeBase[NodeResultT], **kwargs: t.Any) -> t.Type[NodeResultT]:
     """
     Get default value from the node
@@ -51,12 +113,17 @@ def run_node_default(node: NodeBase[NodeResultT], **kwargs: t.Any) -> t.Type[Nod
     return get_instance(node).get_default(**kwargs)
 
 
-async def run_node(node: NodeBase[NodeResultT], *args: t.Any, node_id: NodeId, **kwargs: t.Any) -> t.Type[NodeResultT]:
+async def _run_method(
+    node: NodeBase[NodeResultT],
+    run_method: t.Callable,
+    *args: t.Any,
+    node_id: NodeId,
+    **kwargs: t.Any,
+) -> t.Any:
     """
-    Run a node in a specific way according to the node's tags
+    Run the node's method in a specific way according to the node's tags
     """
 
-    run_method = get_callable_run_method(node)
     loop = asyncio.get_running_loop()
     tags = node.tags or ()
 
@@ -68,27 +135,212 @@ async def run_node(node: NodeBase[NodeResultT], *args: t.Any, node_id: NodeId, *
         logger.debug('The node will be executed as sync function, node_id=%s', node_id)
         result = run_method(*args, **kwargs)
 
-    else:
-        executor = (
-            process_pool_registry.get_pool_executor()
-            if NodeTag.process in tags
-            else threads_pool_registry.get_pool_executor()
-        )
-
-        logger.debug(
-            'The node will be executed using the executor, executor=%s, node_id=%s',
-            executor.__class__.__name__,
-            node_id,
-        )
+    elif NodeTag.process in tags:
+        logger.debug('The node will be executed using the process pool executor, node_id=%s', node_id)
 
         result = await loop.run_in_executor(
-            executor,
+            process_pool_registry.get_pool_executor(),
             functools.partial(run_method, *args, **kwargs),
         )
 
+    else:
+        logger.debug('The node will be executed using the thread pool executor, node_id=%s', node_id)
+
+        # The thread cannot be interrupted, so the node gets its own token to stop when the execution is cancelled.
+        # A job that has not been started yet is withdrawn from the executor's queue on the cancellation.
+        token = CancellationToken(parent=get_cancellation_token())
+        if accepts_cancellation_token(node, run_method.__name__):
+            kwargs[CANCELLATION_TOKEN_KWARG] = token
+
+        context = contextvars.copy_context()
+        context.run(set_cancellation_token, token)
+
+        try:
+            result = await loop.run_in_executor(
+                threads_pool_registry.get_pool_executor(),
+                functools.partial(context.run, run_method, *args, **kwargs),
+            )
+        except asyncio.CancelledError:
+            token.cancel()
+            raise
+
     return result
 
 
+@functools.lru_cache(maxsize=None)
+def accepts_cancellation_token(node: NodeBase, method_name: str) -> bool:
+    """
+    Check if the node's method receives the cancellation token as an argument
+    """
+
+    return CANCELLATION_TOKEN_KWARG in inspect.signature(getattr(node, method_name)).parameters
+
+
+async def run_node(node: NodeBase[NodeResultT], *args: t.Any, node_id: NodeId, **kwargs: t.Any) -> t.Type[NodeResultT]:
+    """
+    Run a node in a specific way according to the node's tags
+    """
+
+    if is_micro_batch_node(node):
+        return await get_micro_batcher(node).submit(node_id=node_id, **kwargs)
+
+    return await _run_method(node, get_callable_run_method(node), *args, node_id=node_id, **kwargs)
+
+
+def get_callable_batch_method(node: NodeBase) -> t.Optional[t.Callable]:
+    """
+    Get the node's batch method if the node supports batch processing
+    """
+
+    if not callable(getattr(node, 'process_batch', None)):
+        return None
+
+    return get_instance(node).process_batch
+
+
+async def run_node_batch(node: NodeBase[NodeResultT], node_id: NodeId, **kwargs: t.Any) -> t.List[NodeResultT]:
+    """
+    Run the node's batch method. Every kwarg is a list of values, one value per batch item
+    """
+
+    return await _run_method(node, get_callable_batch_method(node), node_id=node_id, **kwargs)
+
+
+class MicroBatcher:
+    """
+    Collects concurrent calls of a node and runs them with a single call of the node's batch method
+    """
+
+    def __init__(self, node: NodeBase, loop: asyncio.AbstractEventLoop) -> None:
+        self.node = node
+        self.loop = loop
+
+        self._pending: t.List[t.Tuple[NodeId, t.Dict[str, t.Any], asyncio.Future]] = []
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+        self._tasks: t.Set[asyncio.Task] = set()
+
+    async def submit(self, node_id: NodeId, **kwargs: t.Any) -> t.Any:
+        """
+        Add the call to the current batch and wait for its result
+        """
+
+        future = self.loop.create_future()
+        self._pending.append((node_id, kwargs, future))
+
+        if len(self._pending) >= self.node.max_batch_size:
+            self._flush()
+
+        elif self._timer is None:
+            self._timer = self.loop.call_later(self.node.max_batch_wait_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+
+        task = self.loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: t.List[t.Tuple[NodeId, t.Dict[str, t.Any], asyncio.Future]]) -> None:
+        # Calls with different kwargs cannot be stacked into lists, so they are executed as separate batches
+        groups: t.Dict[t.FrozenSet[str], t.List[t.Tuple[NodeId, t.Dict[str, t.Any], asyncio.Future]]] = {}
+        for call in batch:
+            groups.setdefault(frozenset(call[1]), []).append(call)
+
+        for kwarg_names, calls in groups.items():
+            node_id = calls[0][0]
+            logger.debug('Run the batch of %s calls, node_id=%s', len(calls), node_id)
+
+            try:
+                results = await run_node_batch(
+                    self.node,
+                    node_id=node_id,
+                    **{kwarg_name: [kwargs[kwarg_name] for _, kwargs, _ in calls] for kwarg_name in kwarg_names},
+                )
+
+                if len(results) != len(calls):
+                    raise MicroBatchResultSizeError(node_id, len(calls), len(results))
+
+            except Exception as ex:
+                for _, _, future in calls:
+                    if not future.done():
+                        future.set_exception(ex)
+
+                continue
+
+            for (_, _, future), result in zip(calls, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+_micro_batchers: t.Dict[NodeBase, MicroBatcher] = {}
+
+
+def get_micro_batcher(node: NodeBase) -> MicroBatcher:
+    """
+    Get the batcher that is shared by all runs of the node in the running event loop
+    """
+
+    loop = asyncio.get_running_loop()
+    batcher = _micro_batchers.get(node)
+
+    if batcher is None or batcher.loop is not loop:
+        batcher = _micro_batchers[node] = MicroBatcher(node, loop)
+
+    return batcher
+
+
+class ConcurrencyLimiter:
+    """
+    Limits the number of concurrent executions of a node across all runs in the event loop
+    """
+
+    def __init__(self, limit: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.limit = limit
+        self.loop = loop
+
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> t.AsyncIterator[float]:
+        """
+        Wait for a free slot and hold it within the context. Yields the time spent in the queue in seconds.
+        """
+
+        started_at = self.loop.time()
+
+        async with self._semaphore:
+            yield self.loop.time() - started_at
+
+
+_concurrency_limiters: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, t.Dict[NodeBase, ConcurrencyLimiter]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_concurrency_limiter(node: NodeBase) -> ConcurrencyLimiter:
+    """
+    Get the limiter that is shared by all runs of the node in the running event loop.
+
+    Every event loop has its own limiters, so max_concurrency caps the executions of the node per event loop.
+    The limiters of the other loops stay untouched, and they are dropped together with their loop.
+    """
+
+    loop = asyncio.get_running_loop()
+    limiters = _concurrency_limiters.setdefault(loop, {})
+    limiter = limiters.get(node)
+
+    if limiter is None:
+        limiter = limiters[node] = ConcurrencyLimiter(node.max_concurrency, loop)
+
+    return limiter
+
+
 def build_node(
     node: NodeBase,
     node_name: t.Optional[str] = None,
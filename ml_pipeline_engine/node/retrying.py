@@ -1,11 +1,187 @@
+import random
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
+from typing import Deque
+from typing import Dict
+from typing import Optional
 from typing import Tuple
 from typing import Type
 
+from ml_pipeline_engine.node.enums import CircuitState
+from ml_pipeline_engine.node.errors import CircuitOpenError
 from ml_pipeline_engine.types import NodeBase
 from ml_pipeline_engine.types import RetryPolicyLike
 
 
+class RetryBudget:
+    """
+    Limits the retries of a node to a share of its calls in a sliding time window.
+    A few retries are allowed in every window, so the nodes that are called rarely can be retried too.
+    """
+
+    def __init__(self, ratio: float, window: float = 10.0, min_retries: int = 10) -> None:
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+
+        self._calls: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def record_call(self) -> None:
+        with self._lock:
+            self._calls.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """
+        Spend a retry if the budget is not used up
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            for timestamps in (self._calls, self._retries):
+                while timestamps and timestamps[0] < now - self.window:
+                    timestamps.popleft()
+
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._calls):
+                return False
+
+            self._retries.append(now)
+            return True
+
+
+_retry_budgets: Dict[NodeBase, RetryBudget] = {}
+
+
+def get_retry_budget(node: NodeBase) -> Optional[RetryBudget]:
+    """
+    Get the retry budget that is shared by all runs of the node in the process
+    """
+
+    if node.retry_budget is None:
+        return None
+
+    budget = _retry_budgets.get(node)
+
+    if budget is None:
+        budget = _retry_budgets[node] = RetryBudget(node.retry_budget)
+
+    return budget
+
+
+class CircuitBreaker:
+    """
+    Stops calling a node while the share of its failed calls in a sliding time window is too high.
+    After the reset timeout a single probe call is let through:
+    its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        reset_timeout: float = 30.0,
+        window: float = 10.0,
+        min_calls: int = 10,
+    ) -> None:
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.window = window
+        self.min_calls = min_calls
+
+        self.state = CircuitState.closed
+
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[CircuitState]:
+        """
+        Let a call through or raise CircuitOpenError. Returns the new state if the call has changed it.
+        """
+
+        with self._lock:
+            new_state = None
+
+            if self.state == CircuitState.open and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = new_state = CircuitState.half_open
+
+            if self.state == CircuitState.open or (self.state == CircuitState.half_open and self._probe_in_flight):
+                raise CircuitOpenError(self.state)
+
+            if self.state == CircuitState.half_open:
+                self._probe_in_flight = True
+
+            return new_state
+
+    def record(self, success: bool) -> Optional[CircuitState]:
+        """
+        Record the outcome of the call. Returns the new state if the outcome has changed it.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            if self.state == CircuitState.half_open:
+                self._probe_in_flight = False
+                return self._set_state(CircuitState.closed if success else CircuitState.open, now)
+
+            # The calls started before the circuit was opened are not taken into account
+            if self.state == CircuitState.open:
+                return None
+
+            self._outcomes.append((now, success))
+
+            while self._outcomes[0][0] < now - self.window:
+                self._outcomes.popleft()
+
+            n_failures = sum(not outcome for _, outcome in self._outcomes)
+
+            if len(self._outcomes) >= self.min_calls and n_failures >= self.threshold * len(self._outcomes):
+                return self._set_state(CircuitState.open, now)
+
+            return None
+
+    def release(self) -> None:
+        """
+        Forget the call that has been cancelled before its outcome is known
+        """
+
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _set_state(self, state: CircuitState, now: float) -> CircuitState:
+        self.state = state
+        self._opened_at = now
+        self._outcomes.clear()
+        return state
+
+
+_circuit_breakers: Dict[NodeBase, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(node: NodeBase) -> Optional[CircuitBreaker]:
+    """
+    Get the circuit breaker that is shared by all runs of the node in the process
+    """
+
+    if node.circuit_breaker_threshold is None:
+        return None
+
+    breaker = _circuit_breakers.get(node)
+
+    if breaker is None:
+        breaker = _circuit_breakers[node] = CircuitBreaker(
+            node.circuit_breaker_threshold,
+            reset_timeout=node.circuit_breaker_reset_timeout,
+        )
+
+    return breaker
+
+
 @dataclass(frozen=True)
 class NodeRetryPolicy(RetryPolicyLike):
     node: NodeBase
@@ -21,3 +197,30 @@ class NodeRetryPolicy(RetryPolicyLike):
     @property
     def exceptions(self) -> Tuple[Type[Exception], ...]:
         return self.node.exceptions or (Exception,)
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self.node.timeout
+
+    def get_delay(self, n_attempts: int) -> float:
+        """
+        Get the delay before the next attempt after the failed attempt number n_attempts
+        """
+
+        delay = self.delay * (self.node.backoff or 1) ** (n_attempts - 1)
+
+        if self.node.max_delay is not None:
+            delay = min(delay, self.node.max_delay)
+
+        if self.node.jitter:
+            delay = random.uniform(0, delay)
+
+        return delay
+
+    def record_call(self) -> None:
+        if (budget := get_retry_budget(self.node)) is not None:
+            budget.record_call()
+
+    def can_retry(self) -> bool:
+        budget = get_retry_budget(self.node)
+        return budget is None or budget.try_spend()
@@ -1,10 +1,14 @@
 import abc
 import typing as t
 from dataclasses import dataclass
+from dataclasses import field
 from uuid import UUID
 
 import networkx as nx
 
+if t.TYPE_CHECKING:
+    from ml_pipeline_engine.node.enums import CircuitState
+
 NodeResultT = t.TypeVar('NodeResultT')
 AdditionalDataT = t.TypeVar('AdditionalDataT', bound=t.Any)
 
@@ -27,6 +31,18 @@ class RetryProtocol(t.Protocol):
     delay: t.ClassVar[t.Optional[t.Union[int, float]]] = None
     exceptions: t.ClassVar[t.Optional[t.Tuple[t.Type[BaseException], ...]]] = None
     use_default: t.ClassVar[bool] = False
+    timeout: t.ClassVar[t.Optional[t.Union[int, float]]] = None
+    # Множитель задержки для каждой следующей попытки и ограничение задержки сверху
+    backoff: t.ClassVar[t.Optional[float]] = None
+    max_delay: t.ClassVar[t.Optional[t.Union[int, float]]] = None
+    # Выбирать задержку случайно от нуля до рассчитанного значения (full jitter)
+    jitter: t.ClassVar[bool] = False
+    # Доля повторных попыток от числа вызовов узла во всех запусках за скользящее окно
+    retry_budget: t.ClassVar[t.Optional[float]] = None
+    # Доля ошибок за скользящее окно, при которой предохранитель перестает вызывать узел во всех запусках
+    circuit_breaker_threshold: t.ClassVar[t.Optional[float]] = None
+    # Время в секундах, через которое открытый предохранитель пропускает пробный вызов
+    circuit_breaker_reset_timeout: t.ClassVar[t.Union[int, float]] = 30
 
     def get_default(self, **kwargs: t.Any) -> NodeResultT:
         ...
@@ -64,6 +80,10 @@ class NodeBase(RetryProtocol, TagProtocol, t.Protocol[NodeResultT]):
     node_type: t.ClassVar[str] = None
     name: t.ClassVar[str] = None
     verbose_name: t.ClassVar[str] = None
+    # Ожидаемое время исполнения узла в секундах, используется для планирования, пока нет замеров
+    cost: t.ClassVar[t.Optional[float]] = None
+    # Максимальное число одновременных исполнений узла во всех запусках всех чартов в рамках одного event loop
+    max_concurrency: t.ClassVar[t.Optional[int]] = None
 
     process: t.Union[
         t.Callable[..., NodeResultT],
@@ -96,6 +116,43 @@ class CaseResult:
     node_id: NodeId
 
 
+@dataclass
+class PipelineRunStats:
+    """
+    Статистика выполнения пайплайна
+    """
+
+    # Количество отправок задач в пул потоков, которых удалось избежать за счет объединения узлов
+    saved_executor_hops: int = 0
+    # Количество узлов, результаты которых переиспользованы из предыдущего запуска
+    reused_nodes: int = 0
+    # Количество веток switch, результаты которых были рассчитаны заранее и использованы
+    speculative_hits: int = 0
+    # Количество деградируемых узлов, вместо исполнения которых использован дефолтный результат из-за дедлайна
+    degraded_nodes: int = 0
+    # Суммарное время ожидания узлами свободного слота из-за ограничения max_concurrency, в секундах
+    queue_wait: float = 0.0
+    # Количество чистых узлов, пропущенных на каждой итерации рекуррентного подграфа из-за неизменных входов,
+    # по конечному узлу подграфа
+    recurrent_skips: t.Dict[NodeId, t.List[int]] = field(default_factory=dict)
+
+
+class AdmissionControllerLike(t.Protocol):
+    """
+    Контроль допуска запусков пайплайна при перегрузке
+    """
+
+    in_flight: int
+    rejected: int
+
+    @property
+    def queued(self) -> int:
+        ...
+
+    def admit(self) -> t.AsyncContextManager[None]:
+        ...
+
+
 class PipelineChartLike(t.Protocol[NodeResultT]):
     """
     Определение пайплайна ML-модели
@@ -107,15 +164,53 @@ class PipelineChartLike(t.Protocol[NodeResultT]):
     entrypoint: t.Optional[t.Union[NodeBase[NodeResultT], 'DAGLike[NodeResultT]']]
     event_managers: t.List[t.Type['EventManagerLike']]
     artifact_store: t.Optional[t.Type['ArtifactStoreLike']]
+    latency_budget: t.Optional[float]
+    admission_controller: t.Optional[AdmissionControllerLike]
 
     async def run(
         self,
         pipeline_id: t.Optional[PipelineId] = None,
         input_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
         meta: t.Optional[t.Dict[str, t.Any]] = None,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+        deadline: t.Optional[float] = None,
     ) -> PipelineResult[NodeResultT]:
         ...
 
+    async def rerun(
+        self,
+        previous_results: t.Union[t.Mapping[NodeId, t.Any], PipelineId],
+        input_kwargs: t.Optional[t.Dict[str, t.Any]] = None,
+        pipeline_id: t.Optional[PipelineId] = None,
+        meta: t.Optional[t.Dict[str, t.Any]] = None,
+        outputs: t.Optional[t.Sequence[NodeBase]] = None,
+    ) -> PipelineResult[NodeResultT]:
+        ...
+
+    async def run_batch(
+        self,
+        input_kwargs: t.Sequence[t.Dict[str, t.Any]],
+        pipeline_ids: t.Optional[t.Sequence[PipelineId]] = None,
+        meta: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> t.List[PipelineResult[NodeResultT]]:
+        ...
+
+
+class CancellationTokenLike(t.Protocol):
+    """
+    Токен отмены исполнения
+    """
+
+    @property
+    def is_cancelled(self) -> bool:
+        ...
+
+    def cancel(self) -> None:
+        ...
+
+    def raise_if_cancelled(self) -> None:
+        ...
+
 
 class PipelineContextLike(t.Protocol):
     """
@@ -130,13 +225,23 @@ class PipelineContextLike(t.Protocol):
     input_kwargs: t.Dict[str, t.Any]
     meta: t.Dict[str, t.Any]
     artifact_store: 'ArtifactStoreLike'
+    stats: PipelineRunStats
+    previous_results: t.Optional['PreviousResultsLike']
+    deadline: t.Optional[float]
+    cancellation_token: CancellationTokenLike
 
     async def emit_on_node_start(self, node_id: NodeId) -> t.Any:
         ...
 
+    async def emit_on_node_dequeue(self, node_id: NodeId, queue_wait: float) -> t.Any:
+        ...
+
     async def emit_on_node_complete(self, node_id: NodeId, error: t.Optional[Exception]) -> t.Any:
         ...
 
+    async def emit_on_circuit_state_change(self, node_id: NodeId, state: 'CircuitState') -> t.Any:
+        ...
+
     async def emit_on_pipeline_start(self) -> t.Any:
         ...
 
@@ -169,9 +274,15 @@ class EventManagerLike(t.Protocol):
     async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:
         ...
 
+    async def on_node_dequeue(self, ctx: PipelineContextLike, node_id: NodeId, queue_wait: float) -> None:
+        ...
+
     async def on_node_complete(self, ctx: PipelineContextLike, node_id: NodeId, error: t.Optional[Exception]) -> None:
         ...
 
+    async def on_circuit_state_change(self, ctx: PipelineContextLike, node_id: NodeId, state: 'CircuitState') -> None:
+        ...
+
 
 class ArtifactStoreLike(t.Protocol):
     """
@@ -188,6 +299,15 @@ class ArtifactStoreLike(t.Protocol):
         ...
 
 
+class PreviousResultsLike(t.Protocol):
+    """
+    Результаты узлов предыдущего запуска пайплайна, которые можно переиспользовать при повторном запуске
+    """
+
+    async def get(self, node_id: NodeId, default: t.Any = None) -> t.Any:
+        ...
+
+
 class RetryPolicyLike(t.Protocol):
     node: NodeBase
 
@@ -206,6 +326,23 @@ class RetryPolicyLike(t.Protocol):
     def exceptions(self) -> t.Tuple[t.Type[Exception]]:
         ...
 
+    @property
+    @abc.abstractmethod
+    def timeout(self) -> t.Optional[float]:
+        ...
+
+    @abc.abstractmethod
+    def get_delay(self, n_attempts: int) -> float:
+        ...
+
+    @abc.abstractmethod
+    def record_call(self) -> None:
+        ...
+
+    @abc.abstractmethod
+    def can_retry(self) -> bool:
+        ...
+
 
 class DAGRunManagerLike(t.Protocol):
     """
@@ -220,6 +357,76 @@ class DAGRunManagerLike(t.Protocol):
         ...
 
 
+class LatencyProfileLike(t.Protocol):
+    """
+    Профиль времени исполнения узлов графа, накопленный за прошлые запуски
+    """
+
+    n_samples: int
+
+    def add(self, node_id: NodeId, latency: float) -> None:
+        ...
+
+    def get_quantile(self, node_id: NodeId, quantile: float) -> t.Optional[float]:
+        ...
+
+
+class DAGPlanLike(t.Protocol):
+    """
+    Скомпилированный план исполнения графа
+    """
+
+    node_ids: t.Tuple[NodeId, ...]
+    node_index: t.Mapping[NodeId, int]
+    thread_pool_nodes: t.FrozenSet[NodeId]
+    has_control_flow: bool
+    is_sync: bool
+    fused_chains: t.Mapping[NodeId, t.Tuple[NodeId, ...]]
+    recurrent_nodes: t.FrozenSet[NodeId]
+    inline_nodes: t.FrozenSet[NodeId]
+    speculative_switches: t.Mapping[NodeId, t.Tuple[float, t.Tuple[t.Any, ...]]]
+
+    def get_predecessors(self, node_id: NodeId) -> t.Tuple[NodeId, ...]:
+        ...
+
+    def get_successors(self, node_id: NodeId) -> t.Tuple[NodeId, ...]:
+        ...
+
+    def get_kwarg_bindings(self, node_id: NodeId) -> t.Tuple[t.Tuple[str, NodeId], ...]:
+        ...
+
+    def is_switch(self, node_id: NodeId) -> bool:
+        ...
+
+    def is_head_of_oneof(self, node_id: NodeId) -> bool:
+        ...
+
+    def get_switch_cases(self, node_id: NodeId) -> t.Tuple[NodeId, t.Mapping[CaseLabel, NodeId]]:
+        ...
+
+    def get_branch_switches(self, node_id: NodeId) -> t.FrozenSet[NodeId]:
+        ...
+
+    def get_fused_chain(self, node_id: NodeId) -> t.Optional[t.Tuple[NodeId, ...]]:
+        ...
+
+    def is_inline(self, node_id: NodeId) -> bool:
+        ...
+
+    def get_oneof_exclusive_nodes(self, node_id: NodeId) -> t.FrozenSet[NodeId]:
+        ...
+
+    def get_subgraph(
+        self,
+        source: NodeId,
+        dest: NodeId,
+        is_recurrent: bool = False,
+        is_oneof: bool = False,
+        is_nested_oneof: bool = False,
+    ) -> nx.DiGraph:
+        ...
+
+
 class DAGLike(t.Protocol[NodeResultT]):
     """
     Граф
@@ -229,6 +436,9 @@ class DAGLike(t.Protocol[NodeResultT]):
     input_node: NodeId
     output_node: NodeId
     node_map: t.Dict[NodeId, NodeBase]
+    plan: DAGPlanLike
+    branch_counts: t.Dict[NodeId, t.Counter[CaseLabel]]
+    latency_profile: LatencyProfileLike
     run_manager: DAGRunManagerLike
     retry_policy: RetryPolicyLike
     is_process_pool_needed: bool
@@ -238,5 +448,14 @@ class DAGLike(t.Protocol[NodeResultT]):
     async def run(self, ctx: PipelineContextLike) -> NodeResultT:
         ...
 
+    async def run_batch(self, ctxs: t.Sequence[PipelineContextLike]) -> t.List[PipelineResult[NodeResultT]]:
+        ...
+
+    def with_outputs(self, output_nodes: t.Sequence[NodeId]) -> 'DAGLike[t.Dict[NodeId, t.Any]]':
+        ...
+
+    def get_node_order(self, subgraph: nx.DiGraph) -> t.Tuple[NodeId, ...]:
+        ...
+
     def visualize(self, *args: t.Any, **kwargs: t.Any) -> None:
         ...
@@ -11,6 +11,7 @@ from ml_pipeline_engine.dag_builders.annotation import build_dag as build_dag_ba
 from ml_pipeline_engine.parallelism import process_pool_registry
 from ml_pipeline_engine.parallelism import threads_pool_registry
 from ml_pipeline_engine.types import ArtifactStoreLike
+from ml_pipeline_engine.types import DAGRunManagerLike
 from ml_pipeline_engine.types import PipelineChartLike
 
 
@@ -50,15 +51,25 @@ def model_name_op() -> str:
 
 
 @pytest.fixture
-def build_chart() -> t.Callable[..., PipelineChartLike]:
+def run_manager() -> t.Optional[t.Type[DAGRunManagerLike]]:
+    return None
+
+
+@pytest.fixture
+def build_chart(run_manager: t.Optional[t.Type[DAGRunManagerLike]]) -> t.Callable[..., PipelineChartLike]:
     def wrap(
         artifact_store: t.Optional[t.Type[ArtifactStoreLike]] = None,
         *args: t.Any,
         **kwargs: t.Any,
     ) -> PipelineChartLike:
+        dag = build_dag_base(*args, **kwargs)
+
+        if run_manager is not None:
+            dag.run_manager = run_manager
+
         return PipelineChart(
             model_name='no op',
-            entrypoint=build_dag_base(*args, **kwargs),
+            entrypoint=dag,
             artifact_store=artifact_store,
         )
 
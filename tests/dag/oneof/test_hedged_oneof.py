@@ -0,0 +1,174 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag.enums import OneOfStrategy
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+calls: t.List[str] = []
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Primary(ProcessorBase):
+    delay = 0.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('primary_start')
+        await asyncio.sleep(Primary.delay)
+        calls.append('primary_finish')
+        return num * 2
+
+
+class Secondary(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('secondary')
+        await asyncio.sleep(0.01)
+        return num * 3
+
+
+class Out(ProcessorBase):
+    async def process(
+        self,
+        num: InputOneOf([Primary, Secondary], strategy=OneOfStrategy.hedged, hedge_after=0.02),
+    ) -> float:
+        return num
+
+
+class SlowMid(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('slow_mid_start')
+
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            calls.append('slow_mid_cancelled')
+            raise
+
+        calls.append('slow_mid_finish')
+        return num
+
+
+class SlowDest(ProcessorBase):
+    async def process(self, num: Input(SlowMid)) -> float:
+        return num * 2
+
+
+class Tail(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.3)
+        return num
+
+
+class LongRunOut(ProcessorBase):
+    async def process(
+        self,
+        num: InputOneOf([SlowDest, Secondary], strategy=OneOfStrategy.hedged, hedge_after=0.02),
+        tail: Input(Tail),
+    ) -> float:
+        return num + tail
+
+
+class CompletedNodes:
+    node_ids: t.ClassVar[t.List[NodeId]] = []
+
+    async def on_node_complete(
+        self,
+        ctx: PipelineContextLike,  # noqa: ARG002
+        node_id: NodeId,
+        error: t.Optional[Exception],  # noqa: ARG002
+    ) -> None:
+        self.node_ids.append(node_id)
+
+
+class AdaptiveOut(ProcessorBase):
+    async def process(self, num: InputOneOf([Primary, Secondary], strategy=OneOfStrategy.hedged)) -> float:
+        return num
+
+
+async def _run(output_node: t.Type[ProcessorBase], run_manager: t.Type[DAGRunManagerLike]) -> t.Tuple[float, float]:
+    dag = build_dag(input_node=Ident, output_node=output_node)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='hedged_oneof', entrypoint=dag)
+
+    started_at = asyncio.get_running_loop().time()
+    result = await chart.run(input_kwargs=dict(num=2.0))
+
+    assert result.error is None
+    return result.value, asyncio.get_running_loop().time() - started_at
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_slow_alternative_is_hedged(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    calls.clear()
+    Primary.delay = 0.2
+
+    value, elapsed = await _run(Out, run_manager)
+    # The primary alternative has been cancelled, so it never finishes
+    await asyncio.sleep(Primary.delay)
+
+    assert value == 6.0
+    assert elapsed < 0.1
+    assert calls == ['primary_start', 'secondary']
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_fast_alternative_is_not_hedged(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    calls.clear()
+    Primary.delay = 0.0
+
+    assert (await _run(Out, run_manager))[0] == 4.0
+    assert calls == ['primary_start', 'primary_finish']
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_hedge_cancels_inner_nodes_of_lost_alternative(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    calls.clear()
+    CompletedNodes.node_ids = []
+
+    dag = build_dag(input_node=Ident, output_node=LongRunOut)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='hedged_oneof', entrypoint=dag, event_managers=[CompletedNodes])
+    result = await chart.run(input_kwargs=dict(num=2.0))
+
+    assert result.error is None
+    assert result.value == 8.0
+    assert calls == ['slow_mid_start', 'secondary', 'slow_mid_cancelled']
+    assert get_node_id(SlowMid) not in CompletedNodes.node_ids
+    assert get_node_id(Tail) in CompletedNodes.node_ids
+
+
+async def test_hedging_delay_from_latency_profile() -> None:
+    dag = build_dag(input_node=Ident, output_node=AdaptiveOut)
+    chart = PipelineChart(model_name='hedged_oneof', entrypoint=dag)
+    Primary.delay = 0.0
+
+    # There are no latency samples yet, so the alternatives are not hedged
+    for _ in range(dag.latency_profile.min_samples):
+        assert (await chart.run(input_kwargs=dict(num=2.0))).value == 4.0
+
+    assert dag.latency_profile.get_quantile(get_node_id(Primary), 0.95) < 0.02
+
+    calls.clear()
+    Primary.delay = 0.2
+    started_at = asyncio.get_running_loop().time()
+
+    assert (await chart.run(input_kwargs=dict(num=2.0))).value == 6.0
+    assert asyncio.get_running_loop().time() - started_at < 0.1
+    assert calls == ['primary_start', 'secondary']
@@ -107,7 +107,7 @@ async def test_oneof_recurrent_with_reduce(
     ]))
     output_node = build_node(OutputNode, value=Input(one_of_chains))
     chart = build_chart(input_node=InputNode, output_node=output_node)
-    result = await chart.run(input_kwargs={'value': chart_input})
+    result = await chart.run(input_kwargs={'value': dict(chart_input)})
 
     assert isinstance(result.error, error_type)
     assert pytest.test_retry_attempts == attempts
@@ -0,0 +1,197 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag.enums import OneOfStrategy
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+calls: t.List[str] = []
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Primary(ProcessorBase):
+    delay = 0.0
+    fail = False
+
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('primary_start')
+        await asyncio.sleep(Primary.delay)
+
+        if Primary.fail:
+            raise ValueError(num)
+
+        calls.append('primary_finish')
+        return num * 2
+
+
+class Secondary(ProcessorBase):
+    delay = 0.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('secondary_start')
+        await asyncio.sleep(Secondary.delay)
+        calls.append('secondary_finish')
+        return num * 3
+
+
+class Out(ProcessorBase):
+    async def process(self, num: InputOneOf([Primary, Secondary], strategy=OneOfStrategy.race)) -> float:
+        return num
+
+
+class Fast(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.02)
+        return num
+
+
+class SlowMid(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('slow_mid_start')
+
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            calls.append('slow_mid_cancelled')
+            raise
+
+        calls.append('slow_mid_finish')
+        return num
+
+
+class SlowDest(ProcessorBase):
+    async def process(self, num: Input(SlowMid)) -> float:
+        return num * 2
+
+
+class Tail(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.3)
+        return num
+
+
+class LongRunOut(ProcessorBase):
+    async def process(
+        self,
+        num: InputOneOf([Fast, SlowDest], strategy=OneOfStrategy.race),
+        tail: Input(Tail),
+    ) -> float:
+        return num + tail
+
+
+class SharedMidOut(ProcessorBase):
+    async def process(
+        self,
+        num: InputOneOf([Fast, SlowDest], strategy=OneOfStrategy.race),
+        mid: Input(SlowMid),
+    ) -> float:
+        return num + mid
+
+
+class CompletedNodes:
+    node_ids: t.ClassVar[t.List[NodeId]] = []
+
+    async def on_node_complete(
+        self,
+        ctx: PipelineContextLike,  # noqa: ARG002
+        node_id: NodeId,
+        error: t.Optional[Exception],  # noqa: ARG002
+    ) -> None:
+        self.node_ids.append(node_id)
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+@pytest.mark.parametrize(
+    'primary_delay, primary_fail, secondary_delay, expected_value, expected_calls',
+    [
+        # The secondary alternative finishes first, but the primary one has the higher priority
+        (0.05, False, 0.0, 4.0, ['primary_finish', 'primary_start', 'secondary_finish', 'secondary_start']),
+        # The primary alternative wins at once, the secondary one is cancelled
+        (0.0, False, 0.2, 4.0, ['primary_finish', 'primary_start', 'secondary_start']),
+        # The secondary alternative is used as soon as the primary one fails
+        (0.0, True, 0.01, 6.0, ['primary_start', 'secondary_finish', 'secondary_start']),
+    ],
+)
+async def test_race_oneof(
+    run_manager: t.Type[DAGRunManagerLike],
+    primary_delay: float,
+    primary_fail: bool,
+    secondary_delay: float,
+    expected_value: float,
+    expected_calls: t.List[str],
+) -> None:
+    calls.clear()
+    Primary.delay, Primary.fail, Secondary.delay = primary_delay, primary_fail, secondary_delay
+
+    dag = build_dag(input_node=Ident, output_node=Out)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='race_oneof', entrypoint=dag)
+
+    started_at = asyncio.get_running_loop().time()
+    result = await chart.run(input_kwargs=dict(num=2.0))
+    elapsed = asyncio.get_running_loop().time() - started_at
+
+    await asyncio.sleep(max(primary_delay, secondary_delay))
+
+    assert result.error is None
+    assert result.value == expected_value
+    assert elapsed < max(primary_delay, 0.01) + 0.05
+    assert sorted(calls) == expected_calls
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_race_cancels_inner_nodes_of_lost_alternative(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    calls.clear()
+    CompletedNodes.node_ids = []
+
+    dag = build_dag(input_node=Ident, output_node=LongRunOut)
+    dag.run_manager = run_manager
+
+    (oneof_node_id,) = dag.plan.oneof_heads
+    assert dag.plan.get_oneof_exclusive_nodes(oneof_node_id) == {
+        get_node_id(Fast),
+        get_node_id(SlowMid),
+        get_node_id(SlowDest),
+    }
+
+    chart = PipelineChart(model_name='race_oneof', entrypoint=dag, event_managers=[CompletedNodes])
+    result = await chart.run(input_kwargs=dict(num=2.0))
+
+    assert result.error is None
+    assert result.value == 4.0
+    assert calls == ['slow_mid_start', 'slow_mid_cancelled']
+    assert get_node_id(SlowMid) not in CompletedNodes.node_ids
+    assert get_node_id(Tail) in CompletedNodes.node_ids
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_race_keeps_shared_nodes_of_lost_alternative(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    calls.clear()
+
+    dag = build_dag(input_node=Ident, output_node=SharedMidOut)
+    dag.run_manager = run_manager
+
+    (oneof_node_id,) = dag.plan.oneof_heads
+    assert dag.plan.get_oneof_exclusive_nodes(oneof_node_id) == {get_node_id(Fast), get_node_id(SlowDest)}
+
+    result = await PipelineChart(model_name='race_oneof', entrypoint=dag).run(input_kwargs=dict(num=2.0))
+
+    assert result.error is None
+    assert result.value == 4.0
+    assert calls == ['slow_mid_start', 'slow_mid_finish']
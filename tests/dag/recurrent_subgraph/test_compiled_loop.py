@@ -0,0 +1,110 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import Recurrent
+
+ITERATIONS = 20
+
+
+class Counter(RecurrentProcessor):
+    async def process(self, num: float, additional_data: t.Optional[AdditionalDataT] = None) -> float:
+        return (num if additional_data is None else additional_data) + 1
+
+
+class Pass(RecurrentProcessor):
+    async def process(self, num: Input(Counter)) -> float:
+        return num
+
+
+class Left(RecurrentProcessor):
+    async def process(self, num: Input(Counter)) -> float:
+        return num
+
+
+class Right(RecurrentProcessor):
+    async def process(self, num: Input(Counter)) -> float:
+        return num
+
+
+class InlineLeft(Left):
+    tags = (NodeTag.inline,)
+
+
+class InlineRight(Right):
+    tags = (NodeTag.inline,)
+
+
+class ChainDest(RecurrentProcessor):
+    async def process(self, num: Input(Pass)) -> t.Union[Recurrent, float]:
+        return self.next_iteration(num) if num < ITERATIONS else num
+
+
+class BranchesDest(RecurrentProcessor):
+    async def process(self, left: Input(Left), right: Input(Right)) -> t.Union[Recurrent, float]:
+        return self.next_iteration(left) if left < ITERATIONS else left + right
+
+
+class InlineBranchesDest(RecurrentProcessor):
+    tags = (NodeTag.inline,)
+
+    async def process(self, left: Input(InlineLeft), right: Input(InlineRight)) -> t.Union[Recurrent, float]:
+        return self.next_iteration(left) if left < ITERATIONS else left + right
+
+
+def _get_output_node(dest_node: t.Type[RecurrentProcessor]) -> t.Type[ProcessorBase]:
+    loop = RecurrentSubGraph(start_node=Counter, dest_node=dest_node, max_iterations=ITERATIONS)
+
+    class Out(ProcessorBase):
+        async def process(self, num: loop) -> float:
+            return num
+
+    return Out
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+@pytest.mark.parametrize(
+    'dest_node, is_sequential, expected_value',
+    [
+        (ChainDest, True, ITERATIONS),
+        (BranchesDest, False, ITERATIONS * 2),
+        (InlineBranchesDest, True, ITERATIONS * 2),
+    ],
+)
+async def test_compiled_loop(
+    run_manager: t.Type[DAGRunManagerLike],
+    dest_node: t.Type[RecurrentProcessor],
+    is_sequential: bool,
+    expected_value: float,
+    mocker: pytest_mock.MockerFixture,
+) -> None:
+    dag = build_dag(input_node=Counter, output_node=_get_output_node(dest_node))
+    dag.run_manager = run_manager
+
+    recurrent_loop = dag.plan.get_recurrent_loop(get_node_id(Counter), get_node_id(dest_node))
+    assert recurrent_loop.is_sequential is is_sequential
+    assert recurrent_loop.node_ids[0] == get_node_id(Counter)
+    assert recurrent_loop.node_ids[-1] == get_node_id(dest_node)
+
+    create_task_spy = mocker.spy(run_manager, '_create_task')
+    result = await PipelineChart(model_name='compiled_loop', entrypoint=dag).run(input_kwargs=dict(num=0.0))
+
+    assert result.error is None
+    assert result.value == expected_value
+
+    # The sequential body creates neither node tasks nor tasks for the next iterations
+    n_tasks = len(create_task_spy.call_args_list)
+    assert (n_tasks < ITERATIONS) is is_sequential
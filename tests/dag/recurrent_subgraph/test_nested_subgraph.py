@@ -91,6 +91,9 @@ class AddNumbers(ProcessorBase):
 async def test_dag(
     build_chart: t.Callable[..., PipelineChartLike],
 ) -> None:
+    pseudo_process_mocker.mock.reset_mock()
+    double_process_mocker.mock.reset_mock()
+
     chart = build_chart(input_node=InvertNumber, output_node=AddNumbers)
     result = await chart.run(input_kwargs=dict(num=3.0))
     assert result.value == 7.2
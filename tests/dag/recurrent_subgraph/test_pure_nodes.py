@@ -0,0 +1,132 @@
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
+from ml_pipeline_engine.types import Recurrent
+
+
+class Attempt(RecurrentProcessor):
+    async def process(self, query: str, additional_data: t.Optional[AdditionalDataT] = None) -> t.Dict[str, t.Any]:
+        return dict(query=query, attempt=0 if additional_data is None else additional_data + 1)
+
+
+class Query(RecurrentProcessor):
+    tags = (NodeTag.pure,)
+
+    async def process(self, attempt: Input(Attempt)) -> str:
+        return attempt['query']
+
+
+class Embedding(RecurrentProcessor):
+    tags = (NodeTag.pure,)
+    calls = 0
+
+    async def process(self, query: Input(Query)) -> int:
+        Embedding.calls += 1
+        return len(query)
+
+
+class Search(RecurrentProcessor):
+    async def process(self, attempt: Input(Attempt), embedding: Input(Embedding)) -> t.Union[Recurrent, int]:
+        if attempt['attempt'] < 3:
+            return self.next_iteration(attempt['attempt'])
+
+        return embedding + attempt['attempt']
+
+
+class Out(ProcessorBase):
+    async def process(self, num: RecurrentSubGraph(start_node=Attempt, dest_node=Search, max_iterations=5)) -> int:
+        return num
+
+
+class FlakyEmbedding(RecurrentProcessor):
+    tags = (NodeTag.pure,)
+    use_default = True
+    calls = 0
+
+    def get_default(self, **__: t.Any) -> int:
+        return 0
+
+    async def process(self, query: Input(Query)) -> int:
+        FlakyEmbedding.calls += 1
+
+        if FlakyEmbedding.calls == 1:
+            raise ConnectionError(query)
+
+        return len(query)
+
+
+class FlakySearch(RecurrentProcessor):
+    async def process(self, attempt: Input(Attempt), embedding: Input(FlakyEmbedding)) -> t.Union[Recurrent, int]:
+        if attempt['attempt'] < 3:
+            return self.next_iteration(attempt['attempt'])
+
+        return embedding + attempt['attempt']
+
+
+class FlakyOut(ProcessorBase):
+    async def process(
+        self,
+        num: RecurrentSubGraph(start_node=Attempt, dest_node=FlakySearch, max_iterations=5),
+    ) -> int:
+        return num
+
+
+class RecordingEvents:
+    recurrent_skips: t.ClassVar[t.List[t.Dict[NodeId, t.List[int]]]] = []
+
+    async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:  # noqa: ARG002
+        self.recurrent_skips.append(ctx.stats.recurrent_skips)
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_pure_node_is_skipped_while_inputs_repeat(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Attempt, output_node=Out)
+    dag.run_manager = run_manager
+
+    Embedding.calls = 0
+    RecordingEvents.recurrent_skips = []
+
+    chart = PipelineChart(model_name='pure_nodes', entrypoint=dag, event_managers=[RecordingEvents])
+    result = await chart.run(input_kwargs=dict(query='query'))
+
+    assert result.error is None
+    assert result.value == 8
+
+    # The query is extracted again on every iteration, but it stays the same, so the embedding is reused
+    assert Embedding.calls == 1
+    assert RecordingEvents.recurrent_skips == [{get_node_id(Search): [1, 1, 1]}]
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_default_result_of_pure_node_is_not_reused(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Attempt, output_node=FlakyOut)
+    dag.run_manager = run_manager
+
+    FlakyEmbedding.calls = 0
+    RecordingEvents.recurrent_skips = []
+
+    chart = PipelineChart(model_name='pure_nodes', entrypoint=dag, event_managers=[RecordingEvents])
+    result = await chart.run(input_kwargs=dict(query='query'))
+
+    assert result.error is None
+    assert result.value == 8
+
+    # The first run has failed and returned the default, so the embedding is executed again on the next iteration
+    assert FlakyEmbedding.calls == 2
+    assert RecordingEvents.recurrent_skips == [{get_node_id(FlakySearch): [0, 1, 1]}]
@@ -66,6 +66,9 @@ class AddNumbers(ProcessorBase):
 async def test_dag(
     build_chart: t.Callable[..., PipelineChartLike],
 ) -> None:
+    invert_process_mocker.mock.reset_mock()
+    double_default_mocker.mock.reset_mock()
+
     chart = build_chart(input_node=InvertNumber, output_node=AddNumbers)
     result = await chart.run(input_kwargs=dict(num=3))
     assert result.value == -8.8
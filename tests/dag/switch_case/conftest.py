@@ -0,0 +1,12 @@
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.types import DAGRunManagerLike
+
+
+@pytest.fixture(params=[DAGRunConcurrentManager, DAGRunDependencyManager])
+def run_manager(request: pytest.FixtureRequest) -> t.Type[DAGRunManagerLike]:
+    return request.param
@@ -0,0 +1,166 @@
+import asyncio
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.context.cancellation import CancellationToken
+from ml_pipeline_engine.context.cancellation import get_cancellation_token
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag.enums import OneOfStrategy
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import DAGRunManagerLike
+
+busy_time: t.Dict[str, float] = {}
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Failing(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.02)
+        raise ValueError(num)
+
+
+class LongWithToken(ProcessorBase):
+    def process(self, num: Input(Ident), cancellation_token: CancellationToken) -> float:
+        started_at = time.monotonic()
+
+        for _ in range(100):
+            if cancellation_token.is_cancelled:
+                break
+
+            time.sleep(0.01)
+
+        busy_time['long'] = time.monotonic() - started_at
+        return num
+
+
+class Queued(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        busy_time['queued'] = 0.0
+        return num
+
+
+class Out(ProcessorBase):
+    def process(self, queued: Input(Queued), long: Input(LongWithToken), failed: Input(Failing)) -> float:
+        return failed + long + queued
+
+
+class LongWithContextToken(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        started_at = time.monotonic()
+
+        while not get_cancellation_token().is_cancelled and time.monotonic() - started_at < 1:
+            time.sleep(0.01)
+
+        busy_time['long'] = time.monotonic() - started_at
+        return num
+
+
+class ContextOut(ProcessorBase):
+    def process(self, failed: Input(Failing), long: Input(LongWithContextToken)) -> float:
+        return failed + long
+
+
+class FastAlternative(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.02)
+        return num
+
+
+class LongInAlternative(ProcessorBase):
+    def process(self, num: Input(Ident), cancellation_token: CancellationToken) -> float:
+        started_at = time.monotonic()
+
+        while not cancellation_token.is_cancelled and time.monotonic() - started_at < 1:
+            time.sleep(0.01)
+
+        busy_time['long'] = time.monotonic() - started_at
+        return num
+
+
+class SlowAlternative(ProcessorBase):
+    def process(self, num: Input(LongInAlternative)) -> float:
+        return num
+
+
+class Tail(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.3)
+        return num
+
+
+class RaceOut(ProcessorBase):
+    def process(
+        self,
+        num: InputOneOf([FastAlternative, SlowAlternative], strategy=OneOfStrategy.race),
+        tail: Input(Tail),
+    ) -> float:
+        return num + tail
+
+
+async def test_failed_run_frees_thread_pool(mocker: pytest_mock.MockerFixture) -> None:
+    # The only worker is occupied by the long node, so the job of the other sync node waits in the queue
+    executor = ThreadPoolExecutor(max_workers=1)
+    mocker.patch.object(threads_pool_registry, 'get_pool_executor', return_value=executor)
+    busy_time.clear()
+
+    chart = PipelineChart(model_name='cancellation', entrypoint=build_dag(input_node=Ident, output_node=Out))
+    result = await chart.run(input_kwargs=dict(num=1.0))
+
+    assert isinstance(result.error, ValueError)
+
+    # The queued job has been withdrawn, the running node has stopped on the token soon after the run failed
+    await asyncio.get_running_loop().run_in_executor(executor, time.sleep, 0)
+
+    assert busy_time.keys() == {'long'}
+    assert busy_time['long'] < 0.2
+
+    executor.shutdown()
+
+
+async def test_token_from_context_in_thread_node() -> None:
+    busy_time.clear()
+
+    chart = PipelineChart(model_name='cancellation', entrypoint=build_dag(input_node=Ident, output_node=ContextOut))
+    result = await chart.run(input_kwargs=dict(num=1.0))
+
+    assert isinstance(result.error, ValueError)
+    assert get_cancellation_token() is None
+
+    for _ in range(20):
+        if 'long' in busy_time:
+            break
+
+        await asyncio.sleep(0.01)
+
+    assert busy_time['long'] < 0.2
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_lost_oneof_alternative_frees_thread_pool(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    busy_time.clear()
+
+    dag = build_dag(input_node=Ident, output_node=RaceOut)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='cancellation', entrypoint=dag)
+    result = await chart.run(input_kwargs=dict(num=1.0))
+
+    assert result.error is None
+    assert result.value == 2.0
+
+    # The node of the lost alternative has stopped on its token long before the run finished
+    assert busy_time['long'] < 0.2
@@ -0,0 +1,109 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.node.enums import CircuitState
+from ml_pipeline_engine.node.errors import CircuitOpenError
+from ml_pipeline_engine.node.retrying import CircuitBreaker
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Datasource(ProcessorBase):
+    circuit_breaker_threshold = 0.5
+    circuit_breaker_reset_timeout = 0.05
+    use_default = True
+    is_down = True
+    calls = 0
+
+    def get_default(self, **__: t.Any) -> float:
+        return 0.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        Datasource.calls += 1
+
+        if Datasource.is_down:
+            raise ConnectionError(num)
+
+        return num
+
+
+class DatasourceWithoutDefault(ProcessorBase):
+    circuit_breaker_threshold = 0.5
+    calls = 0
+
+    async def process(self, num: Input(Ident)) -> float:
+        DatasourceWithoutDefault.calls += 1
+        raise ConnectionError(num)
+
+
+class RecordingEvents:
+    states: t.ClassVar[t.List[t.Tuple[NodeId, CircuitState]]] = []
+
+    async def on_circuit_state_change(self, ctx: PipelineContextLike, node_id: NodeId, state: CircuitState) -> None:  # noqa: ARG002
+        self.states.append((node_id, state))
+
+
+async def test_open_circuit_returns_default_until_probe_succeeds() -> None:
+    chart = PipelineChart(
+        model_name='circuit_breaker',
+        entrypoint=build_dag(input_node=Ident, output_node=Datasource),
+        event_managers=[RecordingEvents],
+    )
+    RecordingEvents.states = []
+
+    results = [await chart.run(input_kwargs=dict(num=1.0)) for _ in range(15)]
+
+    # The circuit has been opened after the minimal number of calls, the rest of the runs don't call the node
+    assert [result.value for result in results] == [0.0] * 15
+    assert Datasource.calls == 10
+    assert RecordingEvents.states == [(get_node_id(Datasource), CircuitState.open)]
+
+    await asyncio.sleep(Datasource.circuit_breaker_reset_timeout)
+    Datasource.is_down = False
+
+    assert (await chart.run(input_kwargs=dict(num=1.0))).value == 1.0
+    assert Datasource.calls == 11
+    assert RecordingEvents.states[1:] == [
+        (get_node_id(Datasource), CircuitState.half_open),
+        (get_node_id(Datasource), CircuitState.closed),
+    ]
+
+
+async def test_open_circuit_fails_fast() -> None:
+    chart = PipelineChart(
+        model_name='circuit_breaker',
+        entrypoint=build_dag(input_node=Ident, output_node=DatasourceWithoutDefault),
+    )
+
+    results = [await chart.run(input_kwargs=dict(num=1.0)) for _ in range(12)]
+
+    assert all(isinstance(result.error, ConnectionError) for result in results[:10])
+    assert all(isinstance(result.error, CircuitOpenError) for result in results[10:])
+    assert DatasourceWithoutDefault.calls == 10
+
+
+@pytest.mark.parametrize('is_down', [True, False])
+def test_probe_decides_circuit_state(is_down: bool) -> None:
+    breaker = CircuitBreaker(threshold=0.5, reset_timeout=0, min_calls=1)
+
+    assert breaker.record(success=False) == CircuitState.open
+    assert breaker.acquire() == CircuitState.half_open
+
+    # Only a single probe call is let through
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+    expected_state = CircuitState.open if is_down else CircuitState.closed
+    assert breaker.record(success=not is_down) == expected_state
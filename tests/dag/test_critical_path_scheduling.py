@@ -0,0 +1,81 @@
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag import SchedulingPolicy
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Short(ProcessorBase):
+    cost = 0.01
+
+    async def process(self, num: Input(Ident)) -> float:
+        return num + 1
+
+
+class LongHead(ProcessorBase):
+    cost = 0.01
+
+    async def process(self, num: Input(Ident)) -> float:
+        return num + 2
+
+
+class LongTail(ProcessorBase):
+    cost = 1.0
+
+    async def process(self, num: Input(LongHead)) -> float:
+        return num * 10
+
+
+class Out(ProcessorBase):
+    async def process(self, long: Input(LongTail), short: Input(Short)) -> float:
+        return short + long
+
+
+class RecordingEvents:
+    events: t.ClassVar[t.List[NodeId]] = []
+
+    async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:  # noqa: ARG002
+        self.events.append(node_id)
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_critical_path_first(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Ident, output_node=Out, scheduling=SchedulingPolicy.critical_path)
+    dag.run_manager = run_manager
+
+    topological_order = dag.plan.get_subgraph(dag.input_node, dag.output_node).topological_order
+    assert topological_order.index(get_node_id(Short)) < topological_order.index(get_node_id(LongHead))
+
+    RecordingEvents.events = []
+    chart = PipelineChart(model_name='critical_path', entrypoint=dag, event_managers=[RecordingEvents])
+
+    assert (await chart.run(input_kwargs=dict(num=1.0))).value == 32.0
+    assert RecordingEvents.events.index(get_node_id(LongHead)) < RecordingEvents.events.index(get_node_id(Short))
+
+
+async def test_measured_latencies_override_cost_hints() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out, scheduling=SchedulingPolicy.critical_path)
+    dag.priorities_refresh_samples = 1
+    subgraph = dag.plan.get_subgraph(dag.input_node, dag.output_node)
+
+    assert dag.get_node_order(subgraph)[1] == get_node_id(LongHead)
+
+    for _ in range(dag.latency_profile.min_samples):
+        dag.latency_profile.add(get_node_id(Short), 5.0)
+
+    assert dag.get_node_order(subgraph)[1] == get_node_id(Short)
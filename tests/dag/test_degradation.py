@@ -0,0 +1,71 @@
+import asyncio
+import typing as t
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Expensive(ProcessorBase):
+    tags = (NodeTag.degradable,)
+    calls = 0
+
+    def get_default(self, **__: t.Any) -> float:
+        return 0.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        Expensive.calls += 1
+        await asyncio.sleep(0.03)
+        return num * 10
+
+
+class Out(ProcessorBase):
+    async def process(self, num: Input(Ident), score: Input(Expensive)) -> float:
+        return num + score
+
+
+class RecordingEvents:
+    degraded_nodes: t.ClassVar[t.List[int]] = []
+
+    async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:  # noqa: ARG002
+        self.degraded_nodes.append(ctx.stats.degraded_nodes)
+
+
+async def test_degradable_node_is_skipped_near_deadline() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    chart = PipelineChart(
+        model_name='degradation',
+        entrypoint=dag,
+        event_managers=[RecordingEvents],
+        latency_budget=1.0,
+    )
+
+    Expensive.calls = 0
+    RecordingEvents.degraded_nodes = []
+
+    # The latency profile is collected while the runs fit into the budget
+    for _ in range(dag.latency_profile.min_samples):
+        assert (await chart.run(input_kwargs=dict(num=1.0))).value == 11.0
+
+    assert dag.latency_profile.get_quantile(get_node_id(Expensive), 0.95) >= 0.03
+    assert RecordingEvents.degraded_nodes == [0] * dag.latency_profile.min_samples
+
+    Expensive.calls = 0
+    started_at = asyncio.get_running_loop().time()
+    result = await chart.run(input_kwargs=dict(num=1.0), deadline=0.02)
+
+    assert result.error is None
+    assert result.value == 1.0
+    assert asyncio.get_running_loop().time() - started_at < 0.02
+    assert Expensive.calls == 0
+    assert RecordingEvents.degraded_nodes[-1] == 1
@@ -0,0 +1,116 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag.manager import DAGConcurrentManagerLock
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import PipelineChartLike
+from ml_pipeline_engine.types import Recurrent
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class SwitchNode(ProcessorBase):
+    def process(self, num: Input(Ident)) -> str:
+        return 'double' if num > 0 else 'invert'
+
+
+class DoubleNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return num * 2
+
+
+class InvertNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class FailedSource(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        raise RuntimeError(num)
+
+
+class Fallback(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return num * 3
+
+
+class Seed(ProcessorBase):
+    def process(self, num: Input(Ident), additional_data: t.Optional[AdditionalDataT] = None) -> float:
+        return num if additional_data is None else additional_data
+
+
+class Limit(RecurrentProcessor):
+    use_default = True
+
+    def get_default(self, **__: t.Any) -> float:
+        return 0.0
+
+    def process(self, num: Input(Seed)) -> t.Union[Recurrent, float]:
+        if num < 10:
+            return self.next_iteration(num + 5)
+
+        return num
+
+
+class Out(ProcessorBase):
+    def process(
+        self,
+        case: SwitchCase(switch=SwitchNode, cases=[('double', DoubleNumber), ('invert', InvertNumber)], name='case'),
+        source: InputOneOf([FailedSource, Fallback]),
+        limit: RecurrentSubGraph(start_node=Seed, dest_node=Limit, max_iterations=3),
+    ) -> float:
+        return case + source + limit
+
+
+class FailedOut(ProcessorBase):
+    def process(self, num: Input(DoubleNumber)) -> float:
+        raise RuntimeError(num)
+
+
+def _build_chart(output_node: NodeBase) -> PipelineChartLike:
+    dag = build_dag(input_node=Ident, output_node=output_node)
+    dag.run_manager = DAGRunDependencyManager
+
+    return PipelineChart(model_name='dependency_manager', entrypoint=dag)
+
+
+@pytest.mark.parametrize(
+    'num, expect',
+    [
+        (1.0, 16.0),
+        (-1.0, 12.0),
+    ],
+)
+async def test_control_flow(mocker: pytest_mock.MockerFixture, num: float, expect: float) -> None:
+    wait_spy = mocker.spy(DAGConcurrentManagerLock, 'wait_for_condition')
+    unlock_spy = mocker.spy(DAGConcurrentManagerLock, 'unlock_condition')
+
+    result = await _build_chart(Out).run(input_kwargs=dict(num=num))
+
+    assert result.error is None
+    assert result.value == expect
+
+    assert wait_spy.call_count == 0
+    assert unlock_spy.call_count == 0
+
+
+async def test_error() -> None:
+    result = await _build_chart(FailedOut).run(input_kwargs=dict(num=2.0))
+
+    assert isinstance(result.error, RuntimeError)
+    assert result.error.args == (4.0,)
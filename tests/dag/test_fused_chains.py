@@ -0,0 +1,147 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class AddOne(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        RecordingEvents.events.append(('process', get_node_id(AddOne), ''))
+        return num + 1
+
+
+class FlakyDouble(ProcessorBase):
+    attempts = 2
+    delay = 0
+    calls = 0
+
+    def process(self, num: Input(AddOne)) -> float:
+        FlakyDouble.calls += 1
+
+        if FlakyDouble.calls % 2:
+            raise ValueError('flaky')
+
+        return num * 2
+
+
+class FailedWithDefault(ProcessorBase):
+    use_default = True
+
+    def get_default(self, num: float) -> float:
+        return num * 10
+
+    def process(self, num: Input(FlakyDouble)) -> float:
+        raise RuntimeError(num)
+
+
+class Invert(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class Add(ProcessorBase):
+    async def process(self, first: Input(FailedWithDefault), second: Input(Invert)) -> float:
+        return first + second
+
+
+class RecordingEvents:
+    events: t.ClassVar[t.List[t.Tuple[str, NodeId, str]]] = []
+    saved_executor_hops: t.ClassVar[t.List[int]] = []
+
+    async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:  # noqa: ARG002
+        self.events.append(('start', node_id, ''))
+
+    async def on_node_complete(
+        self,
+        ctx: PipelineContextLike,  # noqa: ARG002
+        node_id: NodeId,
+        error: t.Optional[Exception],
+    ) -> None:
+        self.events.append(('complete', node_id, repr(error) if error else ''))
+
+    async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:  # noqa: ARG002
+        self.saved_executor_hops.append(ctx.stats.saved_executor_hops)
+
+
+def test_plan_contains_chain() -> None:
+    dag = build_dag(input_node=Ident, output_node=Add, fuse_chains=True)
+
+    assert dict(dag.plan.fused_chains) == {
+        get_node_id(AddOne): (get_node_id(AddOne), get_node_id(FlakyDouble), get_node_id(FailedWithDefault)),
+    }
+    assert not build_dag(input_node=Ident, output_node=Add).plan.fused_chains
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_fused_chain_run(mocker: pytest_mock.MockerFixture, run_manager: t.Type[DAGRunManagerLike]) -> None:
+    submit_spy = mocker.spy(threads_pool_registry.get_pool_executor(), 'submit')
+    runs = []
+
+    for fuse_chains in (False, True):
+        FlakyDouble.calls = 0
+        RecordingEvents.events = []
+        RecordingEvents.saved_executor_hops = []
+        submit_spy.reset_mock()
+
+        dag = build_dag(input_node=Ident, output_node=Add, fuse_chains=fuse_chains)
+        dag.run_manager = run_manager
+
+        chart = PipelineChart(model_name='fused_chains', entrypoint=dag, event_managers=[RecordingEvents])
+        result = await chart.run(input_kwargs=dict(num=2.0))
+
+        assert result.error is None
+        runs.append((result.value, sorted(RecordingEvents.events)))
+
+        if fuse_chains:
+            assert submit_spy.call_count == 1
+            assert RecordingEvents.saved_executor_hops == [2]
+        else:
+            assert submit_spy.call_count == 4
+            assert RecordingEvents.saved_executor_hops == [0]
+
+    assert runs[0] == runs[1]
+    assert runs[1][0] == 58.0
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_fused_chain_emits_events_while_nodes_run(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    FlakyDouble.calls = 0
+    RecordingEvents.events = []
+
+    dag = build_dag(input_node=Ident, output_node=Add, fuse_chains=True)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='fused_chains', entrypoint=dag, event_managers=[RecordingEvents])
+    result = await chart.run(input_kwargs=dict(num=2.0))
+
+    chain = {get_node_id(AddOne), get_node_id(FlakyDouble), get_node_id(FailedWithDefault)}
+
+    assert result.error is None
+    assert [event for event in RecordingEvents.events if event[1] in chain] == [
+        ('start', get_node_id(AddOne), ''),
+        ('process', get_node_id(AddOne), ''),
+        ('complete', get_node_id(AddOne), ''),
+        ('start', get_node_id(FlakyDouble), ''),
+        ('complete', get_node_id(FlakyDouble), "ValueError('flaky')"),
+        ('complete', get_node_id(FlakyDouble), ''),
+        ('start', get_node_id(FailedWithDefault), ''),
+        ('complete', get_node_id(FailedWithDefault), ''),
+    ]
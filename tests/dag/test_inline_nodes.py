@@ -0,0 +1,89 @@
+import asyncio
+import typing as t
+
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import NodeTag
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Cheap(ProcessorBase):
+    tags = (NodeTag.inline,)
+
+    async def process(self, num: Input(Ident)) -> float:
+        return num + 1
+
+
+class NonAsync(ProcessorBase):
+    tags = (NodeTag.non_async,)
+
+    def process(self, num: Input(Cheap)) -> float:
+        return num * 2
+
+
+class Remote(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.01)
+        return num
+
+
+class Out(ProcessorBase):
+    tags = (NodeTag.non_async,)
+
+    def process(self, num: Input(NonAsync), remote: Input(Remote)) -> float:
+        return num + remote
+
+
+class FailingCheap(ProcessorBase):
+    tags = (NodeTag.non_async,)
+
+    def process(self, num: Input(Ident)) -> float:
+        raise ValueError(num)
+
+
+class RecordingManager(DAGRunConcurrentManager):
+    instances: t.ClassVar[t.List[DAGRunConcurrentManager]] = []
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self.instances.append(self)
+
+
+async def test_cheap_nodes_are_executed_without_tasks(mocker: pytest_mock.MockerFixture) -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    dag.run_manager = RecordingManager
+
+    assert dag.plan.inline_nodes == {get_node_id(Cheap), get_node_id(NonAsync), get_node_id(Out)}
+
+    RecordingManager.instances = []
+    create_task_spy = mocker.spy(RecordingManager, '_create_task')
+
+    result = await PipelineChart(model_name='inline', entrypoint=dag).run(input_kwargs=dict(num=1.0))
+
+    assert result.value == 5.0
+    assert {call.kwargs.get('name', call.args[-1]) for call in create_task_spy.call_args_list} == {
+        'run',
+        get_node_id(Ident),
+        get_node_id(Remote),
+    }
+
+    # The finished tasks are dropped by the end of the run
+    await asyncio.sleep(0)
+    assert RecordingManager.instances[0]._coro_tasks == set()
+
+
+async def test_error_of_inline_node() -> None:
+    chart = PipelineChart(model_name='inline', entrypoint=build_dag(input_node=Ident, output_node=FailingCheap))
+    result = await chart.run(input_kwargs=dict(num=1.0))
+
+    assert isinstance(result.error, ValueError)
@@ -0,0 +1,75 @@
+import asyncio
+import typing as t
+
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import MicroBatchProcessor
+from ml_pipeline_engine.node import MicroBatchResultSizeError
+from ml_pipeline_engine.node import ProcessorBase
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Model(MicroBatchProcessor):
+    max_batch_size = 4
+    max_batch_wait_ms = 50.0
+
+    def process(self, num: Input(Ident)) -> float:
+        raise NotImplementedError
+
+    def process_batch(self, num: t.List[float]) -> t.List[float]:
+        if any(item < 0 for item in num):
+            raise ValueError(num)
+
+        return [item * 10 for item in num]
+
+
+class BrokenModel(Model):
+    def process_batch(self, num: t.List[float]) -> t.List[float]:
+        return num[1:]
+
+
+class Out(ProcessorBase):
+    async def process(self, num: Input(Model)) -> float:
+        return num + 1
+
+
+class BrokenOut(ProcessorBase):
+    async def process(self, num: Input(BrokenModel)) -> float:
+        return num
+
+
+async def test_concurrent_runs_are_batched(mocker: pytest_mock.MockerFixture) -> None:
+    chart = PipelineChart(model_name='micro_batching', entrypoint=build_dag(input_node=Ident, output_node=Out))
+    process_batch_spy = mocker.spy(Model, 'process_batch')
+
+    results = await asyncio.gather(*(chart.run(input_kwargs=dict(num=float(num))) for num in range(6)))
+
+    assert [result.value for result in results] == [1.0, 11.0, 21.0, 31.0, 41.0, 51.0]
+    assert [call.kwargs for call in process_batch_spy.call_args_list] == [
+        {'num': [0.0, 1.0, 2.0, 3.0]},
+        {'num': [4.0, 5.0]},
+    ]
+
+
+async def test_batch_error_is_scattered() -> None:
+    chart = PipelineChart(model_name='micro_batching', entrypoint=build_dag(input_node=Ident, output_node=Out))
+
+    results = await asyncio.gather(*(chart.run(input_kwargs=dict(num=num)) for num in (1.0, -1.0)))
+    assert [type(result.error) for result in results] == [ValueError, ValueError]
+
+    result = await chart.run(input_kwargs=dict(num=1.0))
+    assert result.value == 11.0
+
+
+async def test_batch_result_size_mismatch() -> None:
+    chart = PipelineChart(model_name='micro_batching', entrypoint=build_dag(input_node=Ident, output_node=BrokenOut))
+    result = await chart.run(input_kwargs=dict(num=1.0))
+
+    assert isinstance(result.error, MicroBatchResultSizeError)
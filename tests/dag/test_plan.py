@@ -0,0 +1,131 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import plan as dag_plan
+from ml_pipeline_engine.dag.errors import SubgraphIsNotCompiledError
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import InputOneOf
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import Recurrent
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class SwitchNode(ProcessorBase):
+    def process(self, num: Input(Ident)) -> str:
+        return 'double' if num > 0 else 'invert'
+
+
+class DoubleNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return num * 2
+
+
+class InvertNumber(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class FailedSource(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        raise RuntimeError(num)
+
+
+class Fallback(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return num * 3
+
+
+class Seed(ProcessorBase):
+    def process(self, num: Input(Ident), additional_data: t.Optional[AdditionalDataT] = None) -> float:
+        return num if additional_data is None else additional_data
+
+
+class Limit(RecurrentProcessor):
+    use_default = True
+
+    def get_default(self, **__: t.Any) -> float:
+        return 0.0
+
+    def process(self, num: Input(Seed)) -> t.Union[Recurrent, float]:
+        if num < 10:
+            return self.next_iteration(num + 5)
+
+        return num
+
+
+class Out(ProcessorBase):
+    def process(
+        self,
+        case: SwitchCase(switch=SwitchNode, cases=[('double', DoubleNumber), ('invert', InvertNumber)], name='case'),
+        source: InputOneOf([FailedSource, Fallback]),
+        limit: RecurrentSubGraph(start_node=Seed, dest_node=Limit, max_iterations=3),
+    ) -> float:
+        return case + source + limit
+
+
+def test_plan_contains_control_flow_subgraphs() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    plan = dag.plan
+
+    input_id, output_id = get_node_id(Ident), get_node_id(Out)
+
+    assert plan.node_ids.index(input_id) == 0
+    assert plan.node_ids.index(output_id) == len(plan.node_ids) - 1
+
+    main_dag = plan.get_subgraph(input_id, output_id)
+    assert main_dag.topological_order[0] == input_id
+    assert main_dag.topological_order[-1] == output_id
+    assert get_node_id(FailedSource) not in main_dag
+
+    for node in (DoubleNumber, InvertNumber):
+        assert (input_id, get_node_id(node), False, False, False) in plan.subgraphs
+
+    for node in (FailedSource, Fallback):
+        assert (input_id, get_node_id(node), False, True, True) in plan.subgraphs
+
+    recurrent_dag = plan.get_subgraph(get_node_id(Seed), get_node_id(Limit), is_recurrent=True)
+    assert recurrent_dag.topological_order == (get_node_id(Seed), get_node_id(Limit))
+
+    assert dict(plan.get_kwarg_bindings(get_node_id(DoubleNumber))) == {'num': input_id}
+
+
+async def test_run_does_not_analyze_graph(mocker: pytest_mock.MockerFixture) -> None:
+    charts = [
+        PipelineChart(model_name='plan', entrypoint=build_dag(input_node=Ident, output_node=Out)) for _ in range(2)
+    ]
+    compile_spy = mocker.spy(dag_plan, 'get_connected_subgraph')
+    get_subgraph_spy = mocker.spy(dag_plan.DAGPlan, 'get_subgraph')
+
+    for chart, num, expect in zip(charts, (1.0, -1.0), (16.0, 12.0)):
+        result = await chart.run(input_kwargs=dict(num=num))
+
+        assert result.error is None
+        assert result.value == expect
+
+    assert compile_spy.call_count == 0
+
+    # Every subgraph requested at run time has been precompiled
+    assert get_subgraph_spy.call_count > 0
+    for call in get_subgraph_spy.call_args_list:
+        plan, *args = call.args
+        assert dag_plan._get_subgraph_key(*args, **call.kwargs) in plan.subgraphs
+
+
+def test_unknown_subgraph_raises() -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+
+    with pytest.raises(SubgraphIsNotCompiledError):
+        dag.plan.get_subgraph(get_node_id(Out), get_node_id(Ident))
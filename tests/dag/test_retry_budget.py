@@ -0,0 +1,72 @@
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node.retrying import NodeRetryPolicy
+from ml_pipeline_engine.node.retrying import RetryBudget
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Backoff(ProcessorBase):
+    delay = 0.1
+    backoff = 2
+    max_delay = 0.3
+
+    async def process(self, num: Input(Ident)) -> float:
+        return num
+
+
+class Unstable(ProcessorBase):
+    attempts = 2
+    retry_budget = 0.1
+    use_default = True
+    calls = 0
+
+    def get_default(self, **__: t.Any) -> float:
+        return 0.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        Unstable.calls += 1
+        raise ValueError(num)
+
+
+def test_exponential_backoff_with_cap() -> None:
+    retry_policy = NodeRetryPolicy(node=Backoff())
+    assert [retry_policy.get_delay(n_attempts) for n_attempts in range(1, 5)] == pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+
+def test_full_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(Backoff, 'jitter', True)
+    retry_policy = NodeRetryPolicy(node=Backoff())
+
+    delays = [retry_policy.get_delay(3) for _ in range(100)]
+
+    assert all(0 <= delay <= 0.3 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_budget_allows_share_of_calls() -> None:
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+
+    for _ in range(4):
+        budget.record_call()
+
+    assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+async def test_exhausted_budget_falls_back_to_default() -> None:
+    chart = PipelineChart(model_name='retry_budget', entrypoint=build_dag(input_node=Ident, output_node=Unstable))
+
+    results = [await chart.run(input_kwargs=dict(num=1.0)) for _ in range(20)]
+
+    assert [result.value for result in results] == [0.0] * 20
+    # 10 retries are always allowed, then the retries are limited by 10% of the calls
+    assert Unstable.calls == 20 + 12
@@ -0,0 +1,118 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineResult
+
+calls: t.List[str] = []
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Decide(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> str:
+        await asyncio.sleep(0.05)
+        return 'double' if num > 0 else 'invert'
+
+
+class Double(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('double')
+        await asyncio.sleep(0.02)
+        return num * 2
+
+
+class AddOne(ProcessorBase):
+    def process(self, num: Input(Double)) -> float:
+        calls.append('add_one')
+        return num + 1
+
+
+class Invert(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        calls.append('invert')
+        await asyncio.sleep(0.05)
+        return -num
+
+
+class Out(ProcessorBase):
+    async def process(
+        self,
+        num: SwitchCase(
+            switch=Decide,
+            cases=[('double', AddOne), ('invert', Invert)],
+            name='speculative',
+            speculative=True,
+            min_probability=0.2,
+        ),
+    ) -> float:
+        return num
+
+
+class RecordingEvents:
+    events: t.ClassVar[t.List[NodeId]] = []
+    speculative_hits: t.ClassVar[t.List[int]] = []
+
+    async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:  # noqa: ARG002
+        self.events.append(node_id)
+
+    async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:  # noqa: ARG002
+        self.speculative_hits.append(ctx.stats.speculative_hits)
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_speculative_switch(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Ident, output_node=Out)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='speculative_switch', entrypoint=dag, event_managers=[RecordingEvents])
+
+    calls.clear()
+    RecordingEvents.events = []
+    RecordingEvents.speculative_hits = []
+
+    started_at = asyncio.get_running_loop().time()
+    result = await chart.run(input_kwargs=dict(num=3.0))
+
+    assert result.value == 7.0
+    assert asyncio.get_running_loop().time() - started_at < 0.095
+    assert sorted(calls) == ['add_one', 'double', 'invert']
+    assert get_node_id(Invert) not in RecordingEvents.events
+    assert RecordingEvents.events.index(get_node_id(Decide)) < RecordingEvents.events.index(get_node_id(Double))
+    assert RecordingEvents.speculative_hits == [1]
+
+    for _ in range(4):
+        assert (await chart.run(input_kwargs=dict(num=3.0))).value == 7.0
+
+    # The "invert" branch has been selected once in 5 runs, so it is not speculated anymore
+    calls.clear()
+    result = await chart.run(input_kwargs=dict(num=-3.0))
+
+    assert result.value == 3.0
+    assert calls == ['double', 'add_one', 'invert']
+    assert RecordingEvents.speculative_hits[-1] == 0
+
+
+def test_plan_contains_speculative_branches() -> None:
+    ((min_probability, branches),) = build_dag(input_node=Ident, output_node=Out).plan.speculative_switches.values()
+
+    assert min_probability == 0.2
+    assert {branch.label: branch.node_ids for branch in branches} == {
+        'double': (get_node_id(Double), get_node_id(AddOne)),
+        'invert': (get_node_id(Invert),),
+    }
@@ -0,0 +1,72 @@
+from ml_pipeline_engine.dag.storage import DAGNodeStorage
+
+
+def _build_storage() -> DAGNodeStorage:
+    node_ids = ('first', 'second', 'third')
+    return DAGNodeStorage(node_ids, {node_id: idx for idx, node_id in enumerate(node_ids)})
+
+
+def test_hidden_result() -> None:
+    storage = _build_storage()
+
+    storage.set_node_result('first', 1)
+    storage.hide_last_execution('first')
+
+    assert not storage.exists_node_result('first')
+    assert storage.exists_node_result('first', with_hidden=True)
+    assert storage.get_node_result('first') is None
+    assert storage.get_node_result('first', with_hidden=True) == 1
+
+    storage.set_node_result('first', 2)
+
+    assert storage.exists_node_result('first')
+    assert storage.get_node_result('first') == 2
+
+
+def test_hide_before_write() -> None:
+    storage = _build_storage()
+
+    storage.hide_node_result('second')
+    assert not storage.exists_node_result('second', with_hidden=True)
+
+    storage.set_node_result('second', None)
+    assert storage.exists_node_result('second')
+
+
+def test_skipped_for_store_is_reset() -> None:
+    storage = _build_storage()
+
+    storage.set_node_skipped_for_store('third')
+    storage.hide_last_execution('third')
+
+    assert not storage.check_node_skipped_for_store('third')
+
+
+def test_nodes_errors_keep_write_order() -> None:
+    storage = _build_storage()
+    first_error, third_error = Exception('first'), Exception('third')
+
+    storage.set_node_result('third', third_error)
+    storage.set_node_result('second', 2)
+    storage.set_node_result('first', first_error)
+
+    assert list(storage.get_nodes_errors().items()) == [('third', third_error), ('first', first_error)]
+
+
+def test_errors_are_tracked_incrementally() -> None:
+    storage = _build_storage()
+    subgraph_indexes = frozenset({0, 1})
+
+    storage.set_node_result('third', Exception('third'))
+    assert not storage.exists_error_in(subgraph_indexes)
+
+    storage.set_node_result('second', Exception('second'))
+    assert storage.exists_error_in(subgraph_indexes)
+
+    storage.hide_last_execution('second')
+    assert not storage.exists_error_in(subgraph_indexes)
+
+    storage.set_node_result('first', Exception('first'))
+    storage.set_node_result('first', 1)
+    assert not storage.exists_error_in(subgraph_indexes)
+    assert storage.exists_error_in(frozenset({2}))
@@ -0,0 +1,148 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunSyncManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.parallelism import threads_pool_registry
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeBase
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class FlakyDouble(ProcessorBase):
+    attempts = 2
+    delay = 0
+    calls = 0
+
+    def process(self, num: Input(Ident)) -> float:
+        FlakyDouble.calls += 1
+
+        if FlakyDouble.calls % 2:
+            raise ValueError('flaky')
+
+        return num * 2
+
+
+class Invert(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class FailedWithDefault(ProcessorBase):
+    use_default = True
+
+    def get_default(self, **__: t.Any) -> float:
+        return 100.0
+
+    def process(self, num: Input(Invert)) -> float:
+        raise RuntimeError(num)
+
+
+class Add(ProcessorBase):
+    def process(self, first: Input(FlakyDouble), second: Input(FailedWithDefault)) -> float:
+        return first + second
+
+
+class AsyncAdd(ProcessorBase):
+    async def process(self, first: Input(FlakyDouble), second: Input(Invert)) -> float:
+        return first + second
+
+
+class FailedOut(ProcessorBase):
+    def process(self, num: Input(Invert)) -> float:
+        raise RuntimeError(num)
+
+
+class DelayedRetryOut(ProcessorBase):
+    attempts = 2
+    delay = 1
+
+    def process(self, num: Input(Invert)) -> float:
+        return num
+
+
+class TracedOut(ProcessorBase):
+    def process(self, num: Input(Invert)) -> float:
+        RecordingEvents.events.append(('process', 'traced_out', ''))
+        return num
+
+
+class RecordingEvents:
+    events: t.ClassVar[t.List[t.Tuple[str, NodeId, str]]] = []
+
+    async def on_node_start(self, ctx: PipelineContextLike, node_id: NodeId) -> None:  # noqa: ARG002
+        self.events.append(('start', node_id, ''))
+
+    async def on_node_complete(
+        self,
+        ctx: PipelineContextLike,  # noqa: ARG002
+        node_id: NodeId,
+        error: t.Optional[Exception],
+    ) -> None:
+        self.events.append(('complete', node_id, repr(error) if error else ''))
+
+
+async def _run(
+    output_node: NodeBase,
+    run_manager: t.Type[DAGRunManagerLike],
+) -> t.Tuple[t.Any, t.Optional[Exception], t.List[t.Tuple[str, NodeId, str]]]:
+    FlakyDouble.calls = 0
+    RecordingEvents.events = []
+
+    dag = build_dag(input_node=Ident, output_node=output_node)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='sync_manager', entrypoint=dag, event_managers=[RecordingEvents])
+    result = await chart.run(input_kwargs=dict(num=3.0))
+
+    return result.value, result.error, sorted(RecordingEvents.events)
+
+
+async def test_sync_dag_runs_in_one_executor_hop(mocker: pytest_mock.MockerFixture) -> None:
+    expected = await _run(Add, DAGRunConcurrentManager)
+    submit_spy = mocker.spy(threads_pool_registry.get_pool_executor(), 'submit')
+
+    assert await _run(Add, DAGRunSyncManager) == expected
+    assert expected[0] == 106.0
+    assert submit_spy.call_count == 1
+
+
+async def test_sync_dag_error() -> None:
+    value, error, events = await _run(FailedOut, DAGRunSyncManager)
+
+    assert value is None
+    assert isinstance(error, RuntimeError)
+    assert events == (await _run(FailedOut, DAGRunConcurrentManager))[2]
+
+
+async def test_sync_dag_emits_events_while_nodes_run() -> None:
+    value, error, _ = await _run(TracedOut, DAGRunSyncManager)
+
+    assert (value, error) == (-3.0, None)
+    assert RecordingEvents.events[-3:] == [
+        ('start', 'processor__tests_dag_test_sync_manager_TracedOut', ''),
+        ('process', 'traced_out', ''),
+        ('complete', 'processor__tests_dag_test_sync_manager_TracedOut', ''),
+    ]
+
+
+@pytest.mark.parametrize('output_node, is_sync', [(Add, True), (AsyncAdd, False), (DelayedRetryOut, False)])
+async def test_plan_detects_sync_dag(output_node: NodeBase, is_sync: bool) -> None:
+    assert build_dag(input_node=Ident, output_node=output_node).plan.is_sync is is_sync
+
+    value, error, _ = await _run(output_node, DAGRunSyncManager)
+
+    assert error is None
+    assert value == (await _run(output_node, DAGRunConcurrentManager))[0]
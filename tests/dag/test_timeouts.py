@@ -0,0 +1,120 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.context.deadline import get_remaining_time
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag import DAGRunSyncManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node.errors import NodeTimeoutError
+from ml_pipeline_engine.types import DAGRunManagerLike
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class SlowWithDefault(ProcessorBase):
+    timeout = 0.02
+    use_default = True
+
+    def get_default(self, **__: t.Any) -> float:
+        return -1.0
+
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(1)
+        return num
+
+
+class SlowOnce(ProcessorBase):
+    timeout = 0.02
+    attempts = 2
+    delay = 0
+    calls = 0
+
+    async def process(self, num: Input(Ident)) -> float:
+        SlowOnce.calls += 1
+
+        if SlowOnce.calls == 1:
+            await asyncio.sleep(1)
+
+        return num * 2
+
+
+class Slow(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(1)
+        return num
+
+
+class Budget(ProcessorBase):
+    async def process(self, _: Input(Ident)) -> t.Optional[float]:
+        return get_remaining_time()
+
+
+class SyncIdent(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class SyncWithTimeout(ProcessorBase):
+    timeout = 0.02
+
+    def process(self, num: Input(SyncIdent)) -> float:
+        return num
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_node_timeout_resolved_via_default(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Ident, output_node=SlowWithDefault)
+    dag.run_manager = run_manager
+
+    started_at = asyncio.get_running_loop().time()
+    result = await PipelineChart(model_name='timeouts', entrypoint=dag).run(input_kwargs=dict(num=2.0))
+
+    assert result.value == -1.0
+    assert asyncio.get_running_loop().time() - started_at < 0.5
+
+
+async def test_node_timeout_retried() -> None:
+    SlowOnce.calls = 0
+    chart = PipelineChart(model_name='timeouts', entrypoint=build_dag(input_node=Ident, output_node=SlowOnce))
+
+    result = await chart.run(input_kwargs=dict(num=2.0))
+
+    assert result.value == 4.0
+    assert SlowOnce.calls == 2
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_run_deadline(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Ident, output_node=Slow)
+    dag.run_manager = run_manager
+
+    started_at = asyncio.get_running_loop().time()
+    result = await PipelineChart(model_name='timeouts', entrypoint=dag).run(input_kwargs=dict(num=2.0), deadline=0.05)
+
+    assert isinstance(result.error, NodeTimeoutError)
+    assert asyncio.get_running_loop().time() - started_at < 0.5
+
+
+async def test_remaining_time_is_visible_to_nodes() -> None:
+    chart = PipelineChart(model_name='timeouts', entrypoint=build_dag(input_node=Ident, output_node=Budget))
+
+    assert 0 < (await chart.run(input_kwargs=dict(num=2.0), deadline=10)).value <= 10
+    assert (await chart.run(input_kwargs=dict(num=2.0))).value is None
+    assert get_remaining_time() is None
+
+
+async def test_node_with_timeout_is_not_executed_in_one_executor_job() -> None:
+    dag = build_dag(input_node=SyncIdent, output_node=SyncWithTimeout)
+    dag.run_manager = DAGRunSyncManager
+
+    assert not dag.plan.is_sync
+    assert (await PipelineChart(model_name='timeouts', entrypoint=dag).run(input_kwargs=dict(num=2.0))).value == 2.0
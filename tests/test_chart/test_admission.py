@@ -0,0 +1,77 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.admission import AdmissionController
+from ml_pipeline_engine.admission import AdmissionRejectedError
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Slow(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        await asyncio.sleep(0.05)
+        return num
+
+
+def _get_chart(controller: AdmissionController) -> PipelineChart:
+    return PipelineChart(
+        model_name='admission',
+        entrypoint=build_dag(input_node=Ident, output_node=Slow),
+        admission_controller=controller,
+    )
+
+
+async def test_fast_rejection() -> None:
+    controller = AdmissionController(max_in_flight=2)
+    chart = _get_chart(controller)
+
+    runs = [asyncio.create_task(chart.run(input_kwargs=dict(num=float(num)))) for num in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert controller.in_flight == 2
+    assert controller.queued == 0
+    assert controller.rejected == 1
+
+    results = await asyncio.gather(*runs)
+
+    assert [result.value for result in results] == [0.0, 1.0, None]
+    assert isinstance(results[2].error, AdmissionRejectedError)
+    assert controller.in_flight == 0
+
+
+@pytest.mark.parametrize(
+    'queue_timeout, expected_values, expected_rejected',
+    [
+        (None, [0.0, 1.0, None], 1),
+        # The queued run is rejected, because the first one is slower than the queue timeout
+        (0.02, [0.0, None, None], 2),
+    ],
+)
+async def test_bounded_queue(
+    queue_timeout: t.Optional[float],
+    expected_values: t.List[t.Optional[float]],
+    expected_rejected: int,
+) -> None:
+    controller = AdmissionController(max_in_flight=1, max_queue_size=1, queue_timeout=queue_timeout)
+    chart = _get_chart(controller)
+
+    runs = [asyncio.create_task(chart.run(input_kwargs=dict(num=float(num)))) for num in range(3)]
+    await asyncio.sleep(0.01)
+
+    # The second run waits in the queue, the third one is rejected at once
+    assert (controller.in_flight, controller.queued, controller.rejected) == (1, 1, 1)
+
+    results = await asyncio.gather(*runs)
+
+    assert [result.value for result in results] == expected_values
+    assert controller.rejected == expected_rejected
+    assert (controller.in_flight, controller.queued) == (0, 0)
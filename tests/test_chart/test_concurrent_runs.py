@@ -0,0 +1,59 @@
+import asyncio
+import random
+import typing as t
+
+import pytest
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import RecurrentSubGraph
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import RecurrentProcessor
+from ml_pipeline_engine.types import AdditionalDataT
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import Recurrent
+
+ValueT = t.Tuple[int, int]
+
+
+class Start(ProcessorBase):
+    async def process(self, num: int, additional_data: t.Optional[AdditionalDataT] = None) -> ValueT:
+        await asyncio.sleep(random.random() / 100)
+        return (num, 0) if additional_data is None else additional_data
+
+
+class Step(RecurrentProcessor):
+    async def process(self, value: Input(Start)) -> t.Union[Recurrent, ValueT]:
+        await asyncio.sleep(random.random() / 100)
+        num, iteration = value
+
+        if iteration < 2:
+            return self.next_iteration((num, iteration + 1))
+
+        return value
+
+
+class Out(ProcessorBase):
+    def process(self, value: RecurrentSubGraph(start_node=Start, dest_node=Step, max_iterations=5)) -> ValueT:
+        return value
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_concurrent_runs_share_chart(run_manager: t.Type[DAGRunManagerLike]) -> None:
+    dag = build_dag(input_node=Start, output_node=Out)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='concurrent_runs', entrypoint=dag)
+    runs = [dict(num=num) for num in range(300)]
+
+    results = await asyncio.gather(*(chart.run(input_kwargs=input_kwargs) for input_kwargs in runs))
+
+    for input_kwargs, result in zip(runs, results):
+        assert result.error is None
+        assert result.value == (input_kwargs['num'], 2)
+        assert input_kwargs.keys() == {'num'}
+
+    assert all(not node_data for _, node_data in dag.graph.nodes(data='additional_data'))
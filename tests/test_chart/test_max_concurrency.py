@@ -0,0 +1,82 @@
+import asyncio
+import typing as t
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ConcurrencyLimiter
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_concurrency_limiter
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Downstream(ProcessorBase):
+    max_concurrency = 2
+    running = 0
+    max_running = 0
+
+    async def process(self, num: Input(Ident)) -> float:
+        Downstream.running += 1
+        Downstream.max_running = max(Downstream.max_running, Downstream.running)
+
+        await asyncio.sleep(0.01)
+
+        Downstream.running -= 1
+        return num * 2
+
+
+class Out(ProcessorBase):
+    def process(self, num: Input(Downstream)) -> float:
+        return num + 1
+
+
+class RecordingEvents:
+    queue_waits: t.ClassVar[t.List[t.Tuple[NodeId, float]]] = []
+
+    async def on_node_dequeue(self, ctx: PipelineContextLike, node_id: NodeId, queue_wait: float) -> None:  # noqa: ARG002
+        self.queue_waits.append((node_id, queue_wait))
+
+
+async def test_max_concurrency_is_shared_by_charts() -> None:
+    charts = [
+        PipelineChart(
+            model_name=f'max_concurrency_{idx}',
+            entrypoint=build_dag(input_node=Ident, output_node=Out),
+            event_managers=[RecordingEvents],
+        )
+        for idx in range(2)
+    ]
+
+    RecordingEvents.queue_waits = []
+    Downstream.max_running = 0
+
+    results = await asyncio.gather(
+        *(chart.run(input_kwargs=dict(num=float(num))) for num in range(5) for chart in charts),
+    )
+
+    assert [result.value for result in results] == [num * 2.0 + 1 for num in range(5) for _ in charts]
+    assert Downstream.max_running == 2
+
+    assert {node_id for node_id, _ in RecordingEvents.queue_waits} == {get_node_id(Downstream)}
+    assert len(RecordingEvents.queue_waits) == 10
+    assert max(queue_wait for _, queue_wait in RecordingEvents.queue_waits) >= 0.03
+
+
+async def test_max_concurrency_is_capped_per_event_loop() -> None:
+    limiter = get_concurrency_limiter(Downstream)
+
+    async def get_other_limiter() -> ConcurrencyLimiter:
+        return get_concurrency_limiter(Downstream)
+
+    # A run in another event loop gets its own limiter and keeps the limiter of this loop in place
+    other_limiter = await asyncio.to_thread(asyncio.run, get_other_limiter())
+
+    assert other_limiter is not limiter
+    assert get_concurrency_limiter(Downstream) is limiter
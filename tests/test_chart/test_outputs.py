@@ -0,0 +1,76 @@
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+
+
+class Ident(ProcessorBase):
+    async def process(self, num: float) -> float:
+        return num
+
+
+class Score(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        return num * 10
+
+
+class Explanation(ProcessorBase):
+    def process(self, score: Input(Score)) -> str:
+        return f'score={score}'
+
+
+class Invert(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class SwitchNode(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> str:
+        return 'score' if num > 0 else 'invert'
+
+
+class Decision(ProcessorBase):
+    async def process(
+        self,
+        num: SwitchCase(switch=SwitchNode, cases=[('score', Score), ('invert', Invert)]),
+        explanation: Input(Explanation),
+    ) -> str:
+        return f'{num}, {explanation}'
+
+
+async def test_run_outputs(mocker: pytest_mock.MockerFixture) -> None:
+    dag = build_dag(input_node=Ident, output_node=Decision)
+    chart = PipelineChart(model_name='outputs', entrypoint=dag)
+
+    explanation_spy = mocker.spy(Explanation, 'process')
+    invert_spy = mocker.spy(Invert, 'process')
+
+    result = await chart.run(input_kwargs=dict(num=2.0), outputs=[Score])
+
+    assert result.error is None
+    assert result.value == {Score: 20.0}
+    assert explanation_spy.call_count == 0
+    assert invert_spy.call_count == 0
+
+    result = await chart.run(input_kwargs=dict(num=-2.0), outputs=[Explanation, Decision])
+
+    assert result.error is None
+    assert result.value == {Explanation: 'score=-20.0', Decision: '2.0, score=-20.0'}
+    assert (await chart.run(input_kwargs=dict(num=-2.0))).value == '2.0, score=-20.0'
+
+
+def test_outputs_dag_is_cached() -> None:
+    dag = build_dag(input_node=Ident, output_node=Decision)
+    outputs_dag = dag.with_outputs([get_node_id(Score), get_node_id(Invert)])
+
+    assert dag.with_outputs([get_node_id(Invert), get_node_id(Score)]) is outputs_dag
+    assert set(outputs_dag.graph) == {
+        get_node_id(Ident),
+        get_node_id(Score),
+        get_node_id(Invert),
+        outputs_dag.output_node,
+    }
@@ -0,0 +1,127 @@
+import typing as t
+
+import pytest
+import pytest_mock
+
+from ml_pipeline_engine.artifact_store.enums import DataFormat
+from ml_pipeline_engine.artifact_store.errors import ArtifactDoesNotExist
+from ml_pipeline_engine.artifact_store.store.base import SerializedArtifactStore
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag import DAGRunConcurrentManager
+from ml_pipeline_engine.dag import DAGRunDependencyManager
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.node import ProcessorBase
+from ml_pipeline_engine.node import get_node_id
+from ml_pipeline_engine.types import DAGRunManagerLike
+from ml_pipeline_engine.types import NodeId
+from ml_pipeline_engine.types import PipelineContextLike
+from ml_pipeline_engine.types import PipelineId
+from ml_pipeline_engine.types import PipelineResult
+
+
+class Features(ProcessorBase):
+    async def process(self, amount: float, country: str) -> t.Dict[str, t.Any]:
+        return dict(amount=amount, country=country)
+
+
+class Amount(ProcessorBase):
+    async def process(self, features: Input(Features)) -> float:
+        return features['amount']
+
+
+class Country(ProcessorBase):
+    async def process(self, features: Input(Features)) -> str:
+        return features['country']
+
+
+class CountryRisk(ProcessorBase):
+    def process(self, country: Input(Country)) -> float:
+        return 0.5 if country == 'XX' else 0.1
+
+
+class Score(ProcessorBase):
+    def process(self, amount: Input(Amount), risk: Input(CountryRisk)) -> float:
+        return amount * risk
+
+
+class MemoryArtifactStore(SerializedArtifactStore):
+    runs: t.ClassVar[t.Dict[PipelineId, t.Dict[NodeId, t.Any]]] = {}
+
+    def __init__(self, ctx: PipelineContextLike) -> None:
+        super().__init__(ctx)
+        self.results = self.runs.setdefault(ctx.pipeline_id, {})
+
+    async def save(self, node_id: NodeId, data: t.Any, fmt: DataFormat = None) -> None:  # noqa: ARG002
+        self.results[node_id] = data
+
+    async def load(self, node_id: NodeId) -> t.Any:
+        try:
+            return self.results[node_id]
+        except KeyError as ex:
+            raise ArtifactDoesNotExist(node_id) from ex
+
+
+class ReusedNodes:
+    reused_nodes: t.ClassVar[t.List[int]] = []
+
+    async def on_pipeline_complete(self, ctx: PipelineContextLike, result: PipelineResult) -> None:  # noqa: ARG002
+        self.reused_nodes.append(ctx.stats.reused_nodes)
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_rerun_reuses_unchanged_nodes(
+    mocker: pytest_mock.MockerFixture,
+    run_manager: t.Type[DAGRunManagerLike],
+) -> None:
+    dag = build_dag(input_node=Features, output_node=Score)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(
+        model_name='rerun',
+        entrypoint=dag,
+        artifact_store=MemoryArtifactStore,
+        event_managers=[ReusedNodes],
+    )
+    ReusedNodes.reused_nodes = []
+
+    result = await chart.run(input_kwargs=dict(amount=100.0, country='XX'))
+    assert result.value == 50.0
+
+    country_risk_spy = mocker.spy(CountryRisk, 'process')
+    score_spy = mocker.spy(Score, 'process')
+
+    rerun_result = await chart.rerun(result.pipeline_id, input_kwargs=dict(amount=200.0, country='XX'))
+
+    assert rerun_result.value == 100.0
+    assert country_risk_spy.call_count == 0
+    assert score_spy.call_count == 1
+    assert ReusedNodes.reused_nodes == [0, 1]
+
+    previous_results = MemoryArtifactStore.runs[rerun_result.pipeline_id]
+    rerun_result = await chart.rerun(previous_results, input_kwargs=dict(amount=200.0, country='YY'))
+
+    assert rerun_result.value == 20.0
+    assert country_risk_spy.call_count == 1
+    assert ReusedNodes.reused_nodes == [0, 1, 0]
+
+
+@pytest.mark.parametrize('run_manager', [DAGRunConcurrentManager, DAGRunDependencyManager])
+async def test_rerun_loads_only_comparable_results(
+    mocker: pytest_mock.MockerFixture,
+    run_manager: t.Type[DAGRunManagerLike],
+) -> None:
+    dag = build_dag(input_node=Features, output_node=Score)
+    dag.run_manager = run_manager
+
+    chart = PipelineChart(model_name='rerun', entrypoint=dag, artifact_store=MemoryArtifactStore)
+    result = await chart.run(input_kwargs=dict(amount=100.0, country='XX'))
+
+    load_spy = mocker.spy(MemoryArtifactStore, 'load')
+    rerun_result = await chart.rerun(result.pipeline_id, input_kwargs=dict(amount=200.0, country='YY'))
+
+    assert rerun_result.value == 20.0
+    # The results of CountryRisk and Score are not loaded, since the nodes have changed dependencies
+    assert sorted(load_call.args[1] for load_call in load_spy.call_args_list) == sorted(
+        [get_node_id(Features), get_node_id(Amount), get_node_id(Country)],
+    )
@@ -0,0 +1,73 @@
+import typing as t
+
+import pytest_mock
+
+from ml_pipeline_engine.chart import PipelineChart
+from ml_pipeline_engine.dag_builders.annotation import build_dag
+from ml_pipeline_engine.dag_builders.annotation.marks import Input
+from ml_pipeline_engine.dag_builders.annotation.marks import SwitchCase
+from ml_pipeline_engine.node import ProcessorBase
+
+
+class Ident(ProcessorBase):
+    def process(self, num: float) -> float:
+        return num
+
+
+class CheckPositive(ProcessorBase):
+    async def process(self, num: Input(Ident)) -> float:
+        if num < 0:
+            raise ValueError(num)
+
+        return num
+
+
+class Scale(ProcessorBase):
+    def process(self, num: Input(CheckPositive)) -> float:
+        return num * 10
+
+    def process_batch(self, num: t.List[float]) -> t.List[float]:
+        return [item * 10 for item in num]
+
+
+class Out(ProcessorBase):
+    def process(self, num: Input(Scale)) -> float:
+        return num + 1
+
+
+class Invert(ProcessorBase):
+    def process(self, num: Input(Ident)) -> float:
+        return -num
+
+
+class SwitchNode(ProcessorBase):
+    def process(self, num: Input(Ident)) -> str:
+        return 'scale' if num > 0 else 'invert'
+
+
+class SwitchOut(ProcessorBase):
+    def process(self, num: SwitchCase(switch=SwitchNode, cases=[('scale', Scale), ('invert', Invert)])) -> float:
+        return num
+
+
+async def test_run_batch(mocker: pytest_mock.MockerFixture) -> None:
+    chart = PipelineChart(model_name='run_batch', entrypoint=build_dag(input_node=Ident, output_node=Out))
+
+    process_spy = mocker.spy(Scale, 'process')
+    process_batch_spy = mocker.spy(Scale, 'process_batch')
+    results = await chart.run_batch([dict(num=1.0), dict(num=-1.0), dict(num=2.0)], pipeline_ids=['a', 'b', 'c'])
+
+    assert [result.pipeline_id for result in results] == ['a', 'b', 'c']
+    assert [result.value for result in results] == [11.0, None, 21.0]
+    assert [type(result.error) for result in results] == [type(None), ValueError, type(None)]
+
+    assert process_spy.call_count == 0
+    assert process_batch_spy.call_count == 1
+    assert process_batch_spy.call_args.kwargs == {'num': [1.0, 2.0]}
+
+
+async def test_run_batch_with_control_flow() -> None:
+    chart = PipelineChart(model_name='run_batch', entrypoint=build_dag(input_node=Ident, output_node=SwitchOut))
+    results = await chart.run_batch([dict(num=1.0), dict(num=-1.0)])
+
+    assert [(result.value, result.error) for result in results] == [(10.0, None), (1.0, None)]